@@ -27,6 +27,10 @@ app.conf.beat_schedule = {
         'task': 'internship.tasks.check_soutenance_status',
         'schedule': crontab(hour=1, minute=0),  # Run daily at 1:00 AM
     },
+    'archive-read-notifications': {
+        'task': 'internship.tasks.archive_read_notifications',
+        'schedule': crontab(hour=4, minute=0),  # Run daily at 4:00 AM
+    },
 }
 
 @app.task(bind=True, ignore_result=True)
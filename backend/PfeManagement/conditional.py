@@ -0,0 +1,67 @@
+"""
+Conditional GET for read-heavy endpoints.
+
+A view computes a cheap validator for the data behind a response, usually
+max(updated_at) and the row count of its (filtered) queryset in a single
+aggregate query, and hands it over with a callable building the response:
+
+    version = queryset_version(self.filter_queryset(Room.objects.all()))
+    return conditional_response(request, version, build, private=False)
+
+The response carries an ETag (and Last-Modified); a request whose
+If-None-Match still matches gets a 304 and nothing is queried or serialized
+beyond the aggregate. Anything the representation shows must be covered by
+the validator, including related rows (pass extra aggregates).
+
+Per-user data (private=True) is marked private and its ETag includes the
+user; data every user sees alike is public. Both are no-cache: clients and
+shared caches may store the response but must revalidate it on every use,
+so edits show up on the next poll.
+"""
+
+import hashlib
+from datetime import datetime
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def queryset_version(queryset, **aggregates):
+    """
+    max(updated_at) and row count of a queryset, plus any extra aggregates, in
+    one query. Aggregate names must not shadow a relation another one follows.
+    """
+    aggregates.setdefault('updated_at', Max('updated_at'))
+    aggregates.setdefault('count', Count('pk', distinct=True))
+    return queryset.order_by().aggregate(**aggregates)
+
+
+def compute_etag(request, version, private=True):
+    parts = [request.accepted_media_type, sorted(version.items())]
+    if private:
+        parts.append(request.user.pk)
+    return quote_etag(hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest())
+
+
+def last_modified(version):
+    """Newest of the datetimes in a version, as a timestamp"""
+    timestamps = [value.timestamp() for value in version.values() if isinstance(value, datetime)]
+    return int(max(timestamps)) if timestamps else None
+
+
+def conditional_response(request, version, build, private=True):
+    """304 when the client's copy matches `version`, else build()"""
+    etag = compute_etag(request, version, private)
+    modified = last_modified(version)
+    response = get_conditional_response(request, etag=etag, last_modified=modified)
+    if response is None:
+        response = build()
+    if response.status_code not in (200, 304):
+        return response
+    response.headers['ETag'] = etag
+    if modified is not None:
+        response.headers['Last-Modified'] = http_date(modified)
+    patch_cache_control(response, no_cache=True, **{'private' if private else 'public': True})
+    patch_vary_headers(response, ('Accept',))
+    return response
@@ -1,41 +1,54 @@
-from channels.db import database_sync_to_async
+from urllib.parse import parse_qs
+
 from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.models import TokenUser
 from rest_framework_simplejwt.tokens import AccessToken
-from django.contrib.auth import get_user_model
-from django.db import close_old_connections
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.settings import api_settings
+
+
+class WebsocketUser(TokenUser):
+    """TokenUser whose id is an int, like User.id (simplejwt stores it as a string claim)"""
+
+    @cached_property
+    def id(self):
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def pk(self):
+        return self.id
 
-User = get_user_model()
 
-@database_sync_to_async
-def get_user(token_key):
+def get_token_user(token_key):
+    """
+    Validate the access token and build a user from its claims
+    (user_id, username, email, role_id, role_name, see User.get_token)
+    without touching the database.
+    """
+    if not token_key or token_key == 'null' or token_key == 'undefined':
+        return AnonymousUser()
     try:
-        if not token_key or token_key == 'null' or token_key == 'undefined':
-            return AnonymousUser()
-            
-        token = AccessToken(token_key)
-        user_id = token['user_id']
-        user = User.objects.get(id=user_id)
+        user = WebsocketUser(AccessToken(token_key))
+        user.id  # Fail now on a token without a valid user id claim
         return user
-    except Exception:
+    except (TokenError, KeyError, ValueError):
         return AnonymousUser()
 
+
 class JwtAuthMiddleware:
+    """
+    Authenticates websocket connections from the ?token= access token.
+    scope['user'] is a TokenUser built from the JWT claims, consumers
+    never load the User row.
+    """
+
     def __init__(self, app):
         self.app = app
 
     async def __call__(self, scope, receive, send):
-        close_old_connections()
-        try:
-            # Parse query string for token
-            query_string = scope['query_string'].decode()
-            query_params = dict(qs.split('=') for qs in query_string.split('&') if '=' in qs)
-            token = query_params.get('token')
-            
-            if token:
-                scope['user'] = await get_user(token)
-            else:
-                scope['user'] = AnonymousUser()
-        except Exception:
-            scope['user'] = AnonymousUser()
-            
+        query_params = parse_qs(scope.get('query_string', b'').decode())
+        token = query_params.get('token', [None])[0]
+        scope['user'] = get_token_user(token)
+
         return await self.app(scope, receive, send)
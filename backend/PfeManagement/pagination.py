@@ -0,0 +1,93 @@
+"""
+Pagination, filtering and sorting shared by the list endpoints.
+
+Lists are cursor (keyset) paginated by default: a page costs the same
+whatever its position. Clients that need page numbers can pass ?limit= and
+?offset= instead. Each view declares what can be filtered and sorted:
+
+    filter_params = {'status': 'status'}        # ?status=1 -> .filter(status=1)
+    search_fields = ['title', 'description']    # ?search=django
+    ordering_fields = ['created_at', 'title']   # ?ordering=-title
+    ordering = ('-created_at', '-id')           # default, must match an index
+
+APIViews use FilteredListMixin.list_response(); generic views get the same
+behaviour from pagination_class and filter_backends. Hot read-only lists
+can swap their serializer for a values projection (see projections).
+"""
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter, SearchFilter
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class ListOffsetPagination(LimitOffsetPagination):
+    default_limit = PAGE_SIZE
+    max_limit = MAX_PAGE_SIZE
+
+
+class ListPagination(CursorPagination):
+    """Cursor pagination, or limit/offset when the request asks for it"""
+    page_size = PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+    ordering = ('-created_at', '-id')
+    offset_pagination_class = ListOffsetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.offset_pagination = None
+        if 'limit' in request.query_params or 'offset' in request.query_params:
+            self.offset_pagination = self.offset_pagination_class()
+            return self.offset_pagination.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.offset_pagination is not None:
+            return self.offset_pagination.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class FieldFilterBackend(BaseFilterBackend):
+    """Exact filters declared on the view as filter_params = {query param: model lookup}"""
+
+    def filter_queryset(self, request, queryset, view):
+        for param, lookup in getattr(view, 'filter_params', {}).items():
+            value = request.query_params.get(param)
+            if value in (None, ''):
+                continue
+            try:
+                queryset = queryset.filter(**{lookup: value})
+            except (ValueError, DjangoValidationError):
+                raise ValidationError({param: f"Invalid value '{value}'."})
+        return queryset
+
+
+class StableOrderingFilter(OrderingFilter):
+    """?ordering= on the view's ordering_fields, with the primary key as tie-breaker"""
+
+    def get_ordering(self, request, queryset, view):
+        ordering = list(super().get_ordering(request, queryset, view) or ())
+        if ordering and not {'id', '-id', 'pk', '-pk'} & set(ordering):
+            ordering.append('-id' if ordering[0].startswith('-') else 'id')
+        return tuple(ordering)
+
+
+class FilteredListMixin:
+    """For APIView subclasses of GenericAPIView that build their queryset in get()"""
+    pagination_class = ListPagination
+    filter_backends = [FieldFilterBackend, SearchFilter, StableOrderingFilter]
+    filter_params = {}
+    ordering = ('-created_at', '-id')
+
+    def list_response(self, queryset, serializer_class, **serializer_kwargs):
+        page = self.paginate_queryset(self.filter_queryset(queryset))
+        serializer = serializer_class(page, many=True, **serializer_kwargs)
+        return self.get_paginated_response(serializer.data)
+
+    def projected_list_response(self, queryset, projection):
+        """list_response() with a ValuesProjection in place of the serializer"""
+        page = self.paginate_queryset(projection.project(self.filter_queryset(queryset)))
+        return self.get_paginated_response(projection.render(page))
@@ -0,0 +1,158 @@
+"""
+SQL profiling per request, for development and staging.
+
+QueryProfilerMiddleware (enabled with QUERY_PROFILER=True, see settings)
+records the SQL queries of every request: their number, total database
+time and the query fingerprints that ran more than once (usually an N+1).
+They are sent back as Server-Timing headers (visible in the browser's
+network panel) and logged as one JSON line per request.
+
+Every URL name has a query budget, settings.QUERY_BUDGETS or else
+settings.QUERY_BUDGET_DEFAULT. A request over budget is logged, or fails
+with QueryBudgetExceeded when settings.QUERY_BUDGET_ACTION is 'raise'.
+Tests use assert_query_budget() to hold routes to the same budgets.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_BUDGET = 20
+# Duplicated fingerprints reported per request
+MAX_REPORTED_DUPLICATES = 5
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def fingerprint(sql):
+    """SQL with IN lists of any length collapsed, so N+1 queries share one fingerprint"""
+    sql = re.sub(r'IN \((?:%s, )*%s\)', 'IN (...)', sql)
+    return re.sub(r'\s+', ' ', sql).strip()
+
+
+class QueryProfile:
+    """Database execute wrapper recording the fingerprint and duration of each query"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((fingerprint(sql), time.perf_counter() - start))
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        return sum(duration for _, duration in self.queries)
+
+    def duplicates(self):
+        """{fingerprint: times run} of the queries run more than once, most repeated first"""
+        counts = Counter(sql for sql, _ in self.queries)
+        return {sql: count for sql, count in counts.most_common() if count > 1}
+
+
+@contextmanager
+def profile_queries():
+    """Record the queries run on every database connection of this thread"""
+    profile = QueryProfile()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(profile))
+        yield profile
+
+
+def query_budget(view_name):
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    return budgets.get(view_name, getattr(settings, 'QUERY_BUDGET_DEFAULT', DEFAULT_QUERY_BUDGET))
+
+
+def check_query_budget(view_name, profile, action=None):
+    """Log (or raise, with action='raise') when a request ran more queries than its budget"""
+    budget = query_budget(view_name)
+    if budget is None or profile.count <= budget:
+        return
+    message = f"{view_name} ran {profile.count} SQL queries, over its budget of {budget}"
+    duplicates = profile.duplicates()
+    if duplicates:
+        sql, count = next(iter(duplicates.items()))
+        message += f" (most repeated, {count} times: {sql})"
+    if (action or getattr(settings, 'QUERY_BUDGET_ACTION', 'log')) == 'raise':
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+class QueryProfilerMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with profile_queries() as profile:
+            response = self.get_response(request)
+        total = time.perf_counter() - start
+
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else None
+        duplicates = profile.duplicates()
+
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={profile.duration * 1000:.1f};desc="{profile.count} queries"',
+            f'dup;desc="{sum(duplicates.values())} duplicated queries"',
+            f'total;dur={total * 1000:.1f}',
+        ])
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'view': view_name,
+            'status': response.status_code,
+            'queries': profile.count,
+            'db_ms': round(profile.duration * 1000, 1),
+            'total_ms': round(total * 1000, 1),
+            'duplicates': [
+                {'sql': sql, 'count': count}
+                for sql, count in list(duplicates.items())[:MAX_REPORTED_DUPLICATES]
+            ],
+        }))
+
+        if view_name:
+            check_query_budget(view_name, profile)
+        return response
+
+
+def iter_routes(patterns=None, prefix='', namespace=None):
+    """Yield (view_name, route, URLPattern) for every named route of the URLconf"""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            inner = ':'.join(filter(None, [namespace, pattern.namespace])) or None
+            yield from iter_routes(pattern.url_patterns, prefix + str(pattern.pattern), inner)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            view_name = f"{namespace}:{pattern.name}" if namespace else pattern.name
+            yield view_name, prefix + str(pattern.pattern), pattern
+
+
+def assert_query_budget(client, view_name, kwargs=None, method='get', **extra):
+    """Request a route with a test client, failing with QueryBudgetExceeded if it goes over budget"""
+    url = reverse(view_name, kwargs=kwargs)
+    with profile_queries() as profile:
+        response = getattr(client, method)(url, **extra)
+    check_query_budget(view_name, profile, action='raise')
+    return response
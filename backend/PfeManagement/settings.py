@@ -65,6 +65,10 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'PfeManagement.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 SWAGGER_SETTINGS = {
     'SECURITY_DEFINITIONS': {
@@ -106,6 +110,18 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
 ]
+
+# SQL profiling per request (dev/staging only): Server-Timing headers, logs and query budgets
+if os.getenv('QUERY_PROFILER', 'False') == 'True':
+    MIDDLEWARE.insert(0, 'PfeManagement.profiling.QueryProfilerMiddleware')
+QUERY_BUDGET_DEFAULT = 20
+QUERY_BUDGETS = {
+    # A fixed set of monthly counts, not per-row queries
+    'admin-statistics': 50,
+}
+# 'log' or 'raise'
+QUERY_BUDGET_ACTION = os.getenv('QUERY_BUDGET_ACTION', 'log')
+
 CORS_ORIGIN_WHITELIST = [
     'http://localhost:3000/',
     # other origins...
@@ -140,6 +156,20 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Cache (unread notification counters); a Redis outage degrades to database counts.
+# Its Redis also holds websocket presence (internship.presence): run it with
+# maxmemory-policy noeviction, an evicted presence key drops live pushes
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': os.getenv('REDIS_CACHE_URL', 'redis://localhost:6379/1'),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'IGNORE_EXCEPTIONS': True,
+        },
+    },
+}
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
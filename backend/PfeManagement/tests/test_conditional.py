@@ -0,0 +1,110 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authentication.models import Role
+from internship.models import InternshipApplication, InternshipOffer, Room
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+
+
+def make_user(username, role):
+    return User.objects.create_user(
+        username=username, email=f"{username}@example.com", password="password",
+        role=Role.objects.get_or_create(name=role)[0]
+    )
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def student():
+    return make_user("etag_student", "Student")
+
+
+@pytest.fixture
+def offer():
+    company = make_user("etag_company", "Company")
+    return InternshipOffer.objects.create(
+        company=company, title="Backend", description="Django",
+        start_date="2025-02-01", end_date="2025-06-30", status=1
+    )
+
+
+def test_browse_offers_not_modified_until_data_changes(student, offer):
+    client = client_for(student)
+    url = reverse("browse-offers")
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first["Cache-Control"] == "no-cache, private"
+    assert first["Last-Modified"]
+
+    with CaptureQueriesContext(connection) as queries:
+        cached = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert cached.status_code == 304
+    assert cached["ETag"] == first["ETag"]
+    assert len(queries) == 1  # the aggregate, no list query
+
+    # Other filters, other users and new applications get their own ETag
+    assert client.get(url, {"type": "PFE"}, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
+    other = client_for(make_user("etag_other", "Student"))
+    assert other.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
+    InternshipApplication.objects.create(offer=offer, student=student)
+    applied = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert applied.status_code == 200
+    assert applied.data["results"][0]["has_applied"] is True
+
+    offer.title = "Backend developer"
+    offer.save()
+    edited = client.get(url, HTTP_IF_NONE_MATCH=applied["ETag"])
+    assert edited.status_code == 200
+    assert edited.data["results"][0]["title"] == "Backend developer"
+
+
+def test_shared_lists_are_public_and_revalidated(student):
+    room = Room.objects.create(name="A1", capacity=30)
+    make_user("etag_teacher", "Teacher")
+    client = client_for(student)
+
+    for name in ("list-rooms", "list-teachers"):
+        first = client.get(reverse(name))
+        assert first.status_code == 200
+        assert first["Cache-Control"] == "no-cache, public"
+        assert client.get(reverse(name), HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+
+    first = client.get(reverse("list-rooms"))
+    room.capacity = 40
+    room.save()
+    assert client.get(reverse("list-rooms"), HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
+
+
+def test_report_detail_not_modified_until_a_version_changes(student):
+    from internship.models import Internship
+    from report.models import Report, ReportVersion
+
+    internship = Internship.objects.create(
+        student_id=student, type="PFE", company_name="Acme", start_date="2025-02-01", end_date="2025-06-30"
+    )
+    report = Report.objects.create(internship=internship, student=student, title="Report")
+    ReportVersion.objects.create(report=report, version_number=1, file="reports/versions/v1.pdf", file_size=1000)
+    client = client_for(student)
+    url = reverse("get-report-detail", args=[report.id])
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first["Cache-Control"] == "no-cache, private"
+    assert client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+
+    ReportVersion.objects.create(report=report, version_number=2, file="reports/versions/v2.pdf", file_size=1000)
+    second = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert second.status_code == 200
+    assert second.data["total_versions"] == 2
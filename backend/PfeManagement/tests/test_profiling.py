@@ -0,0 +1,97 @@
+import logging
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from authentication.models import Role
+from internship.models import Internship, InternshipApplication, InternshipOffer, Notification
+from PfeManagement.profiling import (
+    QueryBudgetExceeded, assert_query_budget, check_query_budget, fingerprint, iter_routes, profile_queries
+)
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+ROLES = ["Student", "Teacher", "Company", "Administrator"]
+# Framework routes, not ours to budget
+SKIPPED_PREFIXES = ("admin/", "swagger", "redoc", "^media")
+
+
+@pytest.fixture
+def users():
+    return {
+        name: User.objects.create_user(
+            username=f"budget_{name.lower()}", email=f"budget_{name.lower()}@example.com",
+            password="password", role=Role.objects.get_or_create(name=name)[0]
+        )
+        for name in ROLES
+    }
+
+
+@pytest.fixture
+def dataset(users):
+    """A few rows behind every list, so per-row queries show up"""
+    student, teacher, company = users["Student"], users["Teacher"], users["Company"]
+    for i in range(5):
+        offer = InternshipOffer.objects.create(
+            company=company, title=f"Offer {i}", description="Work",
+            start_date="2025-02-01", end_date="2025-06-30", status=1 if i % 2 else 0
+        )
+        InternshipApplication.objects.create(offer=offer, student=student, status=1)
+        Internship.objects.create(
+            student_id=student, teacher_id=teacher, type="PFE", company_name="Acme",
+            title=f"Internship {i}", start_date="2025-02-01", end_date="2025-06-30"
+        )
+        Notification.objects.create(recipient=student, message=f"Message {i}")
+
+
+def route_kwargs(pattern):
+    return {name: 1 if converter.regex == "[0-9]+" else "x"
+            for name, converter in pattern.pattern.converters.items()}
+
+
+def test_fingerprint_collapses_in_lists():
+    assert fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s)") == fingerprint(
+        "SELECT * FROM t WHERE id IN (%s)"
+    )
+
+
+def test_duplicates_are_counted_by_fingerprint(users):
+    with profile_queries() as profile:
+        for user in users.values():
+            User.objects.get(pk=user.pk)
+    assert list(profile.duplicates().values()) == [len(users)]
+
+
+@override_settings(QUERY_BUDGETS={"get-user": 0})
+def test_over_budget_is_logged_or_raised(users, caplog):
+    with profile_queries() as profile:
+        User.objects.count()
+    with caplog.at_level(logging.WARNING, logger="PfeManagement.profiling"):
+        check_query_budget("get-user", profile, action="log")
+    assert "over its budget of 0" in caplog.text
+    with pytest.raises(QueryBudgetExceeded):
+        check_query_budget("get-user", profile, action="raise")
+
+
+@override_settings(MIDDLEWARE=["PfeManagement.profiling.QueryProfilerMiddleware"])
+def test_middleware_sends_server_timing(users):
+    client = APIClient()
+    client.force_authenticate(user=users["Student"])
+    response = client.get(reverse("get-user"))
+    assert response["Server-Timing"].startswith("db;dur=")
+    assert "queries" in response["Server-Timing"]
+
+
+@pytest.mark.parametrize("role", ROLES)
+def test_every_route_stays_within_its_query_budget(users, dataset, role):
+    client = APIClient()
+    client.force_authenticate(user=users[role])
+    for view_name, route, pattern in iter_routes():
+        view_class = getattr(pattern.callback, "view_class", None)
+        if route.startswith(SKIPPED_PREFIXES) or view_class is None or not hasattr(view_class, "get"):
+            continue
+        assert_query_budget(client, view_name, route_kwargs(pattern))
@@ -0,0 +1,32 @@
+import datetime
+import decimal
+import json
+import uuid
+
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from PfeManagement.renderers import ORJSONRenderer
+
+
+def test_orjson_renderer_matches_drf_json_renderer():
+    data = {
+        "text": "Projet de Fin d'Études",
+        "lazy": gettext_lazy("Pending"),
+        "aware": timezone.now(),
+        "naive": datetime.datetime(2025, 2, 1, 9, 30, 15, 123456),
+        "date": datetime.date(2025, 2, 1),
+        "time": datetime.time(9, 30),
+        "duration": datetime.timedelta(minutes=90),
+        "decimal": decimal.Decimal("85.50"),
+        "uuid": uuid.uuid4(),
+        "nested": [{"id": 1, "ids": (1, 2)}, None, True],
+        1: "integer key",
+    }
+    expected = json.loads(JSONRenderer().render(data))
+    assert json.loads(ORJSONRenderer().render(data)) == expected
+
+
+def test_orjson_renderer_renders_nothing_for_none():
+    assert ORJSONRenderer().render(None) == b""
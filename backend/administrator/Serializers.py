@@ -167,4 +167,16 @@ class ChangePasswordSerializer(serializers.Serializer):
         return attrs
     
     class Meta:
-        ref_name = "AdminChangePasswordSerializer"
\ No newline at end of file
+        ref_name = "AdminChangePasswordSerializer"
+class AnnouncementSerializer(serializers.Serializer):
+    """Announcement broadcast to a role, to the applicants of an offer or to a soutenance jury"""
+    message = serializers.CharField()
+    role = serializers.SlugRelatedField(slug_field='name', queryset=Role.objects.all(), required=False)
+    offer_id = serializers.IntegerField(required=False)
+    soutenance_id = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        targets = [field for field in ('role', 'offer_id', 'soutenance_id') if attrs.get(field) is not None]
+        if len(targets) != 1:
+            raise serializers.ValidationError("Provide exactly one of role, offer_id or soutenance_id.")
+        return attrs
@@ -0,0 +1,45 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+
+from administrator.Serializers import AnnouncementSerializer
+from internship.notifications import announce_to_offer_applicants, announce_to_role, announce_to_soutenance_jury
+
+
+class BroadcastAnnouncementView(APIView):
+    """Send one announcement to a whole audience (role, offer applicants or soutenance jury)"""
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=AnnouncementSerializer,
+        responses={
+            201: 'Number of users notified',
+            400: 'Bad Request',
+            403: 'Forbidden'
+        }
+    )
+    def post(self, request):
+        # Check if user is admin
+        if not request.user.role or request.user.role.name != 'Administrator':
+            return Response({
+                'error': 'Only administrators can send announcements.'
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = AnnouncementSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        data = serializer.validated_data
+        if data.get('role'):
+            notifications = announce_to_role(data['role'].name, data['message'])
+        elif data.get('offer_id') is not None:
+            notifications = announce_to_offer_applicants(data['offer_id'], data['message'])
+        else:
+            notifications = announce_to_soutenance_jury(data['soutenance_id'], data['message'])
+
+        return Response({
+            'message': 'Announcement sent successfully.',
+            'recipients': len(notifications)
+        }, status=status.HTTP_201_CREATED)
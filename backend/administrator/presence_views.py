@@ -0,0 +1,37 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+
+from authentication.models import Role
+from internship.presence import online_counts_by_role
+
+
+class OnlineUsersView(APIView):
+    """Users with an open notification socket, per role"""
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={
+            200: 'Online users per role and in total',
+            403: 'Forbidden',
+            503: 'Presence unavailable'
+        }
+    )
+    def get(self, request):
+        # Check if user is admin
+        if not request.user.role or request.user.role.name != 'Administrator':
+            return Response({
+                'error': 'Only administrators can view online users.'
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        counts = online_counts_by_role(list(Role.objects.values_list('name', flat=True)))
+        if counts is None:
+            return Response({
+                'error': 'Presence is unavailable right now.'
+            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response({
+            'online_by_role': counts,
+            'total_online': sum(counts.values())
+        }, status=status.HTTP_200_OK)
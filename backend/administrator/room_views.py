@@ -1,5 +1,6 @@
 from rest_framework import status
 from rest_framework.views import APIView
+from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_yasg.utils import swagger_auto_schema
@@ -8,19 +9,27 @@ from django.shortcuts import get_object_or_404
 
 from internship.models import Room
 from internship.serializers import RoomSerializer
+from PfeManagement.conditional import conditional_response, queryset_version
+from PfeManagement.pagination import FilteredListMixin
 
 
-class ListRoomsView(APIView):
+class ListRoomsView(FilteredListMixin, GenericAPIView):
     """List all rooms"""
     permission_classes = [IsAuthenticated]
+    filter_params = {'building': 'building', 'is_available': 'is_available'}
+    search_fields = ['name', 'building']
+    ordering_fields = ['name', 'capacity']
+    ordering = ('name',)
 
     @swagger_auto_schema(
         responses={200: RoomSerializer(many=True)}
     )
     def get(self, request):
         rooms = Room.objects.all()
-        serializer = RoomSerializer(rooms, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        version = queryset_version(self.filter_queryset(rooms))
+        return conditional_response(
+            request, version, lambda: self.list_response(rooms, RoomSerializer), private=False
+        )
 
 
 class CreateRoomView(APIView):
@@ -0,0 +1,111 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from django.shortcuts import get_object_or_404
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from datetime import timedelta
+
+from internship.models import ScrapeRun, ScrapeSource
+from internship.serializers import ScrapeRunSerializer, ScrapeSourceSerializer
+
+
+class ScraperHealthView(APIView):
+    """Scraper source health, recent runs and daily trends"""
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                'days',
+                openapi.IN_QUERY,
+                description="Trend window in days (default 30)",
+                type=openapi.TYPE_INTEGER
+            )
+        ],
+        responses={
+            200: 'Sources, recent runs and daily trends per source',
+            403: 'Forbidden'
+        }
+    )
+    def get(self, request):
+        # Check if user is admin
+        if not request.user.role or request.user.role.name != 'Administrator':
+            return Response({
+                'error': 'Only administrators can view scraper health.'
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            days = int(request.query_params.get('days', 30))
+        except ValueError:
+            days = 30
+
+        runs = ScrapeRun.objects.filter(started_at__gte=timezone.now() - timedelta(days=days))
+
+        trends = runs.annotate(day=TruncDate('started_at')).values('day', 'source').annotate(
+            runs=Count('id'),
+            failed_runs=Count('id', filter=Q(succeeded=False)),
+            pages_fetched=Sum('pages_fetched'),
+            bytes_fetched=Sum('bytes_fetched'),
+            fetch_errors=Sum('fetch_errors'),
+            parse_failures=Sum('parse_failures'),
+            items_created=Sum('items_created'),
+            duplicates_skipped=Sum('duplicates_skipped'),
+            latency_p50_ms=Avg('latency_p50_ms'),
+            latency_p95_ms=Avg('latency_p95_ms'),
+        ).order_by('day', 'source')
+
+        return Response({
+            'sources': ScrapeSourceSerializer(ScrapeSource.objects.all(), many=True).data,
+            'recent_runs': ScrapeRunSerializer(runs[:20], many=True).data,
+            'trends': list(trends),
+        }, status=status.HTTP_200_OK)
+
+
+class UpdateScrapeSourceView(APIView):
+    """Enable or disable a scraper source"""
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                'id',
+                openapi.IN_PATH,
+                description="Scrape source ID",
+                type=openapi.TYPE_INTEGER
+            )
+        ],
+        request_body=ScrapeSourceSerializer,
+        responses={
+            200: ScrapeSourceSerializer,
+            400: 'Bad Request',
+            403: 'Forbidden',
+            404: 'Not Found'
+        }
+    )
+    def patch(self, request, id):
+        # Check if user is admin
+        if not request.user.role or request.user.role.name != 'Administrator':
+            return Response({
+                'error': 'Only administrators can update scraper sources.'
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        source = get_object_or_404(ScrapeSource, id=id)
+        serializer = ScrapeSourceSerializer(source, data=request.data, partial=True)
+
+        if serializer.is_valid():
+            if serializer.validated_data.get('is_enabled'):
+                # Re-enabling gives the source a fresh failure budget
+                serializer.save(consecutive_failures=0, disabled_at=None)
+            else:
+                serializer.save()
+            return Response({
+                'message': 'Scraper source updated successfully.',
+                'data': serializer.data
+            }, status=status.HTTP_200_OK)
+
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
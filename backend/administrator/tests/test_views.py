@@ -195,3 +195,73 @@ def test_get_user_stats(api_client, admin_user):
     assert "active_users" in response.data
     assert "inactive_users" in response.data
     assert "users_by_role" in response.data
+
+
+# ScraperHealthView
+def test_scraper_health_admin(api_client, admin_user):
+    from internship.models import ScrapeSource
+    ScrapeSource.objects.create(name="Tanitjobs")
+    api_client.force_authenticate(user=admin_user)
+    url = reverse("scraper-health")
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["sources"][0]["name"] == "Tanitjobs"
+    assert "recent_runs" in response.data
+    assert "trends" in response.data
+
+
+def test_scraper_health_non_admin(api_client, regular_user):
+    api_client.force_authenticate(user=regular_user)
+    url = reverse("scraper-health")
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# UpdateScrapeSourceView
+def test_reenable_scrape_source_resets_failures(api_client, admin_user):
+    from internship.models import ScrapeSource
+    source = ScrapeSource.objects.create(name="Keejob", is_enabled=False, consecutive_failures=3)
+    api_client.force_authenticate(user=admin_user)
+    url = reverse("update-scrape-source", args=[source.id])
+    response = api_client.patch(url, {"is_enabled": True}, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    source.refresh_from_db()
+    assert source.is_enabled
+    assert source.consecutive_failures == 0
+
+
+# BroadcastAnnouncementView
+def test_broadcast_announcement_to_role(api_client, admin_user, regular_user):
+    from internship.models import Notification
+    regular_user.role = Role.objects.create(name="Coordinator")
+    regular_user.save()
+    api_client.force_authenticate(user=admin_user)
+    url = reverse("broadcast-announcement")
+    response = api_client.post(url, {"role": "Coordinator", "message": "Juries are due Friday"}, format="json")
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["recipients"] == 1
+    assert Notification.objects.get().recipient == regular_user
+
+
+def test_broadcast_announcement_needs_one_target(api_client, admin_user):
+    api_client.force_authenticate(user=admin_user)
+    url = reverse("broadcast-announcement")
+    response = api_client.post(url, {"role": "Administrator", "offer_id": 1, "message": "Hi"}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+# OnlineUsersView
+def test_online_users_by_role(api_client, admin_user, monkeypatch):
+    import fakeredis
+    from internship import presence
+    from internship.presence import mark_online
+    redis = fakeredis.FakeRedis()
+    monkeypatch.setattr(presence, "get_redis_connection", lambda alias="default": redis)
+    mark_online(admin_user.id, "Administrator", "channel-1")
+    mark_online(admin_user.id, "Administrator", "channel-2")
+    api_client.force_authenticate(user=admin_user)
+    url = reverse("online-users")
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["online_by_role"]["Administrator"] == 1
+    assert response.data["total_online"] == 1
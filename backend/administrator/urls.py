@@ -17,6 +17,9 @@ from .room_views import (
     GetAvailableRoomsView,
 )
 from .stats_views import AdminStatisticsView
+from .scraper_views import ScraperHealthView, UpdateScrapeSourceView
+from .announcement_views import BroadcastAnnouncementView
+from .presence_views import OnlineUsersView
 
 urlpatterns = [
     path('users/', ListUsersView.as_view(), name='list-users'),
@@ -37,4 +40,14 @@ urlpatterns = [
     
     # Statistics
     path('statistics/', AdminStatisticsView.as_view(), name='admin-statistics'),
+    
+    # Scraper Health
+    path('scraper/health/', ScraperHealthView.as_view(), name='scraper-health'),
+    path('scraper/sources/<int:id>/', UpdateScrapeSourceView.as_view(), name='update-scrape-source'),
+    
+    # Announcements
+    path('announcements/', BroadcastAnnouncementView.as_view(), name='broadcast-announcement'),
+    
+    # Presence
+    path('presence/', OnlineUsersView.as_view(), name='online-users'),
 ]
\ No newline at end of file
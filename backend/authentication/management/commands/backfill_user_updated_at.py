@@ -0,0 +1,18 @@
+"""
+Management command to date users created before User.updated_at existed, so
+the conditional GETs validated by it see every row
+Usage: python manage.py backfill_user_updated_at
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from authentication.models import User
+
+
+class Command(BaseCommand):
+    help = 'Set updated_at to date_joined for users that have none'
+
+    def handle(self, *args, **options):
+        updated = User.objects.filter(updated_at__isnull=True).update(updated_at=F('date_joined'))
+        self.stdout.write(self.style.SUCCESS(f"{updated} users updated"))
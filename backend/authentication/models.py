@@ -22,9 +22,28 @@ class User(AbstractUser):
     activation_token_created = models.DateTimeField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
     last_login_time = models.DateTimeField(blank=True, null=True)
+    # Users created before this column are dated by `python manage.py backfill_user_updated_at`
+    updated_at = models.DateTimeField(auto_now=True, null=True)
+
+    class Meta:
+        indexes = [
+            # deactivate_inactive_users, only accounts it can still deactivate
+            models.Index(
+                fields=['last_login_time'], condition=models.Q(is_enabled=True, is_active=True),
+                name='user_enabled_last_login_idx'
+            ),
+        ]
   
     def __str__(self):
         return self.username
+
+    def save(self, *args, **kwargs):
+        # auto_now is only applied to the fields being saved; conditional GETs of
+        # user lists are validated by updated_at, so every save must bump it
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'updated_at' not in update_fields:
+            kwargs['update_fields'] = list(update_fields) + ['updated_at']
+        super().save(*args, **kwargs)
     
     def get_token(self):
         token = RefreshToken.for_user(self)
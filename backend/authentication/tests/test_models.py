@@ -1,4 +1,7 @@
 
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 from authentication.models import User, Role
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -62,6 +65,21 @@ class UserModelTest(TestCase):
         self.assertNotEqual(self.user.password, "testpass123")
         self.assertTrue(self.user.check_password("testpass123"))
     
+    def test_partial_save_bumps_updated_at(self):
+        """Test that saving only some fields still refreshes updated_at"""
+        User.objects.filter(pk=self.user.pk).update(updated_at=None)
+        self.user.is_enabled = True
+        self.user.save(update_fields=['is_enabled'])
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.updated_at)
+
+    def test_backfill_user_updated_at(self):
+        """Test that the backfill command dates users that were never saved with updated_at"""
+        User.objects.filter(pk=self.user.pk).update(updated_at=None)
+        call_command('backfill_user_updated_at', stdout=StringIO())
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.updated_at, self.user.date_joined)
+
     def test_user_without_role(self):
         """Test that a user can be created without a role"""
         user_no_role = User.objects.create_user(
@@ -0,0 +1,208 @@
+"""
+EXPLAIN plans and timings of the hot filters, without and with their indexes.
+
+Builds a throwaway test database (SQLite by default, PostgreSQL when
+DATABASE_ENGINE and friends point at one) and seeds it at a realistic shape:
+most offers approved, most soutenances done, most notifications read, a few
+pending report versions. The hot-filter indexes declared in Meta.indexes are
+then dropped, each query is explained and timed, the indexes are created
+again and everything runs a second time.
+
+Usage (from the backend directory):
+    python benchmarks/index_plans.py --scale 1 --repeat 20
+    DATABASE_ENGINE=django.db.backends.postgresql DATABASE_NAME=pfe ... python benchmarks/index_plans.py
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'PfeManagement.settings')
+os.environ.setdefault('DJANGO_SECRET_KEY', 'benchmark-only-secret-key-of-at-least-32-bytes')
+os.environ.setdefault('DATABASE_ENGINE', 'django.db.backends.sqlite3')
+os.environ.setdefault('DATABASE_NAME', ':memory:')
+
+import django
+
+# (app label, model, index name) of the indexes being compared
+INDEXES = [
+    ('internship', 'Internship', 'internship_status_idx'),
+    ('internship', 'InternshipOffer', 'offer_status_created_idx'),
+    ('internship', 'Notification', 'notification_feed_idx'),
+    ('internship', 'Soutenance', 'soutenance_planned_idx'),
+    ('report', 'ReportVersion', 'report_version_pending_idx'),
+    ('authentication', 'User', 'user_enabled_last_login_idx'),
+]
+
+
+def seed(scale, rng):
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+    from authentication.models import Role
+    from internship.models import Internship, InternshipApplication, InternshipOffer, Notification, Soutenance
+    from report.models import Report, ReportVersion
+
+    User = get_user_model()
+    now = timezone.now()
+    roles = {name: Role.objects.get_or_create(name=name)[0] for name in ('Student', 'Teacher', 'Company')}
+
+    def user(role, i):
+        last_login = None if rng.random() < 0.1 else now - timedelta(days=rng.randint(0, 700))
+        # deactivate_inactive_users runs daily: accounts idle for six months are already disabled
+        enabled = last_login is not None and last_login > now - timedelta(days=rng.randint(175, 181))
+        return User(
+            username=f"{role.lower()}_{i}", email=f"{role.lower()}_{i}@example.com", password='!',
+            role=roles[role], is_enabled=enabled, last_login_time=last_login,
+            date_joined=now - timedelta(days=rng.randint(200, 1500))
+        )
+
+    def volume(count):
+        return max(1, round(count * scale))
+
+    def users(role, count):
+        User.objects.bulk_create([user(role, i) for i in range(count)], batch_size=1000)
+        return list(User.objects.filter(role=roles[role]).values_list('id', flat=True))
+
+    students, teachers, companies = users('Student', volume(5000)), users('Teacher', volume(200)), users('Company', volume(300))
+
+    InternshipOffer.objects.bulk_create([
+        InternshipOffer(
+            company_id=rng.choice(companies), title=f"Offer {i}", description="Work", start_date='2025-02-01',
+            end_date='2025-07-31', status=rng.choices((0, 1, 2, 3), (5, 70, 5, 20))[0]
+        )
+        for i in range(volume(3000))
+    ], batch_size=1000)
+    offers = list(InternshipOffer.objects.values_list('id', flat=True))
+    pairs = {(rng.choice(offers), rng.choice(students)) for _ in range(volume(30000))}
+    InternshipApplication.objects.bulk_create([
+        InternshipApplication(offer_id=offer, student_id=student, status=rng.choices((0, 1, 2, 3), (30, 20, 10, 40))[0])
+        for offer, student in pairs
+    ], batch_size=1000)
+
+    Internship.objects.bulk_create([
+        Internship(
+            student_id_id=student, teacher_id_id=rng.choice(teachers), type='PFE', company_name='Acme',
+            title=f"Internship {i}", start_date='2025-02-01', end_date='2025-07-31',
+            status=rng.choices((0, 1, 2, 3, 4), (5, 10, 5, 40, 40))[0]
+        )
+        for i, student in enumerate(students)
+    ], batch_size=1000)
+    internships = list(Internship.objects.values_list('id', 'student_id_id'))
+    Report.objects.bulk_create([
+        Report(internship_id=internship, student_id=student, title=f"Report {internship}")
+        for internship, student in internships
+    ], batch_size=1000)
+    ReportVersion.objects.bulk_create([
+        ReportVersion(
+            report_id=report, version_number=number, file=f"reports/versions/{report}_{number}.pdf",
+            # Older versions were reviewed, the latest may be waiting
+            status=rng.choice(('approved', 'rejected')) if number < last else rng.choices(
+                ('draft', 'pending', 'approved', 'rejected'), (10, 10, 60, 20))[0]
+        )
+        for report in Report.objects.values_list('id', flat=True)
+        for last in [rng.randint(1, 4)]
+        for number in range(1, last + 1)
+    ], batch_size=1000)
+    Soutenance.objects.bulk_create([
+        Soutenance(
+            internship_id=internship, date=date.today() + timedelta(days=rng.randint(-700, 60)), time='10:00',
+        )
+        for internship, _ in internships
+    ], batch_size=1000)
+    Soutenance.objects.filter(date__lt=date.today() - timedelta(days=2)).update(status='Done')
+
+    Notification.objects.bulk_create([
+        Notification(recipient_id=rng.choice(students), message=f"Notification {i}", is_read=rng.random() < 0.9)
+        for i in range(volume(100000))
+    ], batch_size=2000)
+    return students[0], teachers[0], offers[0]
+
+
+def hot_queries(student, teacher, offer):
+    from django.db.models import Q
+    from django.utils import timezone
+    from authentication.models import User
+    from internship.models import Internship, InternshipApplication, InternshipOffer, Notification, Soutenance
+    from report.models import ReportVersion
+
+    cutoff = timezone.now() - timedelta(days=180)
+    return {
+        'pending internships': Internship.objects.filter(status=0).order_by('-id')[:20],
+        'browse offers': InternshipOffer.objects.filter(status=1).order_by('-created_at', '-id')[:20],
+        'approved applications of an offer': InternshipApplication.objects.filter(offer=offer, status=1).values('id'),
+        'unread notifications': Notification.objects.filter(recipient=student, is_read=False).values('id'),
+        'past planned soutenances': Soutenance.objects.filter(status='Planned', date__lt=date.today()).values('id'),
+        'pending versions of a teacher': ReportVersion.objects.filter(
+            report__internship__teacher_id=teacher, status='pending'
+        ).values('id'),
+        'inactive users': User.objects.filter(is_enabled=True, is_active=True).filter(
+            Q(last_login_time__lt=cutoff) | Q(last_login_time__isnull=True)
+        ).values('id'),
+    }
+
+
+def run(queries, repeat):
+    results = {}
+    for name, queryset in queries.items():
+        list(queryset.all())  # warm up the page cache
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(queryset.all())
+            durations.append(time.perf_counter() - start)
+        results[name] = (statistics.median(durations), queryset.explain())
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1, help='Multiplier of the seeded volumes')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per query (median reported)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    django.setup()
+    from django.apps import apps
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        queries = hot_queries(*seed(args.scale, random.Random(args.seed)))
+        indexes = [
+            (model, next(index for index in model._meta.indexes if index.name == name))
+            for model, name in ((apps.get_model(app, model), name) for app, model, name in INDEXES)
+        ]
+        with connection.schema_editor() as editor:
+            for model, index in indexes:
+                editor.remove_index(model, index)
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+        before = run(queries, args.repeat)
+        with connection.schema_editor() as editor:
+            for model, index in indexes:
+                editor.add_index(model, index)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        after = run(queries, args.repeat)
+
+        print(f"{connection.vendor}, scale {args.scale}, median of {args.repeat} runs")
+        for name in queries:
+            (old, old_plan), (new, new_plan) = before[name], after[name]
+            print(f"\n{name}: {old * 1000:.2f} ms -> {new * 1000:.2f} ms (x{old / new:.1f})")
+            print("  before: " + old_plan.replace("\n", "\n          "))
+            print("  after:  " + new_plan.replace("\n", "\n          "))
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
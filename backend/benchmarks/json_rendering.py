@@ -0,0 +1,137 @@
+"""
+Benchmark of the JSON list path: serializer + DRF JSONRenderer (the old
+path), serializer + ORJSONRenderer, and values projection + ORJSONRenderer.
+
+Builds a throwaway test database holding N offers (with applications) and
+N notifications. Each variant runs the full query → Python → JSON bytes path
+over all rows, and the median of several runs is reported. There is no
+HTTP and no pagination, so it measures what a page of N rows costs.
+
+Usage (from the backend directory):
+    python benchmarks/json_rendering.py --rows 1000 --repeat 7
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'PfeManagement.settings')
+os.environ.setdefault('DJANGO_SECRET_KEY', 'benchmark-only-secret-key-of-at-least-32-bytes')
+os.environ.setdefault('DATABASE_ENGINE', 'django.db.backends.sqlite3')
+os.environ.setdefault('DATABASE_NAME', ':memory:')
+
+import django
+
+
+def create_rows(count):
+    from django.contrib.auth import get_user_model
+    from authentication.models import Role
+    from internship.models import InternshipApplication, InternshipOffer, Notification
+
+    User = get_user_model()
+    company = User.objects.create(
+        username='bench_company', email='company@example.com', password='!',
+        role=Role.objects.get_or_create(name='Company')[0]
+    )
+    student = User.objects.create(
+        username='bench_student', email='student@example.com', password='!',
+        role=Role.objects.get_or_create(name='Student')[0]
+    )
+    InternshipOffer.objects.bulk_create([
+        InternshipOffer(
+            company=company, title=f"Backend developer {i}", description="Django, PostgreSQL, Redis. " * 20,
+            requirements="Python", type='PFE', location='Tunis', duration='6 months',
+            start_date='2025-02-01', end_date='2025-07-31', status=1
+        )
+        for i in range(count)
+    ], batch_size=500)
+    offers = list(InternshipOffer.objects.all())
+    InternshipApplication.objects.bulk_create([
+        InternshipApplication(offer=offer, student=student, status=i % 3) for i, offer in enumerate(offers) if i % 2
+    ], batch_size=500)
+    Notification.objects.bulk_create([
+        Notification(recipient=student, message=f"Your application #{i} was reviewed", kind=Notification.KIND_APPLICATION)
+        for i in range(count)
+    ], batch_size=500)
+    return student
+
+
+def timed(function, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000, help='Rows per list')
+    parser.add_argument('--repeat', type=int, default=7, help='Runs per variant (median reported)')
+    args = parser.parse_args()
+
+    django.setup()
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+    from PfeManagement.renderers import ORJSONRenderer
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        from internship.company_serializers import InternshipOfferSerializer
+        from internship.models import InternshipOffer, Notification
+        from internship.projections import InternshipOfferProjection, NotificationProjection
+        from internship.serializers import NotificationSerializer
+
+        student = create_rows(args.rows)
+        request = Request(APIRequestFactory().get('/internship/browse/'))
+        request.user = student
+
+        def offers():
+            return InternshipOffer.objects.filter(status=1).with_stats(student)
+
+        def notifications():
+            return Notification.objects.filter(recipient=student)
+
+        lists = {
+            'offers': (
+                lambda: InternshipOfferSerializer(offers(), many=True, context={'request': request}).data,
+                lambda: InternshipOfferProjection({'request': request}),
+                offers,
+            ),
+            'notifications': (
+                lambda: NotificationSerializer(notifications(), many=True).data,
+                lambda: NotificationProjection(),
+                notifications,
+            ),
+        }
+        for name, (serialize, make_projection, queryset) in lists.items():
+            def project():
+                projection = make_projection()
+                return projection.render(projection.project(queryset()))
+
+            variants = {
+                'serializer + JSONRenderer': lambda: JSONRenderer().render(serialize()),
+                'serializer + ORJSONRenderer': lambda: ORJSONRenderer().render(serialize()),
+                'projection + ORJSONRenderer': lambda: ORJSONRenderer().render(project()),
+            }
+            baseline = None
+            print(f"{name} ({args.rows} rows)")
+            for label, variant in variants.items():
+                seconds, size = timed(variant, args.repeat)
+                baseline = baseline or seconds
+                print(f"  {label:<30} {seconds * 1000:8.1f} ms  {size / 1024:7.0f} KB  x{baseline / seconds:.1f}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
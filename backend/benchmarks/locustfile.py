@@ -0,0 +1,283 @@
+"""
+Load test of the REST API, one Locust user class per role, against a
+database filled by `manage.py seed_data`.
+
+Each simulated user logs in as a random seeded account of its role
+(auth/login/, JWT) and then loops over the endpoints that role's pages call,
+weighted by how often the frontend calls them: mostly reads, with a few
+writes (applying to offers, marking notifications read). Like a browser,
+users revalidate pages they already loaded with If-None-Match, so endpoints
+answering conditional GETs show their 304 rate.
+
+Locust reports throughput and p50/p95/p99 latency per endpoint (--csv for
+files). At the end a one-line summary is printed, and the exit code is 1
+when more than LOAD_MAX_FAILURE_RATIO of requests failed or an endpoint's
+p95 exceeds LOAD_MAX_P95_MS (logins excepted). Logins hash a password,
+which is slow on purpose: keep --spawn-rate low so they do not crowd out
+the first requests of the users already running.
+
+Usage (from the backend directory, with the API served on :8000):
+    python manage.py seed_data --scale 1
+    locust -f benchmarks/locustfile.py --host http://localhost:8000 \\
+        --headless --users 200 --spawn-rate 5 --run-time 5m --csv load
+    python manage.py seed_data --flush
+
+SEED_PREFIX, SEED_PASSWORD and SEED_SCALE must match the seed_data options.
+"""
+
+import io
+import os
+import random
+
+from locust import HttpUser, between, events, task
+
+PREFIX = os.getenv('SEED_PREFIX', 'seed')
+PASSWORD = os.getenv('SEED_PASSWORD', 'LoadTest123!')
+SCALE = float(os.getenv('SEED_SCALE', '1'))
+# Accounts per role at --scale 1, as in seed_data.VOLUMES
+ACCOUNTS = {'student': 2000, 'teacher': 120, 'company': 200, 'administrator': 5}
+MAX_FAILURE_RATIO = float(os.getenv('LOAD_MAX_FAILURE_RATIO', '0.01'))
+MAX_P95_MS = float(os.getenv('LOAD_MAX_P95_MS', '1000'))
+
+OFFER_TYPES = ['PFE', 'Stage', 'Internship']
+SEARCHES = ['developer', 'data', 'django', 'react', 'security']
+# A tiny valid PDF for applications
+CV_PDF = b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj 2 0 obj<</Type/Pages/Count 0/Kids[]>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF"
+
+
+class RoleUser(HttpUser):
+    """Logs in as a random seeded account of `role`, then calls the role's endpoints"""
+    abstract = True
+    role = None
+    wait_time = between(1, 5)
+
+    def on_start(self):
+        count = max(1, round(ACCOUNTS[self.role] * SCALE))
+        username = f"{PREFIX}_{self.role}_{random.randrange(count)}"
+        response = self.client.post('/auth/login/', json={'username': username, 'password': PASSWORD},
+                                    name='/auth/login/')
+        response.raise_for_status()
+        self.client.headers['Authorization'] = f"Bearer {response.json()['access']}"
+        self.etags = {}
+
+    def get(self, path, name=None, **params):
+        """GET revalidating the previous copy of the same URL, as a browser cache does"""
+        key = (path, tuple(sorted(params.items())))
+        headers = {'If-None-Match': self.etags[key]} if key in self.etags else {}
+        with self.client.get(path, params=params, headers=headers, name=name or path,
+                             catch_response=True) as response:
+            if response.status_code == 304:
+                response.success()
+                return None
+            if response.status_code != 200:
+                response.failure(f"HTTP {response.status_code}")
+                return None
+            if 'ETag' in response.headers:
+                self.etags[key] = response.headers['ETag']
+            return response.json()
+
+    def unread_count(self):
+        # The navbar polls this on every page
+        self.get('/internship/notifications/unread-count/')
+
+    def notifications(self):
+        page = self.get('/internship/notifications/')
+        if page and page['results'] and random.random() < 0.3:
+            notification = random.choice(page['results'])
+            self.client.patch(f"/internship/notifications/{notification['id']}/read/",
+                              name='/internship/notifications/[id]/read/')
+
+
+def results(page):
+    """Items of a paginated or plain list response"""
+    if not page:
+        return []
+    return page['results'] if isinstance(page, dict) else page
+
+
+class StudentUser(RoleUser):
+    role = 'student'
+    weight = 12
+
+    def on_start(self):
+        super().on_start()
+        self.reports = [report['id'] for report in results(self.get('/report/reports/my-reports/'))]
+        # Offers of the first browse page not applied to yet, as of the last 200
+        self.open_offers = []
+
+    def browse(self, **params):
+        page = self.get('/internship/browse/', **params)
+        # A 304 has no body: the copy from the last 200 is still what the page shows
+        if page is not None and not params:
+            self.open_offers = [offer['id'] for offer in results(page) if not offer['has_applied']]
+        return page
+
+    @task(10)
+    def browse_offers(self):
+        params = {}
+        if random.random() < 0.3:
+            params['type'] = random.choice(OFFER_TYPES)
+        if random.random() < 0.2:
+            params['search'] = random.choice(SEARCHES)
+        page = self.browse(**params)
+        # Some students scroll to the next page
+        if page and page.get('next') and random.random() < 0.3:
+            self.client.get(page['next'], name='/internship/browse/?cursor=')
+
+    @task(8)
+    def poll_unread_count(self):
+        self.unread_count()
+
+    @task(4)
+    def my_applications(self):
+        self.get('/internship/my-applications/')
+
+    @task(3)
+    def read_notifications(self):
+        self.notifications()
+
+    @task(2)
+    def my_internships(self):
+        self.get('/internship/my-internships/')
+
+    @task(2)
+    def report_detail(self):
+        if self.reports:
+            self.get(f"/report/reports/{random.choice(self.reports)}/", name='/report/reports/[id]/')
+
+    @task(1)
+    def teachers(self):
+        self.get('/internship/teachers/')
+
+    @task(1)
+    def apply(self):
+        self.browse()
+        if not self.open_offers:
+            return
+        offer_id = random.choice(self.open_offers)
+        self.open_offers.remove(offer_id)
+        with self.client.post('/internship/apply/', name='/internship/apply/', catch_response=True, data={
+            'offer': offer_id, 'cover_letter': 'I would love to join your team.',
+        }, files={'cv_file': ('cv.pdf', io.BytesIO(CV_PDF), 'application/pdf')}) as response:
+            # Full offers are refused with a 400, that is expected
+            if response.status_code in (201, 400):
+                response.success()
+
+
+class CompanyUser(RoleUser):
+    role = 'company'
+    weight = 3
+
+    def on_start(self):
+        super().on_start()
+        self.offers = [offer['id'] for offer in results(self.get('/internship/offers/'))]
+
+    @task(5)
+    def my_offers(self):
+        self.get('/internship/offers/')
+
+    @task(5)
+    def all_applications(self):
+        params = {'status': random.choice([0, 1])} if random.random() < 0.5 else {}
+        self.get('/internship/offers/all-applications/', **params)
+
+    @task(3)
+    def offer_applications(self):
+        if self.offers:
+            self.get(f"/internship/offers/{random.choice(self.offers)}/applications/",
+                     name='/internship/offers/[id]/applications/')
+
+    @task(1)
+    def interview_slots(self):
+        if self.offers:
+            self.get(f"/internship/offers/{random.choice(self.offers)}/slots/", name='/internship/offers/[id]/slots/')
+
+    @task(5)
+    def poll_unread_count(self):
+        self.unread_count()
+
+    @task(2)
+    def read_notifications(self):
+        self.notifications()
+
+
+class TeacherUser(RoleUser):
+    role = 'teacher'
+    weight = 2
+
+    @task(5)
+    def pending_versions(self):
+        versions = results(self.get('/report/reports/versions/pending/'))
+        if versions and random.random() < 0.5:
+            self.get(f"/report/reports/{random.choice(versions)['report']}/", name='/report/reports/[id]/')
+
+    @task(2)
+    def invitations(self):
+        self.get('/internship/teacher/invitations/')
+
+    @task(2)
+    def soutenances(self):
+        self.get('/internship/soutenances/')
+
+    @task(5)
+    def poll_unread_count(self):
+        self.unread_count()
+
+    @task(1)
+    def read_notifications(self):
+        self.notifications()
+
+
+class AdministratorUser(RoleUser):
+    role = 'administrator'
+    weight = 1
+
+    @task(3)
+    def pending_offers(self):
+        self.get('/internship/admin/offers/')
+
+    @task(3)
+    def pending_internships(self):
+        self.get('/internship/admin/pending/')
+
+    @task(2)
+    def users(self):
+        self.get('/administrator/users/')
+
+    @task(2)
+    def rooms(self):
+        self.get('/administrator/rooms/')
+
+    @task(1)
+    def statistics(self):
+        self.get('/administrator/statistics/')
+
+    @task(1)
+    def soutenance_candidates(self):
+        self.get('/internship/soutenances/candidates/')
+
+    @task(3)
+    def poll_unread_count(self):
+        self.unread_count()
+
+
+@events.quitting.add_listener
+def check_thresholds(environment, **kwargs):
+    total = environment.stats.total
+    if not total.num_requests:
+        return
+    print(
+        f"{total.num_requests} requests, {total.total_rps:.1f} req/s, failures {total.fail_ratio:.2%}, "
+        f"p50 {total.get_response_time_percentile(0.5):.0f} ms, p95 {total.get_response_time_percentile(0.95):.0f} ms, "
+        f"p99 {total.get_response_time_percentile(0.99):.0f} ms"
+    )
+    # Logins hash a password on purpose, they are not held to the budget
+    slow = [
+        f"{entry.method} {entry.name} ({entry.get_response_time_percentile(0.95):.0f} ms)"
+        for entry in environment.stats.entries.values()
+        if entry.name != '/auth/login/' and entry.get_response_time_percentile(0.95) > MAX_P95_MS
+    ]
+    if slow:
+        print(f"p95 over {MAX_P95_MS:.0f} ms: " + ', '.join(slow))
+    if total.fail_ratio > MAX_FAILURE_RATIO or slow:
+        environment.process_exit_code = 1
@@ -0,0 +1,89 @@
+"""
+Import-time benchmark for the scraping module.
+
+Measures what a Celery worker / Django process pays when it imports
+`internship.tasks` (which pulls in the scrapers), compared with the
+selenium + undetected_chromedriver imports the scrapers used to do eagerly.
+Every measurement runs in a fresh interpreter so module caches do not leak.
+
+Usage (from the backend directory):
+    python benchmarks/scraper_imports.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, resource, sys, time
+import django
+django.setup()
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    'seconds': elapsed,
+    'rss_kb': rss_after,
+    'rss_delta_kb': rss_after - rss_before,
+    'selenium_loaded': 'selenium' in sys.modules,
+}))
+"""
+
+SCENARIOS = {
+    'tasks (lazy backends)': ['internship.tasks'],
+    'legacy eager imports': [
+        'undetected_chromedriver',
+        'selenium.webdriver.common.by',
+        'selenium.webdriver.support.ui',
+        'selenium.webdriver.support.expected_conditions',
+        'internship.tasks',
+    ],
+}
+
+
+def measure(modules):
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': 'PfeManagement.settings'}
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE, *modules],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None, result.stderr.strip().splitlines()[-1]
+    return json.loads(result.stdout.strip().splitlines()[-1]), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per scenario')
+    args = parser.parse_args()
+
+    for label, modules in SCENARIOS.items():
+        samples = []
+        for _ in range(args.runs):
+            sample, error = measure(modules)
+            if error:
+                print(f"{label:<24} skipped: {error}")
+                break
+            samples.append(sample)
+        if not samples:
+            continue
+
+        print(
+            f"{label:<24} "
+            f"import {statistics.median(s['seconds'] for s in samples) * 1000:8.1f} ms  "
+            f"rss +{statistics.median(s['rss_delta_kb'] for s in samples) / 1024:6.1f} MB  "
+            f"(peak {statistics.median(s['rss_kb'] for s in samples) / 1024:6.1f} MB)  "
+            f"selenium loaded: {samples[0]['selenium_loaded']}"
+        )
+
+
+if __name__ == '__main__':
+    main()
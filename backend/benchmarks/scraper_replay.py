@@ -0,0 +1,61 @@
+"""
+Parser benchmark against a recorded crawl.
+
+Replays an archive made with `manage.py scrape_internships --record` through
+the paginated crawl of every source, without network or database access, and
+reports pages, items and throughput. Run it before and after a parser change
+to compare both output and speed on real multi-page crawls.
+
+Usage (from the backend directory):
+    python benchmarks/scraper_replay.py crawl.jsonl.zst --runs 5
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'PfeManagement.settings')
+
+import django
+
+django.setup()
+
+from internship.scraper_backends import HttpArchive
+from internship.scrapers import SOURCES, crawl_source
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('archive', help='Recorded archive (.jsonl, .jsonl.gz or .jsonl.zst)')
+    parser.add_argument('--runs', type=int, default=3, help='Replays per source')
+    parser.add_argument('--max-pages', type=int, default=50)
+    parser.add_argument('--max-items', type=int, default=10000)
+    args = parser.parse_args()
+
+    for source_name in SOURCES:
+        timings = []
+        for _ in range(args.runs):
+            archive = HttpArchive.replay(args.archive)
+            # The scrapers print progress for every card, keep the report readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                opportunities = crawl_source(
+                    source_name, max_pages=args.max_pages, max_items=args.max_items, archive=archive
+                )
+                timings.append(time.perf_counter() - start)
+
+        median = statistics.median(timings)
+        rate = len(opportunities) / median if median else 0
+        print(
+            f"{source_name:<12} items {len(opportunities):6d}  "
+            f"median {median * 1000:8.1f} ms  ({rate:8.0f} items/s)"
+        )
+
+
+if __name__ == '__main__':
+    main()
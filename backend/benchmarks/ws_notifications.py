@@ -0,0 +1,190 @@
+"""
+Load test for the websocket notification path.
+
+Builds a throwaway test database, then opens N authenticated
+ws/notifications/ sockets against the ASGI application of
+PfeManagement/asgi.py (JWT middleware, router and NotificationConsumer),
+in-process through channels' WebsocketCommunicator. Notifications are
+then fired through the real dispatch code (notify() and broadcast()).
+
+Reports how many sockets connected and how fast, the Python heap used per
+socket (tracemalloc), and the p50/p99/max delivery latency from the
+dispatch call to the socket. It uses an in-memory channel layer, cache and
+presence store (fakeredis) unless --redis is given, in which case all three
+live in that Redis. TCP and daphne framing are not part of the measurement.
+
+Usage (from the backend directory):
+    python benchmarks/ws_notifications.py --sockets 1000 --rounds 5
+    python benchmarks/ws_notifications.py --sockets 1000 --redis redis://localhost:6379/2
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'PfeManagement.settings')
+os.environ.setdefault('DJANGO_SECRET_KEY', 'benchmark-only-secret-key-of-at-least-32-bytes')
+os.environ.setdefault('DATABASE_ENGINE', 'django.db.backends.sqlite3')
+os.environ.setdefault('DATABASE_NAME', ':memory:')
+
+import django
+from django.conf import settings
+
+
+def percentile(values, q):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+def configure(redis_url):
+    django.setup()
+    if redis_url:
+        settings.CHANNEL_LAYERS = {'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {'hosts': [redis_url], 'capacity': 10000},
+        }}
+        settings.CACHES = {'default': {'BACKEND': 'django_redis.cache.RedisCache', 'LOCATION': redis_url}}
+    else:
+        settings.CHANNEL_LAYERS = {'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}}
+        # Room for every unread counter: a culled one is only rebuilt, but it costs a COUNT query
+        settings.CACHES = {'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': 1_000_000},
+        }}
+        import fakeredis
+        from internship import presence
+        store = fakeredis.FakeRedis()
+        presence.get_redis_connection = lambda alias='default': store
+
+
+def create_users(count):
+    from django.contrib.auth import get_user_model
+    from authentication.models import Role
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    User = get_user_model()
+    role, _ = Role.objects.get_or_create(name='Student')
+    User.objects.bulk_create([
+        User(username=f'bench{i}', email=f'bench{i}@example.com', password='!', role=role)
+        for i in range(count)
+    ], batch_size=1000)
+    users = list(User.objects.filter(username__startswith='bench').order_by('id'))
+
+    tokens = []
+    for user in users:
+        token = AccessToken.for_user(user)
+        token['role_name'] = role.name
+        tokens.append(str(token))
+    return users, tokens
+
+
+async def open_sockets(application, tokens, batch, timeout):
+    from channels.testing import WebsocketCommunicator
+
+    communicators = []
+    failures = 0
+    for start in range(0, len(tokens), batch):
+        pending = [
+            WebsocketCommunicator(application, f"/ws/notifications/?token={token}")
+            for token in tokens[start:start + batch]
+        ]
+        results = await asyncio.gather(
+            *(communicator.connect(timeout=timeout) for communicator in pending), return_exceptions=True
+        )
+        for communicator, result in zip(pending, results):
+            if isinstance(result, tuple) and result[0]:
+                communicators.append(communicator)
+            else:
+                failures += 1
+    return communicators, failures
+
+
+async def measure_delivery(communicators, dispatch, timeout):
+    """Fire one notification per socket through `dispatch` and time its arrival everywhere"""
+    from asgiref.sync import sync_to_async
+
+    async def receive(communicator):
+        payload = await communicator.receive_json_from(timeout=timeout)
+        return time.perf_counter() - float(payload['message'])
+
+    receivers = [asyncio.ensure_future(receive(communicator)) for communicator in communicators]
+    await sync_to_async(dispatch)(f"{time.perf_counter()!r}")
+    results = await asyncio.gather(*receivers, return_exceptions=True)
+    return [r for r in results if not isinstance(r, BaseException)]
+
+
+async def run(args):
+    from PfeManagement.asgi import application
+    from internship.models import Notification
+    from internship.notifications import broadcast, notify, role_group
+
+    users, tokens = await asyncio.to_thread(create_users, args.sockets)
+
+    tracemalloc.start()
+    heap_before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    communicators, failures = await open_sockets(application, tokens, args.batch, args.timeout)
+    connect_seconds = time.perf_counter() - start
+    heap_per_socket = (tracemalloc.get_traced_memory()[0] - heap_before) / max(len(communicators), 1)
+    tracemalloc.stop()
+
+    print(f"sockets    {len(communicators)}/{args.sockets} connected ({failures} failed) "
+          f"in {connect_seconds:.2f} s ({len(communicators) / connect_seconds:.0f}/s)")
+    print(f"memory     {heap_per_socket / 1024:.1f} KB Python heap per socket")
+
+    scenarios = {
+        'notify (one group_send per user)':
+            lambda message: notify(users, message, Notification.KIND_GENERAL),
+        'broadcast (one group_send per role)':
+            lambda message: broadcast(role_group('Student'), users, message),
+    }
+    for label, dispatch in scenarios.items():
+        latencies = []
+        for _ in range(args.rounds):
+            latencies += await measure_delivery(communicators, dispatch, args.timeout)
+        if not latencies:
+            print(f"{label:<36} nothing delivered")
+            continue
+        expected = len(communicators) * args.rounds
+        print(
+            f"{label:<36} delivered {len(latencies)}/{expected}  "
+            f"p50 {percentile(latencies, 50) * 1000:8.1f} ms  "
+            f"p99 {percentile(latencies, 99) * 1000:8.1f} ms  "
+            f"max {max(latencies) * 1000:8.1f} ms"
+        )
+
+    # A socket that timed out waiting for a delivery was already torn down (cancelled)
+    await asyncio.gather(*(communicator.disconnect() for communicator in communicators), return_exceptions=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sockets', type=int, default=500, help='Authenticated sockets to open')
+    parser.add_argument('--rounds', type=int, default=3, help='Notifications fired per scenario')
+    parser.add_argument('--batch', type=int, default=100, help='Sockets opened concurrently')
+    parser.add_argument('--timeout', type=float, default=10, help='Seconds to wait for a connect or a delivery')
+    parser.add_argument('--redis', help='Use a Redis channel layer at this URL instead of the in-memory one')
+    args = parser.parse_args()
+
+    configure(args.redis)
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        asyncio.run(run(args))
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
@@ -34,7 +34,9 @@ class InternshipOfferSerializer(serializers.ModelSerializer):
     type_display = serializers.CharField(source='get_type_display', read_only=True)
     applications_count = serializers.IntegerField(read_only=True)
     approved_applications_count = serializers.IntegerField(read_only=True)
+    pending_applications_count = serializers.IntegerField(read_only=True)
     has_applied = serializers.SerializerMethodField()
+    application_status = serializers.SerializerMethodField()
     
     class Meta:
         model = InternshipOffer
@@ -42,17 +44,29 @@ class InternshipOfferSerializer(serializers.ModelSerializer):
             'id', 'company', 'company_info', 'title', 'description', 'requirements',
             'type', 'type_display', 'location', 'duration', 'start_date', 'end_date',
             'positions_available', 'status', 'status_display', 'admin_feedback',
-            'applications_count', 'approved_applications_count', 'has_applied',
-            'external_url', 'created_at', 'updated_at'
+            'applications_count', 'approved_applications_count', 'pending_applications_count',
+            'has_applied', 'application_status', 'external_url', 'created_at', 'updated_at'
         ]
         read_only_fields = ['company', 'status', 'admin_feedback', 'created_at', 'updated_at']
     
     def get_has_applied(self, obj):
+        # Annotated by InternshipOffer.objects.with_stats(user)
+        if hasattr(obj, 'applied_by_user'):
+            return obj.applied_by_user
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return obj.applications.filter(student=request.user).exists()
         return False
 
+    def get_application_status(self, obj):
+        # Annotated by InternshipOffer.objects.with_stats(user)
+        if hasattr(obj, 'user_application_status'):
+            return obj.user_application_status
+        request = self.context.get('request')
+        if request and request.user.is_authenticated:
+            return obj.applications.filter(student=request.user).values_list('status', flat=True).first()
+        return None
+
 
 class InternshipOfferCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating new internship offers"""
@@ -87,13 +101,15 @@ class InternshipApplicationSerializer(serializers.ModelSerializer):
         model = InternshipApplication
         fields = [
             'id', 'offer', 'offer_info', 'student', 'student_info',
-            'cover_letter', 'cv_file', 'status', 'status_display',
+            'cover_letter', 'cv_file', 'cv_file_size', 'cv_file_mime_type', 'cv_file_page_count',
+            'status', 'status_display',
             'company_feedback', 'interview_notes', 'selected_interview_slot',
             'selected_slot_info', 'available_slots', 'created_internship',
             'match_score', 'match_analysis',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['student', 'status', 'company_feedback', 'interview_notes', 
+        read_only_fields = ['student', 'cv_file_size', 'cv_file_mime_type', 'cv_file_page_count',
+                          'status', 'company_feedback', 'interview_notes', 
                           'created_internship', 'match_score', 'match_analysis',
                           'created_at', 'updated_at']
     
@@ -105,7 +121,10 @@ class InternshipApplicationSerializer(serializers.ModelSerializer):
     def get_available_slots(self, obj):
         # Return available slots if student is invited to interview but hasn't selected yet
         if obj.status == 1 and not obj.selected_interview_slot:  # Interview status
-            slots = InterviewSlot.objects.filter(offer=obj.offer, is_booked=False)
+            # Prefetched by InternshipApplication.objects.with_related()
+            slots = getattr(obj.offer, 'unbooked_slots', None)
+            if slots is None:
+                slots = InterviewSlot.objects.filter(offer=obj.offer, is_booked=False)
             return InterviewSlotSerializer(slots, many=True).data
         return []
 
@@ -1,5 +1,30 @@
+import asyncio
 import json
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
+from django.contrib.auth import get_user_model
+
+from .models import InternshipApplication, Jury, Notification
+from .notifications import offer_group, role_group, soutenance_group
+from .presence import mark_offline, mark_online, presence_ttl
+
+User = get_user_model()
+
+# Beyond this many missed notifications the client is told to refetch its feed
+REPLAY_LIMIT = 100
+
+
+def notification_payload(notification_id, message, kind, created_at):
+    return {
+        'id': notification_id,
+        'message': message,
+        'kind': kind,
+        'created_at': created_at,
+    }
+
 
 class NotificationConsumer(AsyncWebsocketConsumer):
     async def connect(self):
@@ -8,21 +33,94 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             await self.close()
         else:
             self.group_name = f"user_{self.user.id}"
-            await self.channel_layer.group_add(
-                self.group_name,
-                self.channel_name
-            )
+            # Own group first, then the broadcast groups the user belongs to
+            self.groups_joined = [self.group_name] + await self.get_broadcast_groups()
+            for group in self.groups_joined:
+                await self.channel_layer.group_add(group, self.channel_name)
             await self.accept()
 
+            await sync_to_async(mark_online)(self.user.id, self.role_name, self.channel_name)
+            self.heartbeat = asyncio.ensure_future(self.keep_presence())
+
+            # Joined the groups first: nothing created from now on can be missed,
+            # at worst a notification arrives twice and the client drops it by id
+            last_seen_id = self.get_last_seen_id()
+            if last_seen_id is not None:
+                await self.replay_missed(last_seen_id)
+
+    @database_sync_to_async
+    def get_broadcast_groups(self):
+        # The role comes from the token claims when available (see JwtAuthMiddleware)
+        role_name = getattr(self.user, 'role_name', None)
+        if role_name is None:
+            role_name = User.objects.filter(id=self.user.id).values_list('role__name', flat=True).first()
+        self.role_name = role_name
+
+        groups = [role_group(role_name)] if role_name else []
+        groups += [offer_group(offer_id) for offer_id in InternshipApplication.objects.filter(
+            student_id=self.user.id
+        ).values_list('offer_id', flat=True).distinct()]
+        groups += [soutenance_group(soutenance_id) for soutenance_id in Jury.objects.filter(
+            member_id=self.user.id
+        ).values_list('soutenance_id', flat=True).distinct()]
+        return groups
+
+    def get_last_seen_id(self):
+        query_params = parse_qs(self.scope.get('query_string', b'').decode())
+        try:
+            return int(query_params['last_seen_id'][0])
+        except (KeyError, ValueError):
+            return None
+
+    @database_sync_to_async
+    def get_missed_notifications(self, last_seen_id):
+        return list(Notification.objects.filter(
+            recipient_id=self.user.id,
+            id__gt=last_seen_id
+        ).order_by('id').values('id', 'message', 'kind', 'created_at')[:REPLAY_LIMIT + 1])
+
+    async def replay_missed(self, last_seen_id):
+        missed = await self.get_missed_notifications(last_seen_id)
+        if len(missed) > REPLAY_LIMIT:
+            await self.send(text_data=json.dumps({'resync': True}))
+            return
+        for row in missed:
+            await self.send(text_data=json.dumps(notification_payload(
+                row['id'], row['message'], row['kind'], row['created_at'].isoformat()
+            )))
+
+    async def keep_presence(self):
+        """Refresh the presence of this socket well before it expires"""
+        while True:
+            await asyncio.sleep(presence_ttl() / 2)
+            await sync_to_async(mark_online)(self.user.id, self.role_name, self.channel_name)
+
     async def disconnect(self, close_code):
-        if hasattr(self, 'group_name'):
-            await self.channel_layer.group_discard(
-                self.group_name,
-                self.channel_name
-            )
+        for group in getattr(self, 'groups_joined', []):
+            await self.channel_layer.group_discard(group, self.channel_name)
+        if hasattr(self, 'heartbeat'):
+            self.heartbeat.cancel()
+            await sync_to_async(mark_offline)(self.user.id, self.role_name, self.channel_name)
+
+    async def subscribe(self, event):
+        """Join a broadcast group while connected (e.g. right after applying to an offer)"""
+        if event['group'] not in self.groups_joined:
+            await self.channel_layer.group_add(event['group'], self.channel_name)
+            self.groups_joined.append(event['group'])
+
+    @database_sync_to_async
+    def get_broadcast_notification_id(self, id_range, message):
+        return Notification.objects.filter(
+            recipient_id=self.user.id, id__range=id_range, message=message
+        ).values_list('id', flat=True).first()
 
     async def send_notification(self, event):
-        message = event['message']
-        await self.send(text_data=json.dumps({
-            'message': message
-        }))
+        notification_id = event.get('id')
+        if 'id_range' in event:
+            # Broadcast: only users who got a notification row are notified
+            notification_id = await self.get_broadcast_notification_id(event['id_range'], event['message'])
+            if notification_id is None:
+                return
+        await self.send(text_data=json.dumps(notification_payload(
+            notification_id, event['message'], event.get('kind', 'general'), event.get('created_at')
+        )))
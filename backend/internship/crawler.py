@@ -0,0 +1,319 @@
+"""
+Checkpointed crawl frontier for the internship scrapers.
+
+Listing pages to visit are stored as CrawlPage rows keyed by crawl, source
+and page number. Workers claim pending rows with a conditional UPDATE, so
+several Celery workers can drain the same frontier, and a crawl interrupted
+halfway resumes from the rows still pending when it is started again.
+Offers are persisted as soon as they are scraped and a page is marked done
+once all its offers are saved, so finished pages are never redone.
+
+Listing URLs are page-number templates, so the first pages of every source
+are seeded up front (settings.SCRAPER_FRONTIER_WINDOW) and each finished
+page pushes the window one page further: workers spread over the pages of a
+source instead of waiting for the previous one. The first empty page, or the
+item budget running out, closes the pages of the source still pending.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import CrawlPage, InternshipOffer
+from .scrape_metrics import InstrumentedBackend, ScrapeStats, enabled_sources, finish_crawl_run, merge_crawl_run
+from .scrapers import (
+    SOURCES, clean_and_validate_opportunity, get_crawl_budget,
+    get_listing_url, get_source_backend, iter_listing_page,
+)
+
+# A page claimed longer ago than this is assumed to belong to a dead worker
+STALE_CLAIM_AFTER = timedelta(minutes=15)
+MAX_PAGE_ATTEMPTS = 3
+# Scraped items waiting to be persisted; fetchers block when it is full
+DEFAULT_PIPELINE_BUFFER = 50
+# Listing pages of a source queued ahead of the ones finished
+DEFAULT_FRONTIER_WINDOW = 5
+
+
+def default_crawl_key():
+    """One crawl per day: re-running the same day resumes the same frontier"""
+    return timezone.now().date().isoformat()
+
+
+def persist_opportunity(opp_data, company_user):
+    """
+    Clean one scraped opportunity and create its offer unless it is a
+    duplicate (same title for the scraper company within the last 7 days).
+    Returns True when an offer was created
+    """
+    # Clean and validate data
+    cleaned_data = clean_and_validate_opportunity(opp_data)
+
+    # Check for duplicates (by title and company within last 7 days)
+    existing = InternshipOffer.objects.filter(
+        title__iexact=cleaned_data['title'],
+        company=company_user,
+        created_at__gte=timezone.now() - timedelta(days=7)
+    ).exists()
+
+    if existing:
+        return False
+
+    # Create new offer
+    InternshipOffer.objects.create(
+        company=company_user,
+        **cleaned_data
+    )
+    return True
+
+
+def save_opportunities(opportunities, company_user):
+    """
+    Persist an iterable of scraped opportunities one by one, so a generator
+    is consumed as it produces.
+    Returns (created_count, duplicate_count)
+    """
+    created_count = 0
+    duplicate_count = 0
+
+    for opp_data in opportunities:
+        if persist_opportunity(opp_data, company_user):
+            created_count += 1
+        else:
+            duplicate_count += 1
+
+    return created_count, duplicate_count
+
+
+def frontier_window():
+    return getattr(settings, 'SCRAPER_FRONTIER_WINDOW', DEFAULT_FRONTIER_WINDOW)
+
+
+def add_pages(crawl_key, source_name, pages):
+    """Queue listing pages of a source (pages already known are left alone)"""
+    CrawlPage.objects.bulk_create([
+        CrawlPage(crawl_key=crawl_key, source=source_name, page=page, url=get_listing_url(source_name, page))
+        for page in pages
+    ], ignore_conflicts=True)
+
+
+def seed_frontier(crawl_key, sources=None, max_pages=None):
+    """Add the first window of listing pages of every enabled source (no-op for pages already known)"""
+    max_pages, _ = get_crawl_budget(max_pages)
+    for source_name in enabled_sources(list(sources or SOURCES)):
+        add_pages(crawl_key, source_name, range(1, min(frontier_window(), max_pages) + 1))
+
+
+def release_stale_claims(crawl_key):
+    """Put pages claimed by crashed workers back in the frontier"""
+    return CrawlPage.objects.filter(
+        crawl_key=crawl_key,
+        status=1,
+        claimed_at__lt=timezone.now() - STALE_CLAIM_AFTER
+    ).update(status=0)
+
+
+def claim_next_page(crawl_key, exclude_sources=()):
+    """
+    Atomically claim the next pending page of a crawl, skipping the sources
+    this worker is already busy with.
+    The conditional UPDATE only succeeds for one worker per row.
+    """
+    while True:
+        candidate = CrawlPage.objects.filter(
+            crawl_key=crawl_key, status=0
+        ).exclude(source__in=exclude_sources).order_by('page', 'id').first()
+        if candidate is None:
+            return None
+
+        claimed = CrawlPage.objects.filter(id=candidate.id, status=0).update(
+            status=1,
+            claimed_at=timezone.now(),
+            attempts=F('attempts') + 1
+        )
+        if claimed:
+            candidate.refresh_from_db()
+            return candidate
+
+
+def items_found_so_far(crawl_page):
+    """Items already taken from the finished pages of the source (the budget is shared by all workers)"""
+    return CrawlPage.objects.filter(
+        crawl_key=crawl_page.crawl_key,
+        source=crawl_page.source,
+        status=2
+    ).aggregate(total=Sum('items_found'))['total'] or 0
+
+
+def finish_page(crawl_page, items_found, already_found, max_pages, max_items):
+    """
+    Mark a page as done, then close the source if the page was empty or the
+    item budget is spent, or else slide its window of pending pages forward
+    """
+    crawl_page.items_found = items_found
+    crawl_page.status = 2
+    crawl_page.save(update_fields=['items_found', 'status', 'updated_at'])
+
+    source_pages = CrawlPage.objects.filter(crawl_key=crawl_page.crawl_key, source=crawl_page.source)
+    if already_found + items_found >= max_items:
+        source_pages.filter(status=0).update(status=2)
+        return
+    if not items_found:
+        # Past the last page of the listing
+        source_pages.filter(status=0, page__gt=crawl_page.page).update(status=2)
+        return
+
+    next_page = crawl_page.page + frontier_window()
+    # Pages closed above are done with nothing found: do not reopen past them
+    if next_page <= max_pages and not source_pages.filter(
+        status=2, items_found=0, page__lt=next_page
+    ).exists():
+        add_pages(crawl_page.crawl_key, crawl_page.source, [next_page])
+
+
+def fail_page(crawl_page, error):
+    """Put a page back in the frontier, or give up on it after MAX_PAGE_ATTEMPTS"""
+    print(f"Error crawling {crawl_page.url}: {error}")
+    crawl_page.status = 3 if crawl_page.attempts >= MAX_PAGE_ATTEMPTS else 0
+    crawl_page.save(update_fields=['status', 'updated_at'])
+
+
+# Messages sent by the fetchers to the persisting thread
+ITEM, PAGE_DONE, PAGE_FAILED = 'item', 'page_done', 'page_failed'
+
+
+class _PageFetcher:
+    """
+    Producer side of the crawl pipeline: fetches and parses one claimed page
+    in a worker thread and hands the opportunities over through the shared
+    bounded queue. It never touches the database.
+    """
+
+    def __init__(self, crawl_page, backend, stats, pipeline, cancelled):
+        self.crawl_page = crawl_page
+        self.backend = backend
+        self.stats = stats
+        self.pipeline = pipeline
+        self.cancelled = cancelled
+        # Set by the consumer once the item budget of the source is spent
+        self.budget_spent = threading.Event()
+
+    def put(self, kind, payload=None):
+        # Block while the queue is full (backpressure) but give up on cancellation
+        while not self.cancelled.is_set():
+            try:
+                self.pipeline.put((kind, self, payload), timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __call__(self):
+        try:
+            for opp in iter_listing_page(self.crawl_page.source, self.backend, self.crawl_page.url, stats=self.stats):
+                if not self.put(ITEM, opp) or self.budget_spent.is_set():
+                    break
+        except Exception as e:
+            self.put(PAGE_FAILED, e)
+            return
+        self.put(PAGE_DONE)
+
+
+def run_crawl(crawl_key, company_user, max_pages=None, max_items=None, archive=None):
+    """
+    Drain the frontier of a crawl until no page is left to claim.
+    Safe to run from several workers at once. The metrics of every source
+    crawled by this worker are merged into the crawl's ScrapeRun, and the
+    source health is updated once its frontier is drained. Pass an
+    HttpArchive to record or replay every fetched page.
+
+    Sources are fetched concurrently, one thread per source, and stream
+    their opportunities through a bounded queue (settings.SCRAPER_PIPELINE_BUFFER)
+    to this thread, which cleans, deduplicates and persists them while the
+    slower sources are still fetching.
+    Returns (created_count, duplicate_count) for the pages this worker processed
+    """
+    max_pages, max_items = get_crawl_budget(max_pages, max_items)
+    release_stale_claims(crawl_key)
+
+    pipeline = queue.Queue(maxsize=getattr(settings, 'SCRAPER_PIPELINE_BUFFER', DEFAULT_PIPELINE_BUFFER))
+    cancelled = threading.Event()
+    executors = {}
+    backends = {}
+    stats = {}
+    # source -> (fetcher, items taken from the finished pages, items taken from this page)
+    in_flight = {}
+    created_count = 0
+    duplicate_count = 0
+
+    try:
+        while True:
+            # Give every idle source its next page
+            while True:
+                crawl_page = claim_next_page(crawl_key, exclude_sources=list(in_flight))
+                if crawl_page is None:
+                    break
+
+                source_name = crawl_page.source
+                if source_name not in backends:
+                    stats[source_name] = ScrapeStats(source_name)
+                    backends[source_name] = InstrumentedBackend(
+                        get_source_backend(source_name, archive=archive), stats[source_name]
+                    )
+                    executors[source_name] = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"crawl-{source_name}")
+
+                print(f"🔍 Crawling {source_name} page {crawl_page.page}...")
+                fetcher = _PageFetcher(crawl_page, backends[source_name], stats[source_name], pipeline, cancelled)
+                in_flight[source_name] = [fetcher, items_found_so_far(crawl_page), 0]
+                executors[source_name].submit(fetcher)
+
+            if not in_flight:
+                break
+
+            kind, fetcher, payload = pipeline.get()
+            crawl_page = fetcher.crawl_page
+            source_name = crawl_page.source
+            page_state = in_flight[source_name]
+            _, already_found, page_items = page_state
+
+            if kind == ITEM:
+                if already_found + page_items >= max_items:
+                    fetcher.budget_spent.set()
+                    continue
+                if persist_opportunity(payload, company_user):
+                    created_count += 1
+                    stats[source_name].items_created += 1
+                else:
+                    duplicate_count += 1
+                    stats[source_name].duplicates_skipped += 1
+                page_state[2] += 1
+                if already_found + page_state[2] >= max_items:
+                    fetcher.budget_spent.set()
+            elif kind == PAGE_DONE:
+                del in_flight[source_name]
+                finish_page(crawl_page, page_items, already_found, max_pages, max_items)
+            else:
+                del in_flight[source_name]
+                fail_page(crawl_page, payload)
+    finally:
+        # Unblock fetchers still waiting on a full queue if we are bailing out
+        cancelled.set()
+        for executor in executors.values():
+            executor.shutdown(wait=True)
+        for backend in backends.values():
+            backend.close()
+        # Replayed runs say nothing about the health of the live sources
+        if not (archive and archive.mode == 'replay'):
+            for source_name, source_stats in stats.items():
+                merge_crawl_run(source_stats, crawl_key)
+                source_pages = CrawlPage.objects.filter(crawl_key=crawl_key, source=source_name)
+                if not source_pages.filter(status__in=[0, 1]).exists():
+                    items_found = source_pages.aggregate(total=Sum('items_found'))['total'] or 0
+                    finish_crawl_run(crawl_key, source_name, items_found)
+
+    return created_count, duplicate_count
@@ -0,0 +1,102 @@
+"""
+Metadata of uploaded files, captured once at upload.
+
+Every file field `<name>` that keeps its metadata has the columns
+`<name>_size` (bytes), `<name>_sha256`, `<name>_mime_type` and
+`<name>_page_count` (PDF only) next to it. Models call
+capture_file_metadata() from save(), so responses read the columns instead
+of asking the storage for every file. Rows uploaded before the columns
+existed are filled by `python manage.py backfill_file_metadata`.
+"""
+
+import hashlib
+import logging
+import mimetypes
+
+logger = logging.getLogger(__name__)
+
+METADATA_KEYS = ('size', 'sha256', 'mime_type', 'page_count')
+
+# Leading bytes of the file types users upload (reports, CVs, cahiers de charges)
+SIGNATURES = [
+    (b'%PDF-', 'application/pdf'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'application/msword'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+]
+
+
+def metadata_columns(field_name):
+    return [f"{field_name}_{key}" for key in METADATA_KEYS]
+
+
+def sniff_mime_type(head, name):
+    """MIME type from the first bytes of the file, falling back to its extension"""
+    for signature, mime_type in SIGNATURES:
+        if head.startswith(signature):
+            return mime_type
+    # Zip containers (docx) are told apart by their extension
+    return mimetypes.guess_type(name or '')[0] or 'application/octet-stream'
+
+
+def count_pdf_pages(file):
+    # Imported here: models import this module and pypdf is slow to load
+    from pypdf import PdfReader
+
+    try:
+        file.seek(0)
+        return len(PdfReader(file).pages)
+    except Exception as e:
+        # Malformed PDFs make pypdf raise about anything (KeyError, RecursionError...);
+        # this runs in save(), so an upload must never fail because of it
+        logger.warning(f"Could not count the pages of {file.name}: {e!r}")
+        return None
+
+
+def read_file_metadata(file):
+    """Size, SHA-256, MIME type and page count of an open file, read in chunks"""
+    digest = hashlib.sha256()
+    size = 0
+    head = b''
+    file.seek(0)
+    for chunk in file.chunks():
+        if not head:
+            head = chunk[:16]
+        digest.update(chunk)
+        size += len(chunk)
+
+    mime_type = sniff_mime_type(head, file.name)
+    page_count = count_pdf_pages(file) if mime_type == 'application/pdf' else None
+    file.seek(0)
+    return {
+        'size': size,
+        'sha256': digest.hexdigest(),
+        'mime_type': mime_type,
+        'page_count': page_count,
+    }
+
+
+def set_file_metadata(instance, field_name, metadata):
+    for key in METADATA_KEYS:
+        setattr(instance, f"{field_name}_{key}", metadata[key] if metadata else None)
+
+
+def copy_file_metadata(source, source_field, target, target_field):
+    """Reuse the stored metadata when a stored file is assigned to another field"""
+    for key in METADATA_KEYS:
+        setattr(target, f"{target_field}_{key}", getattr(source, f"{source_field}_{key}"))
+
+
+def capture_file_metadata(instance, field_name, update_fields=None):
+    """
+    Fill the metadata columns of `field_name` if it holds a new upload (not
+    saved to the storage yet), or clear them if the file was removed.
+    Returns update_fields with the metadata columns added when needed
+    """
+    file = getattr(instance, field_name)
+    if file and getattr(file, '_committed', True):
+        return update_fields
+    set_file_metadata(instance, field_name, read_file_metadata(file) if file else None)
+    if update_fields is not None and field_name in update_fields:
+        update_fields = list(update_fields) + metadata_columns(field_name)
+    return update_fields
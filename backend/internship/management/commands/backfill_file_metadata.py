@@ -0,0 +1,65 @@
+"""
+Management command to fill the stored file metadata (size, hash, MIME type,
+page count) of files uploaded before it was captured at upload
+Usage: python manage.py backfill_file_metadata [--batch-size N]
+"""
+
+from django.core.management.base import BaseCommand
+
+from internship.file_metadata import metadata_columns, read_file_metadata, set_file_metadata
+from internship.models import Internship, InternshipApplication
+from report.models import ReportVersion
+
+# (model, file field) pairs whose metadata is stored, see internship.file_metadata
+FILE_FIELDS = [
+    (ReportVersion, 'file'),
+    (InternshipApplication, 'cv_file'),
+    (Internship, 'cahier_de_charges'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Store the metadata of uploaded files that do not have it yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Rows updated per query'
+        )
+
+    def handle(self, *args, **options):
+        for model, field_name in FILE_FIELDS:
+            updated, missing = self.backfill(model, field_name, options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f"{model.__name__}.{field_name}: {updated} updated, {missing} files not found"
+            ))
+
+    def backfill(self, model, field_name, batch_size):
+        # The hash is always set once the metadata was captured
+        rows = model.objects.filter(**{f"{field_name}_sha256__isnull": True}).exclude(
+            **{field_name: ''}
+        ).exclude(**{f"{field_name}__isnull": True}).only('pk', field_name)
+
+        updated = missing = 0
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            file = getattr(row, field_name)
+            try:
+                with file.open('rb'):
+                    set_file_metadata(row, field_name, read_file_metadata(file))
+            except FileNotFoundError:
+                missing += 1
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                updated += self.flush(model, field_name, batch)
+        return updated + self.flush(model, field_name, batch), missing
+
+    def flush(self, model, field_name, batch):
+        # bulk_update skips save(), nothing is read twice
+        model.objects.bulk_update(batch, metadata_columns(field_name))
+        count = len(batch)
+        batch.clear()
+        return count
@@ -1,6 +1,8 @@
 """
 Management command to manually trigger internship scraping
-Usage: python manage.py scrape_internships
+Usage: python manage.py scrape_internships [--max-pages N] [--max-items N] [--crawl-key KEY]
+       python manage.py scrape_internships --record crawl.jsonl.zst
+       python manage.py scrape_internships --replay crawl.jsonl.zst
 """
 
 from django.core.management.base import BaseCommand
@@ -16,6 +18,32 @@ class Command(BaseCommand):
             type=str,
             help='Path to HTML file to parse instead of scraping online'
         )
+        parser.add_argument(
+            '--max-pages',
+            type=int,
+            help='Maximum listing pages to crawl per source'
+        )
+        parser.add_argument(
+            '--max-items',
+            type=int,
+            help='Maximum opportunities to collect per source'
+        )
+        archive_group = parser.add_mutually_exclusive_group()
+        archive_group.add_argument(
+            '--record',
+            type=str,
+            help='Save every fetched page to an archive (.jsonl, .jsonl.gz or .jsonl.zst)'
+        )
+        archive_group.add_argument(
+            '--replay',
+            type=str,
+            help='Crawl from a recorded archive instead of the network'
+        )
+        parser.add_argument(
+            '--crawl-key',
+            type=str,
+            help='Crawl to resume (defaults to today\'s crawl)'
+        )
 
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('🚀 Starting internship scraping...'))
@@ -31,7 +59,14 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR(f"❌ Error reading file: {e}"))
                 return
         
-        result = scrape_internship_opportunities(html_content=html_content)
+        result = scrape_internship_opportunities(
+            html_content=html_content,
+            crawl_key=options['crawl_key'],
+            max_pages=options['max_pages'],
+            max_items=options['max_items'],
+            record_to=options['record'],
+            replay_from=options['replay'],
+        )
         
         self.stdout.write(self.style.SUCCESS(f'\n{result}'))
         self.stdout.write(self.style.SUCCESS('\n✅ Scraping completed!'))
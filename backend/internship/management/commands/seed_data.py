@@ -0,0 +1,369 @@
+"""
+Management command to fill the database with synthetic data at a realistic
+shape, for load tests (benchmarks/locustfile.py) and query plans
+Usage: python manage.py seed_data [--scale N] [--students N] [--offers N] ... [--seed N]
+       python manage.py seed_data --flush
+
+Every seeded user is named <prefix>_<role>_<n> (e.g. seed_student_0) and
+shares --password. Rows are written with bulk_create, so save() hooks and
+signals do not run.
+"""
+
+import math
+import random
+from contextlib import contextmanager
+from datetime import time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from authentication.models import Role
+from internship.models import (
+    Internship, InternshipApplication, InternshipOffer, InterviewSlot, Jury, Notification, Room,
+    Soutenance, TeacherInvitation
+)
+from report.models import Report, ReportVersion, ReviewComment
+
+User = get_user_model()
+
+# Defaults at --scale 1: a mid-sized school over one academic year
+VOLUMES = {
+    'students': 2000,
+    'teachers': 120,
+    'companies': 200,
+    'administrators': 5,
+    'offers': 1500,
+    'applications': 15000,
+    'internships': 1500,
+    'reports': 1100,
+    'soutenances': 600,
+    'notifications': 60000,
+    'rooms': 25,
+}
+ROLES = {
+    'students': 'Student',
+    'teachers': 'Teacher',
+    'companies': 'Company',
+    'administrators': 'Administrator',
+}
+BATCH_SIZE = 1000
+
+FIRST_NAMES = ['Amine', 'Yasmine', 'Mohamed', 'Sarra', 'Youssef', 'Ines', 'Khalil', 'Mariem', 'Omar', 'Nour']
+LAST_NAMES = ['Ben Ali', 'Trabelsi', 'Gharbi', 'Jaziri', 'Hammami', 'Mejri', 'Bouazizi', 'Chaabane']
+CITIES = ['Tunis', 'Sfax', 'Sousse', 'Ariana', 'Monastir', 'Nabeul', 'Bizerte', 'Remote']
+TOPICS = [
+    'Backend developer', 'Frontend developer', 'Data engineer', 'DevOps engineer', 'Mobile developer',
+    'Machine learning', 'Cybersecurity analyst', 'QA automation', 'Embedded systems', 'Business analyst',
+]
+STACKS = ['Django', 'React', 'Spring Boot', 'Flutter', 'Kubernetes', 'PostgreSQL', 'PyTorch', 'Angular', 'Go']
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Keep the created_at/updated_at set on the instances instead of now()"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def zipf_weights(count, exponent=1.0):
+    """A few very popular items and a long tail (offers per company, applications per offer)"""
+    return [1 / math.pow(rank + 1, exponent) for rank in range(count)]
+
+
+class Command(BaseCommand):
+    help = 'Seed synthetic users, offers, applications, internships, reports, soutenances and notifications'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1, help='Multiplier of every default volume')
+        for name, default in VOLUMES.items():
+            parser.add_argument(
+                f"--{name}", type=int, help=f"Number of {name} (default {default} x scale)"
+            )
+        parser.add_argument('--seed', type=int, default=42, help='Random seed, the same seed gives the same data')
+        parser.add_argument('--prefix', default='seed', help='Username prefix of the seeded users')
+        parser.add_argument('--password', default='LoadTest123!', help='Password of every seeded user')
+        parser.add_argument('--flush', action='store_true', help='Delete the data seeded with --prefix and stop')
+
+    def handle(self, *args, **options):
+        self.prefix = options['prefix']
+        if options['flush']:
+            self.flush()
+            return
+        if User.objects.filter(username__startswith=f"{self.prefix}_").exists():
+            raise CommandError(f"Data seeded with prefix '{self.prefix}' exists, run with --flush first")
+
+        volumes = {
+            name: options[name] if options[name] is not None else max(1, round(default * options['scale']))
+            for name, default in VOLUMES.items()
+        }
+        self.rng = random.Random(options['seed'])
+        self.now = timezone.now()
+        with transaction.atomic():
+            users = self.seed_users(volumes, make_password(options['password']))
+            rooms = self.seed_rooms(volumes['rooms'])
+            offers = self.seed_offers(users['companies'], volumes['offers'])
+            self.seed_applications(offers, users['students'], volumes['applications'])
+            internships = self.seed_internships(users['students'], users['teachers'], volumes['internships'])
+            reports = self.seed_reports(internships, volumes['reports'])
+            self.seed_soutenances(reports, rooms, users['teachers'], volumes['soutenances'])
+            self.seed_notifications(users, volumes['notifications'])
+
+        for model in (User, InternshipOffer, InternshipApplication, Internship, Report, ReportVersion,
+                      Soutenance, Notification):
+            self.stdout.write(f"{model.__name__}: {model.objects.count()}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded with prefix '{self.prefix}', log in as {self.prefix}_student_0 with the --password given"
+        ))
+
+    def flush(self):
+        # Everything else hangs off the users (CASCADE)
+        deleted, _ = User.objects.filter(username__startswith=f"{self.prefix}_").delete()
+        rooms, _ = Room.objects.filter(name__startswith=f"{self.prefix} ").delete()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted + rooms} rows"))
+
+    def ago(self, max_days, min_days=0):
+        return self.now - timedelta(days=self.rng.uniform(min_days, max_days))
+
+    def between(self, start, end):
+        return start + (end - start) * self.rng.random()
+
+    def create(self, model, rows, timestamps=False):
+        if timestamps:
+            with explicit_timestamps(model):
+                model.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+        else:
+            model.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+        self.stdout.write(f"  {len(rows)} {model._meta.verbose_name_plural}")
+
+    def seed_users(self, volumes, password):
+        users = {}
+        for name, role_name in ROLES.items():
+            role = Role.objects.get_or_create(name=role_name)[0]
+            rows = []
+            for i in range(volumes[name]):
+                joined = self.ago(700, 1)
+                # deactivate_inactive_users disables accounts idle for six months, the others logged in since
+                never_logged_in = joined > self.now - timedelta(days=150) and self.rng.random() < 0.2
+                last_login = None if never_logged_in else self.between(
+                    max(joined, self.now - timedelta(days=170)), self.now
+                )
+                rows.append(User(
+                    username=f"{self.prefix}_{role_name.lower()}_{i}",
+                    email=f"{self.prefix}_{role_name.lower()}_{i}@example.com",
+                    first_name=self.rng.choice(FIRST_NAMES), last_name=self.rng.choice(LAST_NAMES),
+                    password=password, role=role, is_enabled=True, email_verified=True, date_joined=joined,
+                    last_login_time=last_login,
+                    updated_at=joined,
+                ))
+            self.create(User, rows, timestamps=True)
+            users[name] = list(User.objects.filter(role=role, username__startswith=f"{self.prefix}_").values_list('id', flat=True))
+        return users
+
+    def seed_rooms(self, count):
+        rows = [
+            Room(name=f"{self.prefix} {block}{i}", building=f"Block {block}", capacity=self.rng.choice([20, 30, 40, 80]),
+                 floor=str(i % 4), equipment='Projector')
+            for i in range(count)
+            for block in [self.rng.choice('ABCD')]
+        ]
+        self.create(Room, rows)
+        return list(Room.objects.filter(name__startswith=f"{self.prefix} ").values_list('id', flat=True))
+
+    def seed_offers(self, companies, count):
+        # A few companies post most offers; most offers are approved, recent ones may still be pending
+        weights = zipf_weights(len(companies))
+        rows = []
+        for i in range(count):
+            created = self.ago(365)
+            recent = created > self.now - timedelta(days=14)
+            topic = self.rng.choice(TOPICS)
+            stack = ', '.join(self.rng.sample(STACKS, 3))
+            rows.append(InternshipOffer(
+                company_id=self.rng.choices(companies, weights)[0],
+                title=f"{topic} intern ({stack.split(',')[0]})",
+                description=f"Join our team as a {topic.lower()} intern and work with {stack}. " * 4,
+                requirements=stack, type=self.rng.choices(['PFE', 'Stage', 'Internship'], [6, 3, 1])[0],
+                location=self.rng.choice(CITIES), duration=self.rng.choice(['2 months', '4 months', '6 months']),
+                start_date=(created + timedelta(days=60)).date(), end_date=(created + timedelta(days=240)).date(),
+                positions_available=self.rng.choices([1, 2, 3, 5], [50, 30, 15, 5])[0],
+                status=self.rng.choices([0, 1, 2, 3], [60, 30, 5, 5] if recent else [1, 70, 6, 23])[0],
+                created_at=created, updated_at=self.between(created, self.now),
+            ))
+        self.create(InternshipOffer, rows, timestamps=True)
+        return list(InternshipOffer.objects.filter(
+            company__username__startswith=f"{self.prefix}_"
+        ).values_list('id', 'status', 'created_at'))
+
+    def seed_applications(self, offers, students, count):
+        # Students apply to approved or closed offers; popularity is heavy-tailed on both sides
+        open_offers = [offer for offer in offers if offer[1] in (1, 3)]
+        if not open_offers or not students:
+            return
+        offer_weights = zipf_weights(len(open_offers), 0.8)
+        student_weights = [self.rng.lognormvariate(0, 1) for _ in students]
+        pairs = {}
+        for _ in range(count * 2):
+            if len(pairs) >= count:
+                break
+            offer = self.rng.choices(open_offers, offer_weights)[0]
+            student = self.rng.choices(students, student_weights)[0]
+            pairs.setdefault((offer[0], student), offer[2])
+        rows = []
+        for (offer_id, student_id), offer_created in pairs.items():
+            created = self.between(offer_created, self.now)
+            rows.append(InternshipApplication(
+                offer_id=offer_id, student_id=student_id, cover_letter="I am very interested in this position.",
+                cv_file=f"application_cvs/{self.prefix}_{student_id}.pdf", cv_file_mime_type='application/pdf',
+                cv_file_size=self.rng.randint(80_000, 900_000), cv_file_page_count=self.rng.randint(1, 3),
+                status=self.rng.choices([0, 1, 2, 3], [35, 15, 10, 40])[0],
+                created_at=created, updated_at=self.between(created, self.now),
+            ))
+        self.create(InternshipApplication, rows, timestamps=True)
+
+        # Interviewing offers publish a few slots, some of them booked
+        interviewing = InternshipApplication.objects.filter(
+            status=1, offer__company__username__startswith=f"{self.prefix}_"
+        ).values_list('offer_id', flat=True).distinct()
+        slots = [
+            InterviewSlot(
+                offer_id=offer_id, date=(self.now + timedelta(days=self.rng.randint(1, 20))).date(),
+                start_time=time(9 + n), end_time=time(10 + n), location='Online', is_booked=self.rng.random() < 0.4
+            )
+            for offer_id in interviewing
+            for n in range(self.rng.randint(2, 5))
+        ]
+        self.create(InterviewSlot, slots)
+
+    def seed_internships(self, students, teachers, count):
+        # One internship per student at most; pending ones still wait for a supervisor
+        rows = []
+        for student_id in self.rng.sample(students, min(count, len(students))):
+            created = self.ago(300)
+            status = self.rng.choices([0, 1, 2, 3, 4], [8, 10, 4, 48, 30])[0]
+            rows.append(Internship(
+                student_id_id=student_id, teacher_id_id=self.rng.choice(teachers) if teachers and status else None,
+                type=self.rng.choices(['PFE', 'Stage', 'Internship'], [6, 3, 1])[0],
+                company_name=self.rng.choice(['Vermeg', 'Sofrecom', 'Talan', 'Proxym', 'Instadeep', 'Telnet']),
+                title=f"{self.rng.choice(TOPICS)} internship", description='Internship project',
+                start_date=(created + timedelta(days=15)).date(), end_date=(created + timedelta(days=195)).date(),
+                status=status, created_at=created, updated_at=self.between(created, self.now),
+            ))
+        self.create(Internship, rows, timestamps=True)
+        internships = list(Internship.objects.filter(
+            student_id__username__startswith=f"{self.prefix}_"
+        ).values_list('id', 'student_id_id', 'teacher_id_id', 'status', 'created_at'))
+        self.create(TeacherInvitation, [
+            TeacherInvitation(internship_id=id, student_id=student_id, teacher_id=teacher_id, status=1,
+                              message='Would you supervise my internship?')
+            for id, student_id, teacher_id, status, _ in internships if teacher_id
+        ])
+        return internships
+
+    def seed_reports(self, internships, count):
+        # Only started or finished internships have a report, with 1-4 versions
+        eligible = [internship for internship in internships if internship[3] in (3, 4)]
+        chosen = self.rng.sample(eligible, min(count, len(eligible)))
+        rows = []
+        for id, student_id, _, status, created in chosen:
+            report_created = self.between(created, self.now)
+            rows.append(Report(
+                internship_id=id, student_id=student_id, title=f"Internship report {id}",
+                description='Final internship report', is_final=status == 4 and self.rng.random() < 0.8,
+                created_at=report_created, updated_at=self.between(report_created, self.now),
+            ))
+        self.create(Report, rows, timestamps=True)
+        teachers = {internship[0]: internship[2] for internship in chosen}
+        reports = list(Report.objects.filter(
+            student__username__startswith=f"{self.prefix}_"
+        ).values_list('id', 'internship_id', 'is_final', 'created_at'))
+
+        versions = []
+        for id, internship_id, is_final, created in reports:
+            last = self.rng.choices([1, 2, 3, 4], [35, 35, 20, 10])[0]
+            for number in range(1, last + 1):
+                submitted = self.between(created, self.now)
+                # Earlier versions were reviewed; the latest may still be a draft or waiting for review
+                if is_final and number == last:
+                    status = 'approved'
+                elif number < last:
+                    status = 'rejected'
+                else:
+                    status = self.rng.choices(['draft', 'pending', 'approved', 'rejected'], [15, 25, 40, 20])[0]
+                reviewed = status in ('approved', 'rejected')
+                versions.append(ReportVersion(
+                    report_id=id, version_number=number, file=f"reports/versions/{self.prefix}_{id}_v{number}.pdf",
+                    file_size=self.rng.randint(500_000, 8_000_000), file_mime_type='application/pdf',
+                    file_page_count=self.rng.randint(30, 120), status=status,
+                    submitted_at=submitted if status != 'draft' else None,
+                    reviewed_at=submitted + timedelta(days=3) if reviewed else None,
+                    reviewed_by_id=teachers[internship_id] if reviewed else None,
+                    is_final=is_final and number == last, created_at=submitted, updated_at=submitted,
+                ))
+        self.create(ReportVersion, versions, timestamps=True)
+
+        comments = [
+            ReviewComment(
+                version_id=version_id, teacher_id=reviewer, comment='Please clarify this section.',
+                page_number=self.rng.randint(1, 30), is_resolved=self.rng.random() < 0.6
+            )
+            for version_id, reviewer in ReportVersion.objects.filter(
+                report__student__username__startswith=f"{self.prefix}_", reviewed_by__isnull=False
+            ).values_list('id', 'reviewed_by_id')
+            for _ in range(self.rng.choices([0, 1, 2, 3], [40, 30, 20, 10])[0])
+        ]
+        self.create(ReviewComment, comments)
+        return reports
+
+    def seed_soutenances(self, reports, rooms, teachers, count):
+        # Final reports get a defense; past ones are done and graded
+        final = [report for report in reports if report[2]] or reports
+        rows = []
+        for _, internship_id, _, _ in self.rng.sample(final, min(count, len(final))):
+            day = (self.now + timedelta(days=self.rng.randint(-120, 30))).date()
+            done = day < self.now.date()
+            rows.append(Soutenance(
+                internship_id=internship_id, date=day, time=time(self.rng.randint(8, 16)),
+                room_id=self.rng.choice(rooms) if rooms else None, status='Done' if done else 'Planned',
+                grade=round(self.rng.uniform(10, 19), 1) if done else None,
+            ))
+        self.create(Soutenance, rows)
+        self.create(Jury, [
+            Jury(soutenance_id=soutenance_id, member_id=member)
+            for soutenance_id in Soutenance.objects.filter(
+                internship__student_id__username__startswith=f"{self.prefix}_"
+            ).values_list('id', flat=True)
+            for member in self.rng.sample(teachers, min(2, len(teachers)))
+        ])
+
+    def seed_notifications(self, users, count):
+        # Students get most of them; older notifications are usually read
+        recipients = users['students'] + users['companies'] + users['teachers'] + users['administrators']
+        weights = (
+            [3.0] * len(users['students']) + [2.0] * len(users['companies'])
+            + [1.0] * len(users['teachers']) + [0.5] * len(users['administrators'])
+        )
+        kinds = [Notification.KIND_APPLICATION, Notification.KIND_OFFER, Notification.KIND_SOUTENANCE,
+                 Notification.KIND_GENERAL]
+        rows = []
+        for recipient in self.rng.choices(recipients, weights, k=count) if recipients else []:
+            created = self.ago(120)
+            kind = self.rng.choices(kinds, [50, 25, 10, 15])[0]
+            rows.append(Notification(
+                recipient_id=recipient, kind=kind, message=f"Update on your {kind}",
+                is_read=self.rng.random() < (0.95 if created < self.now - timedelta(days=7) else 0.4),
+                created_at=created,
+            ))
+        self.create(Notification, rows, timestamps=True)
@@ -2,6 +2,8 @@ from django.db import models
 from django.conf import settings
 from django.utils import timezone
 
+from .file_metadata import capture_file_metadata
+
 # Create your models here.
 class Internship(models.Model):
     STATUS_CHOICES = [
@@ -31,6 +33,11 @@ class Internship(models.Model):
     type = models.CharField(max_length=100)
     company_name = models.CharField(max_length=255)
     cahier_de_charges = models.FileField(upload_to='cahiers_de_charges/', blank=True, null=True)
+    # Captured at upload, see file_metadata
+    cahier_de_charges_size = models.PositiveBigIntegerField(null=True, blank=True)
+    cahier_de_charges_sha256 = models.CharField(max_length=64, null=True, blank=True)
+    cahier_de_charges_mime_type = models.CharField(max_length=100, null=True, blank=True)
+    cahier_de_charges_page_count = models.PositiveIntegerField(null=True, blank=True)
     status = models.IntegerField(choices=STATUS_CHOICES, default=0)
     start_date = models.DateField()
     description = models.TextField(null=True, blank=True)
@@ -41,9 +48,17 @@ class Internship(models.Model):
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = capture_file_metadata(self, 'cahier_de_charges', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Admin review queue, in ListPagination order
+            models.Index(fields=['status', '-id'], name='internship_status_idx'),
+        ]
     
 class Room(models.Model):
     """Available rooms for soutenances"""
@@ -120,6 +135,13 @@ class Soutenance(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Planned')
     grade= models.FloatField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['date', 'time', 'id'], name='soutenance_date_idx'),
+            # check_soutenance_status (internship.tasks), only the planned ones are indexed (Done rows pile up)
+            models.Index(fields=['date'], condition=models.Q(status='Planned'), name='soutenance_planned_idx'),
+        ]
+
     def __str__(self):
         return f"Soutenance for {self.internship} on {self.date} at {self.time}"
     
@@ -139,22 +161,91 @@ class Jury(models.Model):
         return f"Jury member {self.member} for {self.soutenance}"
 
 class Notification(models.Model):
+    KIND_GENERAL = 'general'
+    KIND_SOUTENANCE = 'soutenance'
+    KIND_APPLICATION = 'application'
+    KIND_OFFER = 'offer'
+    KIND_CHOICES = [
+        (KIND_GENERAL, 'General'),
+        (KIND_SOUTENANCE, 'Soutenance'),
+        (KIND_APPLICATION, 'Application'),
+        (KIND_OFFER, 'Offer'),
+    ]
+
     recipient = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name='notifications'
     )
     message = models.TextField()
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default=KIND_GENERAL)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Digests: events sharing a digest_key within a short window are merged into one row
+    digest_key = models.CharField(max_length=100, blank=True, default='')
+    # The row new events of its digest_key are merged into, until it is read or its window ends
+    digest_open = models.BooleanField(default=False)
+    count = models.PositiveIntegerField(default=1)
+    details = models.JSONField(default=list, blank=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Unread counts and the per-user feed
+            models.Index(fields=['recipient', 'is_read', '-created_at'], name='notification_feed_idx'),
+        ]
+        constraints = [
+            # Concurrent first events of a digest cannot open two rows
+            models.UniqueConstraint(
+                fields=['recipient', 'digest_key'], condition=models.Q(digest_open=True),
+                name='notification_open_digest'
+            ),
+        ]
 
     def __str__(self):
         return f"Notification for {self.recipient}: {self.message}"
 
 
+class ArchivedNotification(models.Model):
+    """Read notifications moved out of the Notification table by the retention job"""
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_notifications'
+    )
+    message = models.TextField()
+    kind = models.CharField(max_length=20, choices=Notification.KIND_CHOICES, default=Notification.KIND_GENERAL)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Archived notification for {self.recipient}: {self.message}"
+
+
+class InternshipOfferQuerySet(models.QuerySet):
+    def with_stats(self, user=None):
+        """
+        Annotate application counts (and whether `user` applied, with the status
+        of their application) and join the company, so serializing a list of
+        offers takes a constant number of queries
+        """
+        queryset = self.select_related('company').annotate(
+            num_applications=models.Count('applications'),
+            num_approved_applications=models.Count('applications', filter=models.Q(applications__status=1)),
+            num_pending_applications=models.Count('applications', filter=models.Q(applications__status=0)),
+        )
+        if user is not None and user.is_authenticated:
+            user_applications = InternshipApplication.objects.filter(offer=models.OuterRef('pk'), student=user)
+            queryset = queryset.annotate(
+                applied_by_user=models.Exists(user_applications),
+                user_application_status=models.Subquery(user_applications.values('status')[:1]),
+            )
+        return queryset
+
+
 class InternshipOffer(models.Model):
     """Internship offers posted by companies"""
     STATUS_CHOICES = [
@@ -189,20 +280,54 @@ class InternshipOffer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = InternshipOfferQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Browse and admin review lists, in ListPagination order
+            models.Index(fields=['status', '-created_at', '-id'], name='offer_status_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.company.username}"
 
     @property
     def applications_count(self):
+        # Annotated by InternshipOffer.objects.with_stats()
+        if hasattr(self, 'num_applications'):
+            return self.num_applications
         return self.applications.count()
     
     @property
     def approved_applications_count(self):
+        if hasattr(self, 'num_approved_applications'):
+            return self.num_approved_applications
         return self.applications.filter(status=1).count()
 
+    @property
+    def pending_applications_count(self):
+        if hasattr(self, 'num_pending_applications'):
+            return self.num_pending_applications
+        return self.applications.filter(status=0).count()
+
+
+class InternshipApplicationQuerySet(models.QuerySet):
+    def with_related(self, user=None):
+        """
+        Load everything InternshipApplicationSerializer reads in a fixed number
+        of queries: student and selected slot are joined, offers come with their
+        stats (see InternshipOfferQuerySet.with_stats) and unbooked slots
+        """
+        return self.select_related('student', 'selected_interview_slot').prefetch_related(
+            models.Prefetch('offer', queryset=InternshipOffer.objects.with_stats(user)),
+            models.Prefetch(
+                'offer__interview_slots',
+                queryset=InterviewSlot.objects.filter(is_booked=False),
+                to_attr='unbooked_slots'
+            ),
+        )
+
 
 class InternshipApplication(models.Model):
     """Student applications to internship offers"""
@@ -225,6 +350,11 @@ class InternshipApplication(models.Model):
     )
     cover_letter = models.TextField(blank=True, null=True)
     cv_file = models.FileField(upload_to='application_cvs/', blank=True, null=True)
+    # Captured at upload, see file_metadata
+    cv_file_size = models.PositiveBigIntegerField(null=True, blank=True)
+    cv_file_sha256 = models.CharField(max_length=64, null=True, blank=True)
+    cv_file_mime_type = models.CharField(max_length=100, null=True, blank=True)
+    cv_file_page_count = models.PositiveIntegerField(null=True, blank=True)
     status = models.IntegerField(choices=STATUS_CHOICES, default=0)
     company_feedback = models.TextField(blank=True, null=True)
     match_score = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)  # AI-calculated match percentage
@@ -251,13 +381,24 @@ class InternshipApplication(models.Model):
         related_name='source_application'
     )
 
+    objects = InternshipApplicationQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         unique_together = ['offer', 'student']  # One application per student per offer
+        indexes = [
+            # Student and company application lists, in ListPagination order
+            models.Index(fields=['student', '-created_at', '-id'], name='application_student_idx'),
+            models.Index(fields=['offer', '-created_at', '-id'], name='application_offer_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.username} -> {self.offer.title}"
 
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = capture_file_metadata(self, 'cv_file', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
+
 
 class InterviewSlot(models.Model):
     """Available interview time slots created by companies"""
@@ -278,3 +419,82 @@ class InterviewSlot(models.Model):
 
     def __str__(self):
         return f"{self.offer.title} - {self.date} {self.start_time}-{self.end_time}"
+
+
+class CrawlPage(models.Model):
+    """Listing page in the scraper crawl frontier, shared by all crawl workers"""
+    STATUS_CHOICES = [
+        (0, 'Pending'),
+        (1, 'In Progress'),
+        (2, 'Done'),
+        (3, 'Failed'),
+    ]
+
+    crawl_key = models.CharField(max_length=64)  # Identifies one crawl, e.g. the nightly run date
+    source = models.CharField(max_length=50)
+    page = models.PositiveIntegerField()
+    url = models.URLField(max_length=500)
+    status = models.IntegerField(choices=STATUS_CHOICES, default=0)
+    items_found = models.IntegerField(default=0)
+    attempts = models.IntegerField(default=0)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['crawl_key', 'source', 'page']
+        unique_together = ['crawl_key', 'source', 'page']
+
+    def __str__(self):
+        return f"{self.crawl_key} {self.source} page {self.page} ({self.get_status_display()})"
+
+
+class ScrapeSource(models.Model):
+    """Health of an external scraping source"""
+    name = models.CharField(max_length=50, unique=True)
+    is_enabled = models.BooleanField(default=True)
+    consecutive_failures = models.IntegerField(default=0)
+    last_success_at = models.DateTimeField(null=True, blank=True)
+    last_failure_at = models.DateTimeField(null=True, blank=True)
+    disabled_at = models.DateTimeField(null=True, blank=True)  # Set when disabled automatically
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return f"{self.name} ({'enabled' if self.is_enabled else 'disabled'})"
+
+
+class ScrapeRun(models.Model):
+    """Metrics of one scraping run of one source (one row per crawl, shared by its workers)"""
+    source = models.CharField(max_length=50)
+    crawl_key = models.CharField(max_length=64, blank=True)
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField()
+    pages_fetched = models.IntegerField(default=0)
+    bytes_fetched = models.BigIntegerField(default=0)
+    fetch_errors = models.IntegerField(default=0)
+    latency_p50_ms = models.FloatField(null=True, blank=True)
+    latency_p95_ms = models.FloatField(null=True, blank=True)
+    latency_max_ms = models.FloatField(null=True, blank=True)
+    parse_failures = models.IntegerField(default=0)
+    items_created = models.IntegerField(default=0)
+    duplicates_skipped = models.IntegerField(default=0)
+    succeeded = models.BooleanField(null=True, default=True)  # None while the crawl is still running
+
+    class Meta:
+        ordering = ['-started_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['crawl_key', 'source'], condition=~models.Q(crawl_key=''), name='scrape_run_per_crawl'
+            ),
+        ]
+
+    def __str__(self):
+        outcome = 'running' if self.succeeded is None else 'ok' if self.succeeded else 'failed'
+        return f"{self.source} run at {self.started_at:%Y-%m-%d %H:%M} ({outcome})"
+
+    @property
+    def duration_seconds(self):
+        return (self.finished_at - self.started_at).total_seconds()
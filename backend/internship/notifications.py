@@ -0,0 +1,262 @@
+"""
+Notification dispatcher.
+
+notify() stores the notifications of all recipients with one bulk insert and
+pushes them to the users' websocket groups in a single async batch once the
+surrounding transaction commits, so a rolled-back change is never announced.
+
+Each user's unread count is kept in the cache (Redis) and updated by notify()
+and the mark-read views, so the navbar badge does not need a COUNT query.
+A missing counter is rebuilt from the database on the next read.
+
+Besides its own user_{id} group, every socket joins broadcast groups
+(role_{name}, offer_{id} for applicants, soutenance_{id} for jury members),
+so broadcast() reaches a whole audience with a single channel-layer message.
+
+notify_digest() coalesces bursts of similar events (e.g. applications to
+one offer) into a single unread notification per window.
+"""
+
+import asyncio
+import logging
+import re
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from .models import Notification
+from .presence import online_user_ids
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+# Counters expire now and then so any drift heals itself
+UNREAD_COUNT_TIMEOUT = 60 * 60 * 24
+BULK_BATCH_SIZE = 1000
+DEFAULT_DIGEST_WINDOW = 15 * 60
+
+# Bump the counters that are cached (missing ones are rebuilt on read) and
+# drop any that went negative, for a whole batch of users in one round trip
+ADJUST_UNREAD_COUNTS_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 and redis.call('INCRBY', key, ARGV[1]) < 0 then
+        redis.call('DEL', key)
+    end
+end
+"""
+
+
+def notify(recipients, message, kind=Notification.KIND_GENERAL, push=True):
+    """
+    Notify every recipient (users, None entries are ignored) with the same message.
+    push=False leaves the websocket delivery to the caller (see broadcast()).
+    Returns the created Notification rows
+    """
+    unique_recipients = {}
+    for recipient in recipients:
+        if recipient is not None:
+            unique_recipients.setdefault(recipient.pk, recipient)
+
+    notifications = Notification.objects.bulk_create([
+        Notification(recipient=recipient, message=message, kind=kind)
+        for recipient in unique_recipients.values()
+    ], batch_size=BULK_BATCH_SIZE)
+    if notifications:
+        transaction.on_commit(lambda: adjust_unread_counts(list(unique_recipients), 1))
+        if push:
+            transaction.on_commit(lambda: push_notifications(notifications))
+    return notifications
+
+
+def notify_digest(recipient, digest_key, message, digest_message, kind=Notification.KIND_GENERAL, detail=None):
+    """
+    Notify a recipient, merging into their unread notification with the same
+    digest_key if it was started less than settings.NOTIFICATION_DIGEST_WINDOW
+    seconds ago. A merge only bumps the count, rewrites the message with
+    digest_message(count) and appends `detail`: no new row, no push.
+    Returns the notification the event ended up in
+    """
+    window = getattr(settings, 'NOTIFICATION_DIGEST_WINDOW', DEFAULT_DIGEST_WINDOW)
+    with transaction.atomic():
+        # Close the open digest once it is read or its window is over
+        Notification.objects.filter(
+            Q(is_read=True) | Q(created_at__lt=timezone.now() - timedelta(seconds=window)),
+            recipient=recipient, digest_key=digest_key, digest_open=True
+        ).update(digest_open=False)
+
+        # The open row is unique: a concurrent first event fails to insert its
+        # own, waits for this one and merges into it
+        digest, created = Notification.objects.select_for_update().get_or_create(
+            recipient=recipient, digest_key=digest_key, digest_open=True,
+            defaults={
+                'message': message,
+                'kind': kind,
+                'details': [detail] if detail is not None else [],
+            }
+        )
+        if created:
+            transaction.on_commit(lambda: adjust_unread_counts([recipient.pk], 1))
+            transaction.on_commit(lambda: push_notifications([digest]))
+            return digest
+
+        digest.count += 1
+        digest.message = digest_message(digest.count)
+        if detail is not None:
+            digest.details.append(detail)
+        digest.save(update_fields=['count', 'message', 'details'])
+        return digest
+
+
+def role_group(role_name):
+    # Group names only allow ASCII letters, digits, hyphens, underscores and periods
+    return f"role_{re.sub(r'[^a-z0-9_.-]', '_', role_name.lower())}"
+
+
+def offer_group(offer_id):
+    return f"offer_{offer_id}"
+
+
+def soutenance_group(soutenance_id):
+    return f"soutenance_{soutenance_id}"
+
+
+def broadcast(group, recipients, message, kind=Notification.KIND_GENERAL):
+    """
+    Notify everyone in `recipients` (the members of `group`) through one bulk
+    insert and one group_send to the broadcast group, after commit.
+    Returns the created Notification rows
+    """
+    notifications = notify(recipients, message, kind, push=False)
+    if notifications:
+        ids = [notification.id for notification in notifications]
+        event = {
+            "type": "send_notification",
+            # The same small payload for every member (the channel layer copies it
+            # into each socket's queue): sockets look up their own row in the range
+            "id_range": [min(ids), max(ids)],
+            "message": message,
+            "kind": kind,
+            "created_at": notifications[0].created_at.isoformat(),
+        }
+        transaction.on_commit(lambda: _group_send_all([(group, event)]))
+    return notifications
+
+
+def announce_to_role(role_name, message, kind=Notification.KIND_GENERAL):
+    """Announcement to every active user of a role"""
+    recipients = User.objects.filter(role__name=role_name, is_active=True).only('id')
+    return broadcast(role_group(role_name), recipients, message, kind)
+
+
+def announce_to_offer_applicants(offer_id, message, kind=Notification.KIND_OFFER):
+    """Announcement to every student who applied to an offer"""
+    recipients = User.objects.filter(internship_applications__offer_id=offer_id).distinct().only('id')
+    return broadcast(offer_group(offer_id), recipients, message, kind)
+
+
+def announce_to_soutenance_jury(soutenance_id, message, kind=Notification.KIND_SOUTENANCE):
+    """Announcement to the jury members of a soutenance"""
+    recipients = User.objects.filter(jury_memberships__soutenance_id=soutenance_id).distinct().only('id')
+    return broadcast(soutenance_group(soutenance_id), recipients, message, kind)
+
+
+def subscribe(user_ids, group):
+    """Make the open sockets of these users join a broadcast group, after commit"""
+    event = {"type": "subscribe", "group": group}
+
+    def send():
+        online = online_user_ids(user_ids)
+        _group_send_all([(f"user_{user_id}", event) for user_id in (user_ids if online is None else online)])
+
+    transaction.on_commit(send)
+
+
+def unread_count_key(user_id):
+    return f"notifications:unread:{user_id}"
+
+
+def get_unread_count(user):
+    """Unread notifications of a user, from the cache or rebuilt from the database"""
+    count = cache.get(unread_count_key(user.pk))
+    if count is None:
+        count = Notification.objects.filter(recipient=user, is_read=False).count()
+        cache.set(unread_count_key(user.pk), count, timeout=UNREAD_COUNT_TIMEOUT)
+    return count
+
+
+def adjust_unread_counts(user_ids, delta):
+    """
+    Add delta to the cached counters; counters not cached yet are left to be
+    rebuilt. On Redis this is one script call per BULK_BATCH_SIZE users
+    """
+    user_ids = list(user_ids)
+    try:
+        redis = get_redis_connection('default')
+    except NotImplementedError:
+        # Not a Redis cache (tests, local development): in-process, one call per counter is cheap
+        for user_id in user_ids:
+            try:
+                if cache.incr(unread_count_key(user_id), delta) < 0:
+                    cache.delete(unread_count_key(user_id))
+            except ValueError:
+                # Counter not cached
+                pass
+        return
+
+    try:
+        for start in range(0, len(user_ids), BULK_BATCH_SIZE):
+            keys = [cache.make_key(unread_count_key(user_id)) for user_id in user_ids[start:start + BULK_BATCH_SIZE]]
+            redis.eval(ADJUST_UNREAD_COUNTS_SCRIPT, len(keys), *keys, delta)
+    except RedisError as e:
+        # Counters that missed the update heal when they expire
+        logger.warning(f"Could not adjust {len(user_ids)} unread counters: {e}")
+
+
+def reset_unread_count(user):
+    cache.set(unread_count_key(user.pk), 0, timeout=UNREAD_COUNT_TIMEOUT)
+
+
+def push_notifications(notifications):
+    """
+    Send notifications to the websocket group of their recipient, all in one
+    batch. Recipients without an open socket are skipped (see presence),
+    unless presence is unknown.
+    """
+    online = online_user_ids({notification.recipient_id for notification in notifications})
+    _group_send_all([
+        (f"user_{notification.recipient_id}", {
+            "type": "send_notification",
+            "id": notification.id,
+            "message": notification.message,
+            "kind": notification.kind,
+            "created_at": notification.created_at.isoformat(),
+        })
+        for notification in notifications
+        if online is None or notification.recipient_id in online
+    ])
+
+
+def _group_send_all(events):
+    """Send (group, event) pairs through the channel layer concurrently"""
+    channel_layer = get_channel_layer()
+    if channel_layer is None or not events:
+        return
+
+    async def send_all():
+        await asyncio.gather(*(channel_layer.group_send(group, event) for group, event in events))
+
+    try:
+        async_to_sync(send_all)()
+    except Exception as e:
+        # Notifications are already stored, users will see them on their next fetch
+        logger.warning(f"Could not push {len(events)} websocket events: {e}")
@@ -0,0 +1,116 @@
+"""
+Websocket presence, kept in the Redis instance of the default cache.
+
+Every open notification socket registers itself with an expiry, and
+NotificationConsumer refreshes it with a heartbeat. Sockets that die without
+a clean disconnect simply expire. Per user there is a plain key (SETEX)
+telling whether any socket is open, and a sorted set of the user's sockets
+scored by expiry, so closing one socket keeps the user online while another
+is still open. Per role a sorted set of user ids scored by expiry is counted
+with ZCOUNT. Every update is a handful of O(log n) commands sent in one
+MULTI, whatever the number of users online.
+
+The notification dispatcher uses it to skip channel-layer sends to users who
+have no open socket; their notifications are still stored. When Redis cannot
+be reached presence is unknown and everyone is pushed to. Redis must not
+evict these keys: an evicted key makes an online user look offline and their
+pushes are silently dropped (they still get the notifications on their next
+fetch or reconnection). Run it with maxmemory-policy noeviction, or give
+presence a Redis of its own. With a cache that is not django_redis presence
+is always unknown.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRESENCE_TTL = 60
+
+
+def presence_ttl():
+    return getattr(settings, 'NOTIFICATION_PRESENCE_TTL', DEFAULT_PRESENCE_TTL)
+
+
+def user_presence_key(user_id):
+    return f"presence:user:{user_id}"
+
+
+def user_sockets_key(user_id):
+    return f"presence:sockets:{user_id}"
+
+
+def role_presence_key(role_name):
+    return f"presence:role:{role_name}"
+
+
+def mark_online(user_id, role_name, channel_name):
+    """Register (or refresh) one open socket of a user"""
+    now = time.time()
+    ttl = presence_ttl()
+    try:
+        pipe = get_redis_connection('default').pipeline()
+        pipe.zadd(user_sockets_key(user_id), {channel_name: now + ttl})
+        pipe.expire(user_sockets_key(user_id), ttl)
+        pipe.setex(user_presence_key(user_id), ttl, 1)
+        if role_name:
+            pipe.zadd(role_presence_key(role_name), {user_id: now + ttl})
+            pipe.zremrangebyscore(role_presence_key(role_name), '-inf', now)
+            pipe.expire(role_presence_key(role_name), ttl)
+        pipe.execute()
+    except (RedisError, NotImplementedError) as e:
+        logger.warning(f"Could not mark user {user_id} online: {e}")
+
+
+def mark_offline(user_id, role_name, channel_name):
+    """Forget one socket; the user stays online while another socket is open"""
+    now = time.time()
+    try:
+        redis = get_redis_connection('default')
+        pipe = redis.pipeline()
+        pipe.zrem(user_sockets_key(user_id), channel_name)
+        pipe.zremrangebyscore(user_sockets_key(user_id), '-inf', now)
+        pipe.zcard(user_sockets_key(user_id))
+        if pipe.execute()[-1]:
+            return
+
+        pipe = redis.pipeline()
+        pipe.delete(user_presence_key(user_id))
+        if role_name:
+            pipe.zrem(role_presence_key(role_name), user_id)
+        pipe.execute()
+    except (RedisError, NotImplementedError) as e:
+        logger.warning(f"Could not mark user {user_id} offline: {e}")
+
+
+def online_user_ids(user_ids):
+    """
+    The subset of user_ids with at least one open socket, in one round trip.
+    None when presence is unknown (Redis unreachable)
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return set()
+    try:
+        found = get_redis_connection('default').mget([user_presence_key(user_id) for user_id in user_ids])
+    except (RedisError, NotImplementedError) as e:
+        logger.warning(f"Presence unavailable: {e}")
+        return None
+    return {user_id for user_id, value in zip(user_ids, found) if value is not None}
+
+
+def online_counts_by_role(role_names):
+    """Users online per role, or None when presence is unknown"""
+    now = time.time()
+    try:
+        pipe = get_redis_connection('default').pipeline()
+        for name in role_names:
+            pipe.zcount(role_presence_key(name), now, '+inf')
+        return dict(zip(role_names, pipe.execute()))
+    except (RedisError, NotImplementedError) as e:
+        logger.warning(f"Presence unavailable: {e}")
+        return None
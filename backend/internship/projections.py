@@ -0,0 +1,80 @@
+"""
+Values projections of the hot read-only lists (see PfeManagement.projections).
+Each one mirrors a serializer field for field.
+"""
+
+from PfeManagement.projections import ValuesProjection
+
+from .models import InternshipOffer
+
+
+class InternshipOfferProjection(ValuesProjection):
+    """InternshipOfferSerializer, for querysets built with InternshipOffer.objects.with_stats(user)"""
+    values = (
+        'id', 'company_id', 'company__username', 'company__email', 'company__first_name',
+        'company__last_name', 'company__profile_picture', 'title', 'description', 'requirements',
+        'type', 'location', 'duration', 'start_date', 'end_date', 'positions_available', 'status',
+        'admin_feedback', 'num_applications', 'num_approved_applications',
+        'num_pending_applications', 'external_url', 'created_at', 'updated_at',
+    )
+    status_choices = dict(InternshipOffer.STATUS_CHOICES)
+    type_choices = dict(InternshipOffer.TYPE_CHOICES)
+
+    def project(self, queryset):
+        values = self.values
+        if 'applied_by_user' in queryset.query.annotations:
+            values += ('applied_by_user', 'user_application_status')
+        return queryset.values(*values)
+
+    def to_representation(self, row):
+        first_name, last_name = row['company__first_name'], row['company__last_name']
+        return {
+            'id': row['id'],
+            'company': row['company_id'],
+            'company_info': {
+                'id': row['company_id'],
+                'username': row['company__username'],
+                'email': row['company__email'],
+                'first_name': first_name,
+                'last_name': last_name,
+                'full_name': f"{first_name} {last_name}".strip() or row['company__username'],
+                'profile_picture': self.file_url(row['company__profile_picture']),
+            },
+            'title': row['title'],
+            'description': row['description'],
+            'requirements': row['requirements'],
+            'type': row['type'],
+            'type_display': self.display(self.type_choices, row['type']),
+            'location': row['location'],
+            'duration': row['duration'],
+            'start_date': self.date(row['start_date']),
+            'end_date': self.date(row['end_date']),
+            'positions_available': row['positions_available'],
+            'status': row['status'],
+            'status_display': self.display(self.status_choices, row['status']),
+            'admin_feedback': row['admin_feedback'],
+            'applications_count': row['num_applications'],
+            'approved_applications_count': row['num_approved_applications'],
+            'pending_applications_count': row['num_pending_applications'],
+            'has_applied': row.get('applied_by_user', False),
+            'application_status': row.get('user_application_status'),
+            'external_url': row['external_url'],
+            'created_at': self.datetime(row['created_at']),
+            'updated_at': self.datetime(row['updated_at']),
+        }
+
+
+class NotificationProjection(ValuesProjection):
+    """NotificationSerializer"""
+    values = ('id', 'recipient_id', 'message', 'kind', 'count', 'is_read', 'created_at')
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'recipient': row['recipient_id'],
+            'message': row['message'],
+            'kind': row['kind'],
+            'count': row['count'],
+            'is_read': row['is_read'],
+            'created_at': self.datetime(row['created_at']),
+        }
@@ -0,0 +1,164 @@
+"""
+Run metrics and source health for the internship scrapers.
+
+ScrapeStats collects counters while a source is crawled and
+InstrumentedBackend times every fetch.
+
+A checkpointed crawl is spread over several workers, each seeing only some
+of the pages of a source, so no single worker can tell whether the crawl
+failed. Each worker merges its counters into the crawl's ScrapeRun with
+merge_crawl_run(), and the source health is judged once, by finish_crawl_run(),
+when the frontier of the source is drained. update_source_health() disables a
+source after repeated failed runs.
+"""
+
+import math
+import time
+
+from django.conf import settings
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Greatest, Least
+from django.utils import timezone
+
+from .models import ScrapeRun, ScrapeSource
+
+DEFAULT_MAX_CONSECUTIVE_FAILURES = 3
+
+
+class ScrapeStats:
+    """Counters collected while scraping one source"""
+
+    def __init__(self, source):
+        self.source = source
+        self.started_at = timezone.now()
+        self.latencies = []
+        self.pages_fetched = 0
+        self.bytes_fetched = 0
+        self.fetch_errors = 0
+        self.parse_failures = 0
+        self.items_created = 0
+        self.duplicates_skipped = 0
+
+    def record_fetch(self, page, seconds):
+        self.latencies.append(seconds * 1000)
+        self.pages_fetched += 1
+        self.bytes_fetched += len(page.content or b'')
+        if page.status_code != 200:
+            self.fetch_errors += 1
+
+    def percentile(self, q):
+        """Nearest-rank percentile of fetch latencies, in milliseconds"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+class InstrumentedBackend:
+    """Wraps a fetch backend to feed latency and size of every fetch into ScrapeStats"""
+
+    def __init__(self, backend, stats):
+        self._backend = backend
+        self.stats = stats
+
+    def __getattr__(self, attr):
+        return getattr(self._backend, attr)
+
+    def fetch(self, url):
+        start = time.perf_counter()
+        try:
+            page = self._backend.fetch(url)
+        except Exception:
+            self.stats.fetch_errors += 1
+            raise
+        self.stats.record_fetch(page, time.perf_counter() - start)
+        return page
+
+    def close(self):
+        self._backend.close()
+
+
+def enabled_sources(source_names):
+    """Filter out sources that were disabled (automatically or by an admin)"""
+    disabled = set(ScrapeSource.objects.filter(
+        name__in=source_names, is_enabled=False
+    ).values_list('name', flat=True))
+    return [name for name in source_names if name not in disabled]
+
+
+def run_fields(stats, now):
+    return {
+        'started_at': stats.started_at,
+        'finished_at': now,
+        'pages_fetched': stats.pages_fetched,
+        'bytes_fetched': stats.bytes_fetched,
+        'fetch_errors': stats.fetch_errors,
+        'latency_p50_ms': stats.percentile(50),
+        'latency_p95_ms': stats.percentile(95),
+        'latency_max_ms': max(stats.latencies) if stats.latencies else None,
+        'parse_failures': stats.parse_failures,
+        'items_created': stats.items_created,
+        'duplicates_skipped': stats.duplicates_skipped,
+    }
+
+
+def update_source_health(source_name, succeeded, now=None):
+    """Reset or bump the failure streak of a source, disabling it after too many failed runs"""
+    now = now or timezone.now()
+    source, _ = ScrapeSource.objects.get_or_create(name=source_name)
+    if succeeded:
+        ScrapeSource.objects.filter(id=source.id).update(consecutive_failures=0, last_success_at=now)
+        return
+
+    ScrapeSource.objects.filter(id=source.id).update(
+        consecutive_failures=F('consecutive_failures') + 1,
+        last_failure_at=now
+    )
+    source.refresh_from_db()
+
+    max_failures = getattr(settings, 'SCRAPER_MAX_CONSECUTIVE_FAILURES', DEFAULT_MAX_CONSECUTIVE_FAILURES)
+    if source.is_enabled and source.consecutive_failures >= max_failures:
+        ScrapeSource.objects.filter(id=source.id).update(is_enabled=False, disabled_at=now)
+        print(f"⛔ Source {source_name} disabled after {source.consecutive_failures} failed runs")
+
+
+def merge_crawl_run(stats, crawl_key):
+    """
+    Add what one worker collected for a source to the ScrapeRun of the crawl.
+    Counters are summed; the latency percentiles are those of the slowest
+    worker. The run stays undecided (succeeded=None) until finish_crawl_run()
+    """
+    now = timezone.now()
+    fields = run_fields(stats, now)
+    run, created = ScrapeRun.objects.get_or_create(
+        crawl_key=crawl_key, source=stats.source, defaults={**fields, 'succeeded': None}
+    )
+    if created:
+        return run
+
+    updates = {
+        'started_at': Least('started_at', Value(stats.started_at)),
+        'finished_at': Greatest('finished_at', Value(now)),
+    }
+    for name in ('pages_fetched', 'bytes_fetched', 'fetch_errors', 'parse_failures',
+                 'items_created', 'duplicates_skipped'):
+        updates[name] = F(name) + fields[name]
+    for name in ('latency_p50_ms', 'latency_p95_ms', 'latency_max_ms'):
+        if fields[name] is not None:
+            updates[name] = Greatest(Coalesce(name, Value(fields[name])), Value(fields[name]))
+    ScrapeRun.objects.filter(id=run.id).update(**updates)
+    return run
+
+
+def finish_crawl_run(crawl_key, source_name, items_found):
+    """
+    Decide the run of a crawl whose frontier is drained for this source: it
+    failed when none of its pages yielded anything, whichever workers
+    fetched them. Only the first worker to get here updates the source health
+    """
+    succeeded = items_found > 0
+    decided = ScrapeRun.objects.filter(
+        crawl_key=crawl_key, source=source_name, succeeded__isnull=True
+    ).update(succeeded=succeeded)
+    if decided:
+        update_source_health(source_name, succeeded)
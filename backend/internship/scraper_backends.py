@@ -0,0 +1,215 @@
+"""
+Fetch backends for the internship scrapers.
+
+Each backend knows how to turn a URL into a Page. The heavy third-party
+libraries (cloudscraper, selenium, undetected_chromedriver) are only imported
+when a backend is instantiated, so importing the scrapers from Celery workers
+or Django processes stays cheap.
+
+HttpArchive records the pages fetched during a live run and replays them
+later, so crawls can be reproduced and benchmarked without network access.
+"""
+
+import base64
+import gzip
+import io
+import json
+import threading
+from collections import defaultdict, deque, namedtuple
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+
+# Normalised response returned by every backend
+Page = namedtuple('Page', ['url', 'status_code', 'content'])
+
+
+class HttpBackend:
+    """Plain HTTP fetching through cloudscraper (handles Cloudflare challenges)"""
+    name = 'http'
+    delay = 1  # Seconds to wait between detail pages, to be nice with the site
+
+    def __init__(self, timeout=30):
+        import cloudscraper
+
+        self.timeout = timeout
+        self._session = cloudscraper.create_scraper()
+
+    def fetch(self, url):
+        response = self._session.get(url, timeout=self.timeout)
+        return Page(url=url, status_code=response.status_code, content=response.content)
+
+    def close(self):
+        self._session.close()
+
+
+class BrowserBackend:
+    """Headless Chrome through undetected_chromedriver, for JavaScript-rendered sources"""
+    name = 'browser'
+    delay = 1
+
+    def __init__(self, timeout=30):
+        import undetected_chromedriver as uc
+
+        self.timeout = timeout
+        options = uc.ChromeOptions()
+        options.add_argument('--headless=new')
+        self._driver = uc.Chrome(options=options)
+
+    def fetch(self, url):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        self._driver.get(url)
+        WebDriverWait(self._driver, self.timeout).until(
+            EC.presence_of_element_located((By.TAG_NAME, 'body'))
+        )
+        return Page(url=url, status_code=200, content=self._driver.page_source.encode('utf-8'))
+
+    def close(self):
+        self._driver.quit()
+
+
+def _open_archive(path, mode):
+    """Open a JSONL archive as text, compressed according to its extension (.zst, .gz or plain)"""
+    if path.endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstandard is required for .zst archives (pip install zstandard), or use a .gz archive")
+        raw = open(path, mode + 'b')
+        if mode == 'w':
+            stream = zstandard.ZstdCompressor(level=10).stream_writer(raw, closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class HttpArchive:
+    """
+    Compressed JSONL archive of fetched pages.
+    In record mode every page fetched by a live backend is appended to the
+    archive; in replay mode sources are served from the archive without
+    network access, in the order they were recorded. Sources crawled in
+    parallel share one archive, so writes are serialized (compressed streams
+    are not thread-safe).
+    """
+
+    def __init__(self, path, mode):
+        if mode not in ('record', 'replay'):
+            raise ValueError("HttpArchive mode must be 'record' or 'replay'")
+        self.path = path
+        self.mode = mode
+        self._file = None
+        self._lock = threading.Lock()
+        self._pages = defaultdict(deque)
+
+        if mode == 'record':
+            self._file = _open_archive(path, 'w')
+        else:
+            with _open_archive(path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._pages[(entry['source'], entry['url'])].append(Page(
+                            url=entry['url'],
+                            status_code=entry['status_code'],
+                            content=base64.b64decode(entry['content']),
+                        ))
+
+    @classmethod
+    def record(cls, path):
+        return cls(path, 'record')
+
+    @classmethod
+    def replay(cls, path):
+        return cls(path, 'replay')
+
+    def write(self, source_name, page):
+        line = json.dumps({
+            'source': source_name,
+            'url': page.url,
+            'status_code': page.status_code,
+            'fetched_at': timezone.now().isoformat(),
+            'content': base64.b64encode(page.content or b'').decode('ascii'),
+        }) + '\n'
+        with self._lock:
+            self._file.write(line)
+
+    def lookup(self, source_name, url):
+        """Next recorded page for url; the last one is served again once exhausted"""
+        pages = self._pages.get((source_name, url))
+        if not pages:
+            return Page(url=url, status_code=404, content=b'')
+        return pages.popleft() if len(pages) > 1 else pages[0]
+
+    def backend_for(self, source_name, make_backend):
+        if self.mode == 'replay':
+            return ReplayBackend(self, source_name)
+        return RecordingBackend(make_backend(), self, source_name)
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+class RecordingBackend:
+    """Wraps a live backend and appends every fetched page to an HttpArchive"""
+
+    def __init__(self, backend, archive, source_name):
+        self._backend = backend
+        self._archive = archive
+        self._source_name = source_name
+
+    def __getattr__(self, attr):
+        return getattr(self._backend, attr)
+
+    def fetch(self, url):
+        page = self._backend.fetch(url)
+        self._archive.write(self._source_name, page)
+        return page
+
+    def close(self):
+        self._backend.close()
+
+
+class ReplayBackend:
+    """Serves pages of one source from an HttpArchive, without network access"""
+    name = 'replay'
+    delay = 0
+
+    def __init__(self, archive, source_name):
+        self._archive = archive
+        self._source_name = source_name
+
+    def fetch(self, url):
+        return self._archive.lookup(self._source_name, url)
+
+    def close(self):
+        pass
+
+
+DEFAULT_BACKENDS = {
+    'http': 'internship.scraper_backends.HttpBackend',
+    'browser': 'internship.scraper_backends.BrowserBackend',
+}
+
+
+def get_backend(name, **kwargs):
+    """
+    Instantiate the backend registered under `name`.
+    Extra backends can be plugged in through settings.SCRAPER_BACKENDS
+    (a mapping of name -> dotted path).
+    """
+    backends = {**DEFAULT_BACKENDS, **getattr(settings, 'SCRAPER_BACKENDS', {})}
+    if name not in backends:
+        raise ValueError(f"Unknown scraper backend '{name}'. Available: {', '.join(sorted(backends))}")
+    return import_string(backends[name])(**kwargs)
@@ -3,16 +3,241 @@ Web scraping module for internship opportunities
 Scrapes job/internship listings from various sources
 """
 
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
+from django.conf import settings
 from django.utils import timezone
 import time
 
+from .scraper_backends import get_backend
+
+
+# Configured sources: fetch backend ('http' or 'browser') and paginated listing URL.
+# Backends can be overridden per source through settings.SCRAPER_SOURCE_BACKENDS
+SOURCES = {
+    'Tanitjobs': {
+        'backend': 'http',
+        'listing_url': 'https://www.tanitjobs.com/jobs/?page={page}',
+    },
+    'Keejob': {
+        'backend': 'http',
+        'listing_url': 'https://www.keejob.com/offres-emploi/?page={page}',
+    },
+}
+
+# Crawl budget per source and run, overridable through settings
+DEFAULT_MAX_PAGES = 5
+DEFAULT_MAX_ITEMS = 100
+
+
+def get_source_backend(source_name, archive=None):
+    """
+    Instantiate the fetch backend configured for a source.
+    With an HttpArchive, pages are recorded to it or replayed from it.
+    """
+    overrides = getattr(settings, 'SCRAPER_SOURCE_BACKENDS', {})
+
+    def make_backend():
+        return get_backend(overrides.get(source_name, SOURCES[source_name]['backend']))
+
+    if archive:
+        return archive.backend_for(source_name, make_backend)
+    return make_backend()
+
+
+def get_listing_url(source_name, page):
+    """URL of the given (1-based) listing page of a source"""
+    return SOURCES[source_name]['listing_url'].format(page=page)
+
+
+def get_crawl_budget(max_pages=None, max_items=None):
+    """Resolve the page/item budget of a crawl, falling back to settings"""
+    if max_pages is None:
+        max_pages = getattr(settings, 'SCRAPER_MAX_PAGES', DEFAULT_MAX_PAGES)
+    if max_items is None:
+        max_items = getattr(settings, 'SCRAPER_MAX_ITEMS', DEFAULT_MAX_ITEMS)
+    return max_pages, max_items
+
+
+def parse_tanitjobs_listing(soup, stats=None):
+    """
+    Parse job cards from a Tanitjobs listing page.
+    Returns list of dicts with opportunity data (without detail page content)
+    """
+    opportunities = []
+
+    # Find the main section with latest job offers
+    main_section = soup.find('section', class_='main-sections__listing__latest')
+    if not main_section:
+        # Try finding the container directly if section class changed
+        main_section = soup.find('div', class_='listing__title')
+        if main_section:
+            main_section = main_section.find_parent('section')
+
+    # Paginated listing pages have no "latest" section, cards live in the page body
+    job_cards = (main_section or soup).find_all('article', class_='listing-item__jobs')
+
+    print(f"Found {len(job_cards)} job listings")
+
+    for card in job_cards:
+        try:
+            # Extract title and URL from the <a> tag
+            title_link = card.find('a', class_='link')
+            if not title_link:
+                continue
+
+            title = title_link.get_text(strip=True)
+            job_url = title_link.get('href', '')
+
+            if not job_url or not title:
+                continue
+
+            # Extract company name
+            company_elem = card.find('span', class_='listing-item-info-company')
+            company = company_elem.get_text(strip=True).replace(' - ', '').strip() if company_elem else "Not specified"
+
+            # Extract location
+            location_elem = card.find('span', class_='listing-item-info-location')
+            location = location_elem.get_text(strip=True) if location_elem else "Tunisia"
+
+            # Extract date
+            date_elem = card.find('div', class_='listing-item__date')
+            date_posted = date_elem.get_text(strip=True) if date_elem else ""
+
+            full_description = f"Poste chez {company}.\nLieu: {location}.\nDate de publication: {date_posted}"
+
+            opportunities.append({
+                'title': title[:255],
+                'description': full_description[:2000],
+                'requirements': f"Entreprise: {company}"[:500],
+                'location': location[:255],
+                'company_name': company[:255],
+                'source': 'Tanitjobs',
+                'url': job_url
+            })
+
+        except Exception as e:
+            print(f"Error parsing job: {e}")
+            if stats:
+                stats.parse_failures += 1
+            continue
+
+    return opportunities
+
+
+def fetch_tanitjobs_details(backend, opp):
+    """Visit a Tanitjobs job page and fill in the full description and requirements"""
+    try:
+        print(f"Loading details page: {opp['url'][:80]}...")
+        detail_response = backend.fetch(opp['url'])
+
+        if detail_response.status_code == 200:
+            detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
+
+            # Extract full description
+            description_text = ""
+            requirements_text_scraped = ""
+
+            # Find all h3 titles and their following content
+            titles_h3 = detail_soup.find_all('h3', class_='details-body__title')
+
+            for h3 in titles_h3:
+                title_text = h3.get_text(strip=True)
+                content_div = h3.find_next_sibling('div', class_='details-body__content')
+
+                if content_div:
+                    content = content_div.get_text(separator='\n', strip=True)
+
+                    if "Description" in title_text:
+                        description_text = content
+                    elif "Exigences" in title_text or "Requirements" in title_text or "exigences" in title_text.lower():
+                        requirements_text_scraped = content
+
+            # Combine description and requirements
+            full_description = description_text if description_text else opp['description']
+            if requirements_text_scraped:
+                opp['requirements'] = requirements_text_scraped[:500]
+                if requirements_text_scraped not in full_description:
+                    full_description += "\n\nExigences:\n" + requirements_text_scraped
+            opp['description'] = full_description[:2000]
+
+        else:
+            print(f"Failed to load details: {detail_response.status_code}")
+
+        time.sleep(getattr(backend, 'delay', 1)) # Be nice
+    except Exception as e:
+        print(f"Error fetching details for {opp['title']}: {e}")
+
+    return opp
+
+
+def iter_listing_page(source_name, backend, url, stats=None):
+    """
+    Fetch one listing page of a source, parse its cards and fetch detail
+    pages where the source needs it, yielding each opportunity as soon as
+    it is complete. Parse failures are counted in `stats` (a ScrapeStats)
+    when given. Yields nothing when the page failed or has no cards.
+    """
+    print(f"Loading {url}...")
+    response = backend.fetch(url)
+
+    if response.status_code != 200:
+        print(f"Failed to load page: {response.status_code}")
+        return
+
+    soup = BeautifulSoup(response.content, 'html.parser')
+    opportunities = LISTING_PARSERS[source_name](soup, stats=stats)
+
+    fetch_details = DETAIL_FETCHERS.get(source_name)
+    for opp in opportunities:
+        if fetch_details:
+            fetch_details(backend, opp)
+            print(f"✓ Scraped: {opp['title'][:50]}")
+        yield opp
+
+
+def scrape_listing_page(source_name, backend, url, stats=None):
+    """
+    Scrape one listing page of a source.
+    Returns list of dicts with opportunity data (empty when the page failed or has no cards)
+    """
+    return list(iter_listing_page(source_name, backend, url, stats=stats))
+
+
+def crawl_source(source_name, max_pages=None, max_items=None, archive=None):
+    """
+    Crawl the paginated listing of a source in-process, stopping at the
+    first empty page or when the page/item budget is spent.
+    Pass an HttpArchive to record or replay the crawl.
+    For checkpointed crawls shared between workers see internship.crawler
+    """
+    max_pages, max_items = get_crawl_budget(max_pages, max_items)
+    opportunities = []
+    backend = None
+
+    try:
+        backend = get_source_backend(source_name, archive=archive)
+        print(f"Starting {backend.name} backend...")
+
+        for page in range(1, max_pages + 1):
+            page_opps = scrape_listing_page(source_name, backend, get_listing_url(source_name, page))
+            if not page_opps:
+                break
+
+            opportunities.extend(page_opps[:max_items - len(opportunities)])
+            if len(opportunities) >= max_items:
+                break
+
+    except Exception as e:
+        print(f"Error scraping {source_name}: {e}")
+    finally:
+        if backend:
+            backend.close()
+
+    print(f"Scraped {len(opportunities)} opportunities from {source_name}")
+    return opportunities
+
 
 def scrape_tanitjobs(html_content=None):
     """
@@ -20,141 +245,97 @@ def scrape_tanitjobs(html_content=None):
     If html_content is provided, parses that instead of fetching from web.
     Returns list of dicts with opportunity data
     """
-    import cloudscraper
-    
+    if not html_content:
+        return crawl_source('Tanitjobs')
+
     opportunities = []
-    
+
     try:
-        soup = None
-        
-        if html_content:
-            print("Parsing provided HTML content...")
-            soup = BeautifulSoup(html_content, 'html.parser')
-        else:
-            print("Starting Cloudscraper...")
-            scraper = cloudscraper.create_scraper()
+        print("Parsing provided HTML content...")
+        soup = BeautifulSoup(html_content, 'html.parser')
+        opportunities = parse_tanitjobs_listing(soup)
+    except Exception as e:
+        print(f"Error scraping Tanitjobs: {e}")
+
+    print(f"Scraped {len(opportunities)} opportunities from Tanitjobs")
+    return opportunities
+
+
+def parse_keejob_listing(soup, stats=None):
+    """
+    Parse job cards from a Keejob listing page.
+    Returns list of dicts with opportunity data
+    """
+    opportunities = []
+
+    # Find job listings
+    # Based on user HTML: div with class "bg-white dark:bg-gray-700 ..."
+    # Using a broader selector to catch the cards
+    job_cards = soup.select('div.grid.grid-cols-1 > div')
+    
+    print(f"Found {len(job_cards)} job listings (candidate blocks)")
+    
+    for card in job_cards:
+        try:
+            # Extract title
+            title_elem = card.select_one('h3 a')
+            if not title_elem:
+                continue
             
-            url = "https://www.tanitjobs.com/"
-            print(f"Loading {url}...")
-            response = scraper.get(url)
+            title = title_elem.get_text(strip=True)
+            job_url = title_elem.get('href', '')
+            if job_url and not job_url.startswith('http'):
+                job_url = "https://www.keejob.com" + job_url
             
-            if response.status_code != 200:
-                print(f"Failed to load page: {response.status_code}")
-                return opportunities
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find the main section with latest job offers
-        main_section = soup.find('section', class_='main-sections__listing__latest')
-        if not main_section:
-            print("Could not find main section with job listings")
-            # Try finding the container directly if section class changed
-            main_section = soup.find('div', class_='listing__title')
-            if main_section:
-                main_section = main_section.find_parent('section')
+            # Extract company
+            company = "Not specified"
+            # Looking for company link inside the card
+            company_links = card.select('a[href*="/companies/"]')
+            if company_links:
+                company = company_links[-1].get_text(strip=True)
             
-            if not main_section:
-                return opportunities
-        
-        # Find job listings within the section
-        job_cards = main_section.find_all('article', class_='listing-item__jobs')
-        
-        print(f"Found {len(job_cards)} job listings")
-        
-        for card in job_cards[:15]:  # Limit to 15 jobs
-            try:
-                # Extract title and URL from the <a> tag
-                title_link = card.find('a', class_='link')
-                if not title_link:
-                    continue
-                
-                title = title_link.get_text(strip=True)
-                job_url = title_link.get('href', '')
-                
-                if not job_url or not title:
-                    continue
-                
-                # Extract company name
-                company_elem = card.find('span', class_='listing-item-info-company')
-                company = company_elem.get_text(strip=True).replace(' - ', '').strip() if company_elem else "Not specified"
-                
-                # Extract location
-                location_elem = card.find('span', class_='listing-item-info-location')
-                location = location_elem.get_text(strip=True) if location_elem else "Tunisia"
-                
-                # Extract date
-                date_elem = card.find('div', class_='listing-item__date')
-                date_posted = date_elem.get_text(strip=True) if date_elem else ""
-                
-                print(f"Processing: {title[:50]}...")
-                
-                full_description = f"Poste chez {company}.\nLieu: {location}.\nDate de publication: {date_posted}"
-                requirements_text = f"Entreprise: {company}"
-
-                # Only try to fetch details if we are in online mode
-                if not html_content and job_url:
-                    try:
-                        # Visit job details page
-                        print(f"Loading details page: {job_url[:80]}...")
-                        # Use same scraper instance
-                        detail_response = scraper.get(job_url)
-                        
-                        if detail_response.status_code == 200:
-                            detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-                            
-                            # Extract full description
-                            description_text = ""
-                            requirements_text_scraped = ""
-                            
-                            # Find all h3 titles and their following content
-                            titles_h3 = detail_soup.find_all('h3', class_='details-body__title')
-                            
-                            for h3 in titles_h3:
-                                title_text = h3.get_text(strip=True)
-                                content_div = h3.find_next_sibling('div', class_='details-body__content')
-                                
-                                if content_div:
-                                    content = content_div.get_text(separator='\n', strip=True)
-                                    
-                                    if "Description" in title_text:
-                                        description_text = content
-                                    elif "Exigences" in title_text or "Requirements" in title_text or "exigences" in title_text.lower():
-                                        requirements_text_scraped = content
-                            
-                            # Combine description and requirements
-                            full_description = description_text if description_text else full_description
-                            if requirements_text_scraped:
-                                requirements_text = requirements_text_scraped
-                                if requirements_text not in full_description:
-                                    full_description += "\n\nExigences:\n" + requirements_text
-                            
-                        else:
-                            print(f"Failed to load details: {detail_response.status_code}")
-                        
-                        time.sleep(1) # Be nice
-                    except Exception as e:
-                        print(f"Error fetching details for {title}: {e}")
+            # Extract location
+            location = "Tunisia"
+            location_icon = card.select_one('i.fa-map-marker-alt')
+            if location_icon and location_icon.next_sibling:
+                location = location_icon.next_sibling.get_text(strip=True)
+            elif location_icon and location_icon.parent:
+                 location = location_icon.parent.get_text(strip=True)
+
+            
+            # Extract description
+            description = ""
+            desc_elem = card.select_one('p.text-sm')
+            if desc_elem:
+                description = desc_elem.get_text(strip=True)
+            
+            # Extract tags/requirements
+            tags = []
+            for tag in card.select('span.inline-flex'):
+                tags.append(tag.get_text(strip=True))
+            
+            requirements = " | ".join(tags)
+            
+            full_description = f"{description}\n\nTags: {requirements}\n\nEntreprise: {company}\nLieu: {location}"
+
+            opportunities.append({
+                'title': title[:255],
+                'description': full_description[:2000],
+                'requirements': requirements[:500] if requirements else f"Entreprise: {company}",
+                'location': location[:255],
+                'company_name': company[:255],
+                'source': 'Keejob',
+                'url': job_url
+            })
+            
+            print(f"✓ Scraped: {title[:50]}")
+            
+        except Exception as e:
+            print(f"Error parsing Keejob card: {e}")
+            if stats:
+                stats.parse_failures += 1
+            continue
 
-                opportunities.append({
-                    'title': title[:255],
-                    'description': full_description[:2000],
-                    'requirements': requirements_text[:500],
-                    'location': location[:255],
-                    'company_name': company[:255],
-                    'source': 'Tanitjobs',
-                    'url': job_url
-                })
-                
-                print(f"✓ Scraped: {title[:50]}")
-                
-            except Exception as e:
-                print(f"Error parsing job: {e}")
-                continue
-                
-    except Exception as e:
-        print(f"Error scraping Tanitjobs: {e}")
-    
-    print(f"Scraped {len(opportunities)} opportunities from Tanitjobs")
     return opportunities
 
 
@@ -164,99 +345,33 @@ def scrape_keejob(html_content=None):
     If html_content is provided, parses that instead of fetching from web.
     Returns list of dicts with opportunity data
     """
-    import cloudscraper
-    
-    opportunities = []
-    
-    try:
-        soup = None
-        
-        if html_content:
-            print("Parsing provided HTML content for Keejob...")
-            soup = BeautifulSoup(html_content, 'html.parser')
-        else:
-            # For now, we only support offline parsing or placeholder for online
-            pass
-            
-        if not soup:
-            return opportunities
-        
-        # Find job listings
-        # Based on user HTML: div with class "bg-white dark:bg-gray-700 ..."
-        # Using a broader selector to catch the cards
-        job_cards = soup.select('div.grid.grid-cols-1 > div')
-        
-        print(f"Found {len(job_cards)} job listings (candidate blocks)")
-        
-        valid_cards = 0
-        for card in job_cards:
-            try:
-                # Extract title
-                title_elem = card.select_one('h3 a')
-                if not title_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                job_url = title_elem.get('href', '')
-                if job_url and not job_url.startswith('http'):
-                    job_url = "https://www.keejob.com" + job_url
-                
-                # Extract company
-                company = "Not specified"
-                # Looking for company link inside the card
-                company_links = card.select('a[href*="/companies/"]')
-                if company_links:
-                    company = company_links[-1].get_text(strip=True)
-                
-                # Extract location
-                location = "Tunisia"
-                location_icon = card.select_one('i.fa-map-marker-alt')
-                if location_icon and location_icon.next_sibling:
-                    location = location_icon.next_sibling.get_text(strip=True)
-                elif location_icon and location_icon.parent:
-                     location = location_icon.parent.get_text(strip=True)
+    if not html_content:
+        return crawl_source('Keejob')
 
-                
-                # Extract description
-                description = ""
-                desc_elem = card.select_one('p.text-sm')
-                if desc_elem:
-                    description = desc_elem.get_text(strip=True)
-                
-                # Extract tags/requirements
-                tags = []
-                for tag in card.select('span.inline-flex'):
-                    tags.append(tag.get_text(strip=True))
-                
-                requirements = " | ".join(tags)
-                
-                full_description = f"{description}\n\nTags: {requirements}\n\nEntreprise: {company}\nLieu: {location}"
+    opportunities = []
 
-                opportunities.append({
-                    'title': title[:255],
-                    'description': full_description[:2000],
-                    'requirements': requirements[:500] if requirements else f"Entreprise: {company}",
-                    'location': location[:255],
-                    'company_name': company[:255],
-                    'source': 'Keejob',
-                    'url': job_url
-                })
-                
-                print(f"✓ Scraped: {title[:50]}")
-                valid_cards += 1
-                
-            except Exception as e:
-                print(f"Error parsing Keejob card: {e}")
-                continue
-    
-        print(f"Scraped {valid_cards} opportunities from Keejob")
-                
+    try:
+        print("Parsing provided HTML content for Keejob...")
+        soup = BeautifulSoup(html_content, 'html.parser')
+        opportunities = parse_keejob_listing(soup)
     except Exception as e:
         print(f"Error scraping Keejob: {e}")
         import traceback
         traceback.print_exc()
-    
+
+    print(f"Scraped {len(opportunities)} opportunities from Keejob")
     return opportunities
+
+
+LISTING_PARSERS = {
+    'Tanitjobs': parse_tanitjobs_listing,
+    'Keejob': parse_keejob_listing,
+}
+
+# Sources whose listing cards only hold a summary and need a detail page visit
+DETAIL_FETCHERS = {
+    'Tanitjobs': fetch_tanitjobs_details,
+}
     
 
 def scrape_generic_rss(rss_url, source_name):
@@ -265,9 +380,11 @@ def scrape_generic_rss(rss_url, source_name):
     Many job sites provide RSS feeds
     """
     opportunities = []
+    backend = None
     
     try:
-        response = requests.get(rss_url, timeout=10)
+        backend = get_backend('http', timeout=10)
+        response = backend.fetch(rss_url)
         if response.status_code != 200:
             return opportunities
         
@@ -297,29 +414,35 @@ def scrape_generic_rss(rss_url, source_name):
                 
     except Exception as e:
         print(f"Error scraping RSS {source_name}: {e}")
+    finally:
+        if backend:
+            backend.close()
     
     return opportunities
 
 
-def scrape_all_sources(html_content=None):
+def iter_all_sources(html_content=None):
     """
-    Scrape all configured sources and return combined results
+    Scrape all configured sources, yielding opportunities source by source
+    so they can be cleaned and saved without building one big list
     """
-    all_opportunities = []
-    
     # Scrape from Tanitjobs
     print("🔍 Scraping Tanitjobs...")
-    tanitjobs_opps = scrape_tanitjobs(html_content=html_content)
-    all_opportunities.extend(tanitjobs_opps)
+    yield from scrape_tanitjobs(html_content=html_content)
     
     # Scrape from Keejob
     print("🔍 Scraping Keejob...")
-    keejob_opps = scrape_keejob(html_content=html_content)
-    all_opportunities.extend(keejob_opps)
+    yield from scrape_keejob(html_content=html_content)
     
     # Add more sources here if needed
-    # all_opportunities.extend(scrape_generic_rss("https://example.com/jobs.rss", "Example Site"))
-    
+    # yield from scrape_generic_rss("https://example.com/jobs.rss", "Example Site")
+
+
+def scrape_all_sources(html_content=None):
+    """
+    Scrape all configured sources and return combined results
+    """
+    all_opportunities = list(iter_all_sources(html_content=html_content))
     print(f"✅ Found {len(all_opportunities)} opportunities total")
     return all_opportunities
 
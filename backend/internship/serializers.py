@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Internship, TeacherInvitation, Notification, Room
+from .models import Internship, TeacherInvitation, Notification, Room, ScrapeSource, ScrapeRun
 from authentication.models import User
 from dateutil.relativedelta import relativedelta
 import os
@@ -16,10 +16,14 @@ class InternshipSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'student_id', 'student_name', 'teacher_id', 'teacher_name',
             'type', 'type_display', 'company_name', 'cahier_de_charges',
+            'cahier_de_charges_size', 'cahier_de_charges_mime_type', 'cahier_de_charges_page_count',
             'status', 'status_display', 'start_date', 'end_date',
             'description', 'title', 'created_at', 'updated_at', 'has_report'
         ]
-        read_only_fields = ['student_id', 'created_at', 'updated_at']
+        read_only_fields = [
+            'student_id', 'cahier_de_charges_size', 'cahier_de_charges_mime_type',
+            'cahier_de_charges_page_count', 'created_at', 'updated_at'
+        ]
 
     def get_student_name(self, obj):
         """Get full name of student"""
@@ -178,8 +182,24 @@ class TeacherListSerializer(serializers.ModelSerializer):
 class NotificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Notification
-        fields = ['id', 'recipient', 'message', 'is_read', 'created_at']
-        read_only_fields = ['recipient', 'created_at']
+        fields = ['id', 'recipient', 'message', 'kind', 'count', 'is_read', 'created_at']
+        read_only_fields = ['recipient', 'kind', 'count', 'created_at']
+
+class NotificationDetailSerializer(NotificationSerializer):
+    """Notification with the events merged into it, when it is a digest"""
+    class Meta(NotificationSerializer.Meta):
+        fields = NotificationSerializer.Meta.fields + ['details']
+        read_only_fields = NotificationSerializer.Meta.read_only_fields + ['details']
+
+class BulkMarkReadSerializer(serializers.Serializer):
+    """Notifications to mark read: a list of ids, or everything up to an id (inclusive)"""
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False, max_length=1000)
+    up_to = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        if ('ids' in attrs) == ('up_to' in attrs):
+            raise serializers.ValidationError("Provide either ids or up_to.")
+        return attrs
 
 class RoomSerializer(serializers.ModelSerializer):
     class Meta:
@@ -191,3 +211,23 @@ class RoomSerializer(serializers.ModelSerializer):
         if value <= 0:
             raise serializers.ValidationError("Capacity must be greater than 0")
         return value
+
+
+class ScrapeSourceSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ScrapeSource
+        fields = ['id', 'name', 'is_enabled', 'consecutive_failures', 'last_success_at',
+                  'last_failure_at', 'disabled_at', 'updated_at']
+        read_only_fields = ['name', 'consecutive_failures', 'last_success_at',
+                            'last_failure_at', 'disabled_at', 'updated_at']
+
+
+class ScrapeRunSerializer(serializers.ModelSerializer):
+    duration_seconds = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = ScrapeRun
+        fields = ['id', 'source', 'crawl_key', 'started_at', 'finished_at', 'duration_seconds',
+                  'pages_fetched', 'bytes_fetched', 'fetch_errors', 'latency_p50_ms',
+                  'latency_p95_ms', 'latency_max_ms', 'parse_failures', 'items_created',
+                  'duplicates_skipped', 'succeeded']
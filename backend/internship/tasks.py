@@ -1,11 +1,21 @@
+import time
+from datetime import timedelta
+
 from celery import shared_task
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from django.contrib.auth import get_user_model
-from .models import Soutenance, InternshipOffer
-from .scrapers import scrape_all_sources, clean_and_validate_opportunity
+from .models import Soutenance, Notification, ArchivedNotification
+from .scrapers import iter_all_sources
+from .crawler import default_crawl_key, run_crawl, save_opportunities, seed_frontier
+from .scraper_backends import HttpArchive
 
 User = get_user_model()
 
+DEFAULT_NOTIFICATION_RETENTION_DAYS = 90
+DEFAULT_NOTIFICATION_ARCHIVE_CHUNK_SIZE = 1000
+
 @shared_task
 def check_soutenance_status():
     """
@@ -31,10 +41,16 @@ def check_soutenance_status():
 
 
 @shared_task
-def scrape_internship_opportunities(html_content=None):
+def scrape_internship_opportunities(html_content=None, crawl_key=None, max_pages=None, max_items=None,
+                                    record_to=None, replay_from=None):
     """
     Periodic task to scrape internship opportunities from external sources
-    Runs daily to find new opportunities
+    Runs daily to find new opportunities.
+    Online runs crawl paginated listings through a checkpointed frontier:
+    re-running with the same crawl_key resumes an interrupted crawl, and
+    settings.SCRAPER_CRAWL_WORKERS > 1 fans the frontier out to extra workers.
+    record_to saves every fetched page to an archive (.jsonl, .jsonl.gz or
+    .jsonl.zst) and replay_from runs the crawl from such an archive offline.
     """
     print("🤖 Starting internship scraping task...")
     
@@ -46,33 +62,36 @@ def scrape_internship_opportunities(html_content=None):
             print("❌ Error: User 'company' not found. Please create this user first.")
             return "Error: company user not found"
         
-        # Scrape opportunities from all sources
-        opportunities = scrape_all_sources(html_content=html_content)
-        
-        created_count = 0
-        duplicate_count = 0
-        
-        for opp_data in opportunities:
-            # Clean and validate data
-            cleaned_data = clean_and_validate_opportunity(opp_data)
+        if html_content:
+            # Offline mode: parse the provided page with every source
+            created_count, duplicate_count = save_opportunities(
+                iter_all_sources(html_content=html_content), company_user
+            )
+        elif record_to or replay_from:
+            # Archives are tied to one process, so no fan-out to other workers
+            archive = HttpArchive.record(record_to) if record_to else HttpArchive.replay(replay_from)
+            if replay_from and not crawl_key:
+                # A replay must not resume (and skip) the pages of a live crawl
+                crawl_key = f"replay-{timezone.now():%Y%m%d%H%M%S%f}"
+            crawl_key = crawl_key or default_crawl_key()
+            seed_frontier(crawl_key, max_pages=max_pages)
             
-            # Check for duplicates (by title and company within last 7 days)
-            existing = InternshipOffer.objects.filter(
-                title__iexact=cleaned_data['title'],
-                company=company_user,
-                created_at__gte=timezone.now() - timezone.timedelta(days=7)
-            ).exists()
+            try:
+                created_count, duplicate_count = run_crawl(
+                    crawl_key, company_user, max_pages=max_pages, max_items=max_items, archive=archive
+                )
+            finally:
+                archive.close()
+        else:
+            crawl_key = crawl_key or default_crawl_key()
+            seed_frontier(crawl_key, max_pages=max_pages)
             
-            if existing:
-                duplicate_count += 1
-                continue
+            for _ in range(getattr(settings, 'SCRAPER_CRAWL_WORKERS', 1) - 1):
+                crawl_frontier.delay(crawl_key, max_pages=max_pages, max_items=max_items)
             
-            # Create new offer
-            InternshipOffer.objects.create(
-                company=company_user,
-                **cleaned_data
+            created_count, duplicate_count = run_crawl(
+                crawl_key, company_user, max_pages=max_pages, max_items=max_items
             )
-            created_count += 1
         
         result = f"✅ Scraping complete! Created: {created_count}, Duplicates skipped: {duplicate_count}"
         print(result)
@@ -82,3 +101,68 @@ def scrape_internship_opportunities(html_content=None):
         error_msg = f"❌ Error in scraping task: {str(e)}"
         print(error_msg)
         return error_msg
+
+
+@shared_task
+def crawl_frontier(crawl_key, max_pages=None, max_items=None):
+    """
+    Extra crawl worker: drains the shared frontier of an ongoing crawl
+    alongside scrape_internship_opportunities
+    """
+    try:
+        company_user = User.objects.get(username='company')
+    except User.DoesNotExist:
+        return "Error: company user not found"
+    
+    created_count, duplicate_count = run_crawl(
+        crawl_key, company_user, max_pages=max_pages, max_items=max_items
+    )
+    return f"Crawl {crawl_key}: Created: {created_count}, Duplicates skipped: {duplicate_count}"
+
+
+@shared_task
+def archive_read_notifications(days=None, chunk_size=None):
+    """
+    Periodic task moving read notifications older than `days`
+    (settings.NOTIFICATION_RETENTION_DAYS) to ArchivedNotification.
+    Rows are moved in chunks of `chunk_size`, one short transaction each,
+    so the hot table is never locked for long.
+    """
+    days = days or getattr(settings, 'NOTIFICATION_RETENTION_DAYS', DEFAULT_NOTIFICATION_RETENTION_DAYS)
+    chunk_size = chunk_size or getattr(settings, 'NOTIFICATION_ARCHIVE_CHUNK_SIZE', DEFAULT_NOTIFICATION_ARCHIVE_CHUNK_SIZE)
+    cutoff = timezone.now() - timedelta(days=days)
+    start = time.perf_counter()
+    archived_count = 0
+    chunks = 0
+    
+    while True:
+        with transaction.atomic():
+            rows = list(Notification.objects.filter(
+                is_read=True,
+                created_at__lt=cutoff
+            ).order_by('id').values('id', 'recipient_id', 'message', 'kind', 'created_at')[:chunk_size])
+            if not rows:
+                break
+            
+            ArchivedNotification.objects.bulk_create([
+                ArchivedNotification(
+                    recipient_id=row['recipient_id'],
+                    message=row['message'],
+                    kind=row['kind'],
+                    created_at=row['created_at']
+                )
+                for row in rows
+            ])
+            Notification.objects.filter(id__in=[row['id'] for row in rows]).delete()
+        
+        archived_count += len(rows)
+        chunks += 1
+    
+    seconds = round(time.perf_counter() - start, 3)
+    print(f"🗄️ Archived {archived_count} read notifications in {chunks} chunks ({seconds}s)")
+    return {
+        'archived_count': archived_count,
+        'chunks': chunks,
+        'seconds': seconds,
+        'cutoff_date': cutoff.isoformat()
+    }
@@ -0,0 +1,123 @@
+import hashlib
+import io
+import os
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from pypdf import PdfWriter
+
+from internship.file_metadata import read_file_metadata, sniff_mime_type
+from internship.models import Internship
+
+User = get_user_model()
+BACKEND_DIR = settings.BASE_DIR
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def student(db):
+    return User.objects.create_user(username="meta_student", email="meta@example.com", password="password")
+
+
+def pdf_bytes(pages):
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=595, height=842)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def create_internship(student, upload):
+    return Internship.objects.create(
+        student_id=student, type="PFE", company_name="Acme", title="Stage",
+        start_date=date(2025, 2, 1), end_date=date(2025, 6, 30),
+        cahier_de_charges=upload
+    )
+
+
+def test_metadata_is_captured_at_upload(student):
+    content = pdf_bytes(3)
+    internship = create_internship(student, SimpleUploadedFile("cdc.pdf", content))
+    internship.refresh_from_db()
+
+    assert internship.cahier_de_charges_size == len(content)
+    assert internship.cahier_de_charges_sha256 == hashlib.sha256(content).hexdigest()
+    assert internship.cahier_de_charges_mime_type == "application/pdf"
+    assert internship.cahier_de_charges_page_count == 3
+
+
+def test_metadata_is_not_read_again_on_later_saves(student, monkeypatch):
+    internship = create_internship(student, SimpleUploadedFile("cdc.pdf", pdf_bytes(1)))
+
+    def fail(file):
+        raise AssertionError("stored file read again")
+    monkeypatch.setattr("internship.file_metadata.read_file_metadata", fail)
+    internship.title = "Renamed"
+    internship.save()
+
+
+def test_mime_type_comes_from_the_content():
+    assert sniff_mime_type(b"%PDF-1.7", "cv.docx") == "application/pdf"
+    assert sniff_mime_type(b"PK\x03\x04", "cv.docx") == (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    )
+    assert sniff_mime_type(b"????", "") == "application/octet-stream"
+
+
+def test_unreadable_pdf_has_no_page_count():
+    metadata = read_file_metadata(SimpleUploadedFile("broken.pdf", b"%PDF-1.4 garbage"))
+    assert metadata["mime_type"] == "application/pdf"
+    assert metadata["page_count"] is None
+
+
+@pytest.mark.parametrize("error", [KeyError("/Pages"), TypeError("bad"), AssertionError, RecursionError])
+def test_pdf_parser_crash_has_no_page_count(monkeypatch, error):
+    def crash(file):
+        raise error
+
+    monkeypatch.setattr("pypdf.PdfReader", crash)
+    metadata = read_file_metadata(SimpleUploadedFile("crafted.pdf", pdf_bytes(1)))
+    assert metadata["page_count"] is None
+    assert metadata["size"] > 0
+
+
+def test_importing_models_does_not_load_pypdf():
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import django, sys; django.setup(); import internship.models, report.models; "
+         "print('pypdf' in sys.modules)"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "PfeManagement.settings"},
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+def test_backfill_fills_rows_without_metadata(student):
+    content = pdf_bytes(2)
+    internship = create_internship(student, SimpleUploadedFile("cdc.pdf", content))
+    missing = create_internship(student, SimpleUploadedFile("gone.pdf", content))
+    missing.cahier_de_charges.storage.delete(missing.cahier_de_charges.name)
+    Internship.objects.update(
+        cahier_de_charges_size=None, cahier_de_charges_sha256=None,
+        cahier_de_charges_mime_type=None, cahier_de_charges_page_count=None
+    )
+
+    call_command("backfill_file_metadata")
+
+    internship.refresh_from_db()
+    assert internship.cahier_de_charges_size == len(content)
+    assert internship.cahier_de_charges_page_count == 2
+    missing.refresh_from_db()
+    assert missing.cahier_de_charges_sha256 is None
@@ -0,0 +1,420 @@
+from datetime import timedelta
+
+import fakeredis
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.urls import reverse
+from django.utils import timezone
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework.test import APIClient
+
+from authentication.models import Role
+from internship.consumers import NotificationConsumer
+from PfeManagement.middleware import JwtAuthMiddleware
+from rest_framework_simplejwt.tokens import AccessToken
+from internship.models import ArchivedNotification, Notification
+from internship import notifications
+from internship.notifications import broadcast, notify, notify_digest, role_group
+from internship import presence
+from internship.presence import mark_offline, mark_online, online_counts_by_role, online_user_ids
+from internship.tasks import archive_read_notifications
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def channel_layer(settings):
+    settings.CHANNEL_LAYERS = {'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}}
+    return get_channel_layer()
+
+
+@pytest.fixture
+def users():
+    User = get_user_model()
+    return [User.objects.create_user(username=f'jury{i}', password='JuryPass123!') for i in range(3)]
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    from django.core.cache import cache
+    cache.clear()
+    return cache
+
+
+@pytest.fixture
+def redis_cache(settings):
+    """The production django_redis cache, on an in-memory Redis"""
+    settings.CACHES = {'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://fake:6379/1',
+        'OPTIONS': {'CONNECTION_POOL_KWARGS': {'connection_class': fakeredis.FakeRedisConnection}},
+    }}
+    from django.core.cache import cache
+    cache.clear()
+    return cache
+
+
+@pytest.fixture
+def presence_redis(monkeypatch):
+    redis = fakeredis.FakeRedis()
+    monkeypatch.setattr(presence, 'get_redis_connection', lambda alias='default': redis)
+    return redis
+
+
+@pytest.fixture
+def client_for(users):
+    client = APIClient()
+    client.force_authenticate(user=users[0])
+    return client
+
+
+def listen(channel_layer, user):
+    """Stand-in for an open socket of the user"""
+    channel_name = async_to_sync(channel_layer.new_channel)()
+    async_to_sync(channel_layer.group_add)(f"user_{user.id}", channel_name)
+    mark_online(user.id, None, channel_name)
+    return channel_name
+
+
+def test_notify_bulk_inserts_unique_recipients(users, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        notifications = notify(users + [users[0], None], "Jury assigned", Notification.KIND_SOUTENANCE)
+
+    assert len(notifications) == 3
+    assert Notification.objects.filter(kind=Notification.KIND_SOUTENANCE).count() == 3
+
+
+def test_notify_pushes_after_commit(channel_layer, locmem_cache, presence_redis, users, django_capture_on_commit_callbacks):
+    channel_name = listen(channel_layer, users[1])
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        notifications = notify(users, "Soutenance cancelled", Notification.KIND_SOUTENANCE)
+
+    assert len(callbacks) == 2  # Unread counters, then the push
+
+    event = async_to_sync(channel_layer.receive)(channel_name)
+    assert event == {
+        'type': 'send_notification',
+        'id': notifications[1].id,
+        'message': 'Soutenance cancelled',
+        'kind': Notification.KIND_SOUTENANCE,
+        'created_at': notifications[1].created_at.isoformat(),
+    }
+
+
+def test_notify_does_not_push_rolled_back_notifications(users, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks() as callbacks:
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                notify(users, "Soutenance scheduled")
+                raise RuntimeError
+
+    assert callbacks == []
+    assert not Notification.objects.exists()
+
+
+def test_notify_skips_pushes_to_offline_users(channel_layer, locmem_cache, presence_redis, users, monkeypatch):
+    sent = []
+    monkeypatch.setattr(notifications, '_group_send_all', sent.extend)
+    listen(channel_layer, users[1])
+
+    notifications.push_notifications(notify(users, "Offer approved", push=False))
+
+    assert [group for group, _ in sent] == [f"user_{users[1].id}"]
+
+
+def test_notify_pushes_to_everyone_when_presence_is_unknown(channel_layer, locmem_cache, users, monkeypatch):
+    sent = []
+    monkeypatch.setattr(notifications, '_group_send_all', sent.extend)
+
+    def unreachable(alias='default'):
+        raise RedisConnectionError("Connection refused")
+
+    monkeypatch.setattr(presence, 'get_redis_connection', unreachable)
+
+    notifications.push_notifications(notify(users, "Offer approved", push=False))
+
+    assert len(sent) == len(users)
+
+
+def test_user_stays_online_until_last_socket_closes(presence_redis, users):
+    mark_online(users[0].id, 'Student', 'channel-1')
+    mark_online(users[0].id, 'Student', 'channel-2')
+    mark_online(users[1].id, 'Student', 'channel-3')
+
+    mark_offline(users[0].id, 'Student', 'channel-1')
+    assert online_user_ids([users[0].id]) == {users[0].id}
+    assert online_counts_by_role(['Student', 'Teacher']) == {'Student': 2, 'Teacher': 0}
+
+    mark_offline(users[0].id, 'Student', 'channel-2')
+    assert online_user_ids([users[0].id, users[1].id]) == {users[1].id}
+    assert online_counts_by_role(['Student']) == {'Student': 1}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_consumer_tracks_presence(channel_layer, locmem_cache, presence_redis, users):
+    async def connect_and_leave():
+        communicator = WebsocketCommunicator(NotificationConsumer.as_asgi(), "/ws/notifications/")
+        communicator.scope['user'] = users[0]
+        await communicator.connect()
+        online_while_connected = await sync_to_async(online_user_ids)([users[0].id, users[1].id])
+        await communicator.disconnect()
+        return online_while_connected
+
+    assert async_to_sync(connect_and_leave)() == {users[0].id}
+    assert online_user_ids([users[0].id]) == set()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_consumer_replays_notifications_missed_since_last_seen_id(channel_layer, users):
+    user = users[0]
+    seen = Notification.objects.create(recipient=user, message="Seen before the blip")
+    missed = [Notification.objects.create(recipient=user, message=f"Missed {i}") for i in range(2)]
+    Notification.objects.create(recipient=users[1], message="Someone else's")
+
+    async def reconnect():
+        communicator = WebsocketCommunicator(
+            NotificationConsumer.as_asgi(), f"/ws/notifications/?last_seen_id={seen.id}"
+        )
+        communicator.scope['user'] = user
+        connected, _ = await communicator.connect()
+        assert connected
+        received = [await communicator.receive_json_from() for _ in missed]
+        assert await communicator.receive_nothing()
+        await communicator.disconnect()
+        return received
+
+    received = async_to_sync(reconnect)()
+
+    assert [event['id'] for event in received] == [n.id for n in missed]
+    assert received[0]['message'] == "Missed 0"
+
+
+def test_broadcast_is_one_group_message(channel_layer, presence_redis, users, django_capture_on_commit_callbacks):
+    group = role_group('Student')
+    channel_names = [listen(channel_layer, user) for user in users]
+    for channel_name in channel_names:
+        async_to_sync(channel_layer.group_add)(group, channel_name)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        notifications = broadcast(group, users[:2], "Reports are due Friday")
+
+    assert len(callbacks) == 2  # Unread counters, then the single group_send
+    event = async_to_sync(channel_layer.receive)(channel_names[0])
+    # No per-recipient map: the payload does not grow with the audience
+    assert event['id_range'] == [min(n.id for n in notifications), max(n.id for n in notifications)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_consumer_delivers_broadcasts_to_recipients_only(channel_layer, users):
+    student_role, _ = Role.objects.get_or_create(name='Student')
+    get_user_model().objects.filter(id__in=[users[0].id, users[1].id]).update(role=student_role)
+    announced = Notification.objects.create(recipient=users[0], message="Reports are due Friday")
+    Notification.objects.create(recipient=users[1], message="Something else")
+
+    async def connect(user):
+        communicator = WebsocketCommunicator(NotificationConsumer.as_asgi(), "/ws/notifications/")
+        communicator.scope['user'] = user
+        await communicator.connect()
+        return communicator
+
+    async def announce():
+        recipient, bystander = await connect(users[0]), await connect(users[1])
+        await channel_layer.group_send(role_group('Student'), {
+            'type': 'send_notification',
+            'id_range': [announced.id, announced.id + 1],
+            'message': announced.message,
+        })
+        received = await recipient.receive_json_from()
+        assert await bystander.receive_nothing()
+        await recipient.disconnect()
+        await bystander.disconnect()
+        return received
+
+    assert async_to_sync(announce)()['id'] == announced.id
+
+
+def authenticate_websocket(query_string):
+    scopes = []
+
+    async def app(scope, receive, send):
+        scopes.append(scope)
+
+    async_to_sync(JwtAuthMiddleware(app))({'type': 'websocket', 'query_string': query_string.encode()}, None, None)
+    return scopes[0]
+
+
+def test_websocket_auth_trusts_token_claims(users, django_assert_num_queries):
+    token = AccessToken.for_user(users[0])
+    token['role_name'] = 'Teacher'
+
+    with django_assert_num_queries(0):
+        scope = authenticate_websocket(f"token={token}&last_seen_id=3")
+
+    assert scope['user'].id == users[0].id
+    assert scope['user'].role_name == 'Teacher'
+    assert authenticate_websocket("token=not-a-jwt")['user'].is_anonymous
+
+
+# ===========================================================
+# Feed & unread counter
+# ===========================================================
+
+def test_notification_feed_is_cursor_paginated(users, client_for):
+    Notification.objects.bulk_create([Notification(recipient=users[0], message=f"n{i}") for i in range(25)])
+
+    first = client_for.get(reverse('notification-list')).json()
+    second = client_for.get(first['next']).json()
+
+    assert len(first['results']) == 20
+    assert len(second['results']) == 5
+    assert second['next'] is None
+    seen = {n['id'] for n in first['results']} | {n['id'] for n in second['results']}
+    assert len(seen) == 25
+
+
+def test_unread_count_follows_notify_and_mark_read(
+    users, client_for, locmem_cache, channel_layer, django_capture_on_commit_callbacks, django_assert_num_queries
+):
+    url = reverse('notification-unread-count')
+    assert client_for.get(url).json() == {'unread_count': 0}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        notifications = notify(users, "Offer approved", Notification.KIND_OFFER)
+    # Served from the counter, no COUNT query
+    with django_assert_num_queries(0):
+        assert client_for.get(url).json() == {'unread_count': 1}
+
+    client_for.patch(reverse('notification-read', args=[notifications[0].id]))
+    client_for.patch(reverse('notification-read', args=[notifications[0].id]))
+    assert client_for.get(url).json() == {'unread_count': 0}
+
+
+def test_unread_counts_are_adjusted_in_one_redis_call(redis_cache, users, monkeypatch):
+    from django_redis import get_redis_connection
+    from internship.notifications import adjust_unread_counts, get_unread_count, unread_count_key
+
+    redis_cache.set(unread_count_key(users[0].pk), 4)
+    redis_cache.set(unread_count_key(users[1].pk), 0)
+    redis = get_redis_connection('default')
+    calls = []
+    real_eval = redis.eval
+
+    def counting_eval(*args):
+        calls.append(args)
+        return real_eval(*args)
+
+    monkeypatch.setattr(redis, 'eval', counting_eval)
+
+    adjust_unread_counts([user.pk for user in users], 1)
+    adjust_unread_counts([users[1].pk], -5)
+
+    assert len(calls) == 2
+    assert redis_cache.get(unread_count_key(users[0].pk)) == 5
+    # Went negative: dropped and rebuilt from the database
+    assert redis_cache.get(unread_count_key(users[1].pk)) is None
+    # Not cached before: left to be rebuilt rather than created at 1
+    assert redis_cache.get(unread_count_key(users[2].pk)) is None
+    assert get_unread_count(users[2]) == 0
+
+
+def test_bulk_mark_read_by_ids_and_cursor(users, client_for, locmem_cache, django_assert_num_queries):
+    unread = Notification.objects.bulk_create([Notification(recipient=users[0], message=f"n{i}") for i in range(5)])
+    other = Notification.objects.create(recipient=users[1], message="not mine")
+    assert client_for.get(reverse('notification-unread-count')).json() == {'unread_count': 5}
+    url = reverse('notification-bulk-read')
+
+    # One UPDATE, the counter answers without a COUNT
+    with django_assert_num_queries(1):
+        response = client_for.post(url, {'ids': [unread[0].id, unread[1].id, other.id]}, format='json')
+    assert response.json() == {'updated': 2, 'unread_count': 3}
+
+    response = client_for.post(url, {'up_to': unread[3].id}, format='json')
+    assert response.json() == {'updated': 2, 'unread_count': 1}
+    assert not Notification.objects.get(id=other.id).is_read
+
+    assert client_for.post(url, {}, format='json').status_code == 400
+
+
+def test_mark_read_unknown_notification(client_for):
+    response = client_for.patch(reverse('notification-read', args=[999999]))
+    assert response.status_code == 404
+
+
+# ===========================================================
+# Digests
+# ===========================================================
+
+def apply_to_offer(company, student_id):
+    return notify_digest(
+        company, "offer_applications:1", "New application for 'Backend intern'",
+        lambda count: f"{count} new applications for 'Backend intern'",
+        Notification.KIND_APPLICATION, detail={'application_id': student_id}
+    )
+
+
+def test_notify_digest_merges_events_within_window(users, client_for, django_capture_on_commit_callbacks):
+    company = users[0]
+    with django_capture_on_commit_callbacks() as callbacks:
+        digests = {apply_to_offer(company, student_id).id for student_id in range(12)}
+
+    assert len(digests) == 1
+    assert len(callbacks) == 2  # One counter update and one push for the whole burst
+    digest = Notification.objects.get()
+    assert (digest.count, digest.message) == (12, "12 new applications for 'Backend intern'")
+
+    details = client_for.get(reverse('notification-detail', args=[digest.id])).json()['details']
+    assert [d['application_id'] for d in details] == list(range(12))
+
+
+def test_notify_digest_starts_over_once_read_or_expired(users, settings):
+    company = users[0]
+    first = apply_to_offer(company, 1)
+    Notification.objects.filter(id=first.id).update(is_read=True)
+    second = apply_to_offer(company, 2)
+
+    settings.NOTIFICATION_DIGEST_WINDOW = 60
+    Notification.objects.filter(id=second.id).update(created_at=timezone.now() - timedelta(minutes=5))
+    third = apply_to_offer(company, 3)
+
+    assert len({first.id, second.id, third.id}) == 3
+    assert list(Notification.objects.filter(digest_open=True)) == [third]
+
+
+def test_notify_digest_has_one_open_row_per_key(users):
+    company = users[0]
+    apply_to_offer(company, 1)
+
+    # What a concurrent first event would insert
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Notification.objects.create(
+            recipient=company, message="New application", digest_key="offer_applications:1", digest_open=True
+        )
+    assert apply_to_offer(company, 2).count == 2
+
+
+# ===========================================================
+# Retention
+# ===========================================================
+
+def test_archive_read_notifications_moves_old_read_rows_in_chunks(users):
+    old = timezone.now() - timedelta(days=120)
+    Notification.objects.bulk_create(
+        [Notification(recipient=users[0], message=f"old {i}", is_read=True) for i in range(5)]
+        + [Notification(recipient=users[0], message="old unread"), Notification(recipient=users[0], message="recent", is_read=True)]
+    )
+    Notification.objects.exclude(message="recent").update(created_at=old)
+
+    report = archive_read_notifications(days=90, chunk_size=2)
+
+    assert report['archived_count'] == 5
+    assert report['chunks'] == 3
+    assert set(Notification.objects.values_list('message', flat=True)) == {"old unread", "recent"}
+    archived = ArchivedNotification.objects.filter(recipient=users[0])
+    assert archived.count() == 5
+    assert all(row.created_at == old for row in archived)
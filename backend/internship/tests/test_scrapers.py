@@ -0,0 +1,364 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+from internship import scrapers
+from internship.crawler import claim_next_page, run_crawl, seed_frontier
+from internship.models import CrawlPage, InternshipOffer, ScrapeRun, ScrapeSource
+from internship.scrape_metrics import ScrapeStats, merge_crawl_run, update_source_health
+from internship.scraper_backends import HttpArchive, Page, get_backend
+
+
+BACKEND_DIR = settings.BASE_DIR
+
+
+class FakeBackend:
+    """In-memory backend serving canned pages"""
+    name = 'fake'
+    pages = {}
+
+    def __init__(self, **kwargs):
+        self.closed = False
+
+    def fetch(self, url):
+        return Page(url=url, status_code=200, content=self.pages.get(url, b''))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def tanitjobs_html():
+    with open(os.path.join(BACKEND_DIR, 'tanit_jobs_source.html'), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture
+def fake_tanitjobs(settings, monkeypatch, tanitjobs_html):
+    """Serve the sample Tanitjobs page as listing pages 1 and 2"""
+    monkeypatch.setattr(scrapers.time, 'sleep', lambda seconds: None)
+    settings.SCRAPER_BACKENDS = {'fake': 'internship.tests.test_scrapers.FakeBackend'}
+    settings.SCRAPER_SOURCE_BACKENDS = {'Tanitjobs': 'fake'}
+    FakeBackend.pages = {
+        scrapers.get_listing_url('Tanitjobs', 1): tanitjobs_html.encode('utf-8'),
+        scrapers.get_listing_url('Tanitjobs', 2): tanitjobs_html.encode('utf-8'),
+    }
+    return len(scrapers.parse_tanitjobs_listing(scrapers.BeautifulSoup(tanitjobs_html, 'html.parser')))
+
+
+@pytest.fixture
+def company_user(db):
+    return get_user_model().objects.create_user(username='company', password='CompanyPass123!')
+
+
+# ===========================================================
+# Backends
+# ===========================================================
+
+def test_importing_tasks_does_not_load_selenium():
+    result = subprocess.run(
+        [sys.executable, '-c',
+         "import django, sys; django.setup(); import internship.tasks; "
+         "print('selenium' in sys.modules, 'undetected_chromedriver' in sys.modules)"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+        env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'PfeManagement.settings'},
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == 'False False'
+
+
+def test_get_backend_unknown_name():
+    with pytest.raises(ValueError):
+        get_backend('carrier-pigeon')
+
+
+def test_get_backend_from_settings(settings):
+    settings.SCRAPER_BACKENDS = {'fake': 'internship.tests.test_scrapers.FakeBackend'}
+    assert isinstance(get_backend('fake'), FakeBackend)
+
+
+# ===========================================================
+# Sources
+# ===========================================================
+
+def test_scrape_tanitjobs_offline(tanitjobs_html):
+    opportunities = scrapers.scrape_tanitjobs(html_content=tanitjobs_html)
+    assert opportunities
+    assert all(opp['source'] == 'Tanitjobs' for opp in opportunities)
+
+
+def test_scrape_tanitjobs_crawls_until_empty_page(fake_tanitjobs):
+    opportunities = scrapers.scrape_tanitjobs()
+    assert len(opportunities) == 2 * fake_tanitjobs
+
+
+def test_crawl_source_respects_item_budget(fake_tanitjobs):
+    opportunities = scrapers.crawl_source('Tanitjobs', max_pages=5, max_items=3)
+    assert len(opportunities) == 3
+
+
+# ===========================================================
+# Crawl frontier
+# ===========================================================
+
+def test_run_crawl_persists_pages_and_stops_at_page_budget(fake_tanitjobs, company_user):
+    seed_frontier('test-crawl', sources=['Tanitjobs'], max_pages=2)
+
+    created, duplicates = run_crawl('test-crawl', company_user, max_pages=2, max_items=100)
+
+    # Page 2 repeats page 1, so every offer on it is a duplicate
+    assert created == fake_tanitjobs
+    assert duplicates == fake_tanitjobs
+    assert InternshipOffer.objects.filter(company=company_user).count() == fake_tanitjobs
+    assert list(CrawlPage.objects.values_list('page', 'status')) == [(1, 2), (2, 2)]
+
+
+def test_run_crawl_resumes_pending_pages(fake_tanitjobs, company_user):
+    CrawlPage.objects.create(
+        crawl_key='test-crawl', source='Tanitjobs', page=1, status=2,
+        url=scrapers.get_listing_url('Tanitjobs', 1)
+    )
+    CrawlPage.objects.create(
+        crawl_key='test-crawl', source='Tanitjobs', page=2,
+        url=scrapers.get_listing_url('Tanitjobs', 2)
+    )
+
+    created, _ = run_crawl('test-crawl', company_user, max_pages=2, max_items=100)
+
+    assert created == fake_tanitjobs
+    assert CrawlPage.objects.get(page=1).attempts == 0
+
+
+class BarrierBackend(FakeBackend):
+    """Listing pages only load once every source is fetching at the same time"""
+    barrier = None
+
+    def fetch(self, url):
+        if url in self.pages:
+            self.barrier.wait()
+        return super().fetch(url)
+
+
+def test_run_crawl_fetches_sources_concurrently(fake_tanitjobs, settings, company_user):
+    settings.SCRAPER_BACKENDS = {'barrier': 'internship.tests.test_scrapers.BarrierBackend'}
+    settings.SCRAPER_SOURCE_BACKENDS = {'Tanitjobs': 'barrier', 'Keejob': 'barrier'}
+    BarrierBackend.barrier = threading.Barrier(2, timeout=5)
+    FakeBackend.pages = {
+        scrapers.get_listing_url('Tanitjobs', 1): FakeBackend.pages[scrapers.get_listing_url('Tanitjobs', 1)],
+        scrapers.get_listing_url('Keejob', 1): b'<html><body></body></html>',
+    }
+    seed_frontier('test-crawl', sources=['Tanitjobs', 'Keejob'], max_pages=1)
+
+    created, _ = run_crawl('test-crawl', company_user, max_pages=1, max_items=100)
+
+    # A sequential crawl would break the barrier and fail both pages
+    assert created == fake_tanitjobs
+    assert set(CrawlPage.objects.values_list('source', 'status')) == {('Tanitjobs', 2), ('Keejob', 2)}
+
+
+def test_run_crawl_stops_streaming_at_item_budget(fake_tanitjobs, company_user):
+    seed_frontier('test-crawl', sources=['Tanitjobs'])
+
+    created, _ = run_crawl('test-crawl', company_user, max_pages=5, max_items=3)
+
+    assert created == 3
+    # The budget is spent on page 1, the rest of the window is closed unfetched
+    assert list(CrawlPage.objects.values_list('page', 'status', 'items_found')) == [
+        (1, 2, 3), (2, 2, 0), (3, 2, 0), (4, 2, 0), (5, 2, 0)
+    ]
+
+
+def test_seed_frontier_queues_a_window_of_pages(db, settings):
+    settings.SCRAPER_FRONTIER_WINDOW = 3
+    seed_frontier('test-crawl', sources=['Tanitjobs'], max_pages=10)
+
+    assert list(CrawlPage.objects.values_list('page', flat=True)) == [1, 2, 3]
+    assert claim_next_page('test-crawl').page == 1
+    # Another worker takes the next page right away
+    assert claim_next_page('test-crawl').page == 2
+
+
+def test_run_crawl_slides_the_window_until_an_empty_page(fake_tanitjobs, settings, company_user):
+    settings.SCRAPER_FRONTIER_WINDOW = 2
+    seed_frontier('test-crawl', sources=['Tanitjobs'], max_pages=10)
+
+    run_crawl('test-crawl', company_user, max_pages=10, max_items=100)
+
+    # Pages 1-2 have offers, 3 is empty and closes 4 without fetching it
+    assert list(CrawlPage.objects.values_list('page', 'status', 'items_found')) == [
+        (1, 2, fake_tanitjobs), (2, 2, fake_tanitjobs), (3, 2, 0), (4, 2, 0)
+    ]
+    assert ScrapeRun.objects.get().pages_fetched == 3 + 2 * fake_tanitjobs
+
+
+def test_claim_next_page_is_exclusive(db):
+    seed_frontier('test-crawl', sources=['Tanitjobs'], max_pages=1)
+
+    assert claim_next_page('test-crawl').status == 1
+    assert claim_next_page('test-crawl') is None
+
+
+# ===========================================================
+# Run metrics & source health
+# ===========================================================
+
+def test_run_crawl_records_scrape_run(fake_tanitjobs, company_user):
+    seed_frontier('test-crawl', sources=['Tanitjobs'], max_pages=1)
+    run_crawl('test-crawl', company_user, max_pages=1, max_items=100)
+
+    run = ScrapeRun.objects.get(source='Tanitjobs')
+    # Listing page plus one detail page per card
+    assert run.pages_fetched == 1 + fake_tanitjobs
+    assert run.bytes_fetched > 0
+    assert run.latency_p50_ms is not None
+    assert run.items_created == fake_tanitjobs
+    assert run.succeeded
+    assert ScrapeSource.objects.get(name='Tanitjobs').consecutive_failures == 0
+
+
+def test_resumed_crawl_tail_does_not_count_as_a_failure(fake_tanitjobs, company_user):
+    # Another worker already took the offers of page 1; only the empty page 3 is left
+    CrawlPage.objects.create(
+        crawl_key='test-crawl', source='Tanitjobs', page=1, status=2, items_found=fake_tanitjobs,
+        url=scrapers.get_listing_url('Tanitjobs', 1)
+    )
+    CrawlPage.objects.create(
+        crawl_key='test-crawl', source='Tanitjobs', page=3, url=scrapers.get_listing_url('Tanitjobs', 3)
+    )
+
+    created, _ = run_crawl('test-crawl', company_user, max_pages=3, max_items=100)
+
+    assert created == 0
+    assert ScrapeRun.objects.get(source='Tanitjobs').succeeded
+    assert ScrapeSource.objects.get(name='Tanitjobs').consecutive_failures == 0
+
+
+def test_crawl_run_is_decided_once_its_frontier_is_drained(fake_tanitjobs, company_user):
+    FakeBackend.pages = {}  # Every listing page is empty
+    CrawlPage.objects.create(
+        crawl_key='test-crawl', source='Tanitjobs', page=1, status=1, url=scrapers.get_listing_url('Tanitjobs', 1)
+    )
+    CrawlPage.objects.create(
+        crawl_key='test-crawl', source='Tanitjobs', page=2, url=scrapers.get_listing_url('Tanitjobs', 2)
+    )
+
+    # Page 1 is still held by another worker: no verdict yet
+    run_crawl('test-crawl', company_user, max_pages=2, max_items=100)
+    assert ScrapeRun.objects.get().succeeded is None
+    assert not ScrapeSource.objects.exists()
+
+    # The other worker gives page 1 back and this one drains it: one failure for the whole crawl
+    CrawlPage.objects.filter(page=1).update(status=0)
+    run_crawl('test-crawl', company_user, max_pages=2, max_items=100)
+
+    run = ScrapeRun.objects.get()
+    assert run.pages_fetched == 2
+    assert run.succeeded is False
+    assert ScrapeSource.objects.get(name='Tanitjobs').consecutive_failures == 1
+
+
+def test_workers_merge_into_one_crawl_run(db):
+    for latency in (0.1, 0.3):
+        stats = ScrapeStats('Keejob')
+        stats.record_fetch(Page(url='https://example.com', status_code=200, content=b'abc'), latency)
+        stats.items_created = 2
+        merge_crawl_run(stats, 'test-crawl')
+
+    run = ScrapeRun.objects.get()
+    assert (run.pages_fetched, run.bytes_fetched, run.items_created) == (2, 6, 4)
+    assert run.latency_max_ms == pytest.approx(300)
+    assert run.succeeded is None
+
+
+def test_stats_percentile():
+    stats = ScrapeStats('Tanitjobs')
+    stats.latencies = [float(ms) for ms in range(1, 101)]
+    assert stats.percentile(50) == 50
+    assert stats.percentile(95) == 95
+
+
+def test_source_disabled_after_repeated_failures(db, settings):
+    settings.SCRAPER_MAX_CONSECUTIVE_FAILURES = 2
+
+    update_source_health('Keejob', False)
+    assert ScrapeSource.objects.get(name='Keejob').is_enabled
+    update_source_health('Keejob', False)
+
+    source = ScrapeSource.objects.get(name='Keejob')
+    assert not source.is_enabled
+    assert source.disabled_at is not None
+
+
+def test_seed_frontier_skips_disabled_sources(db):
+    ScrapeSource.objects.create(name='Keejob', is_enabled=False)
+    seed_frontier('test-crawl', max_pages=1)
+    assert list(CrawlPage.objects.values_list('source', flat=True)) == ['Tanitjobs']
+
+
+# ===========================================================
+# Record / replay
+# ===========================================================
+
+@pytest.mark.parametrize('suffix', ['.jsonl', '.jsonl.gz', '.jsonl.zst'])
+def test_recorded_crawl_replays_identically(fake_tanitjobs, tmp_path, suffix):
+    if suffix.endswith('.zst'):
+        pytest.importorskip('zstandard')
+    path = str(tmp_path / f'crawl{suffix}')
+
+    archive = HttpArchive.record(path)
+    recorded = scrapers.crawl_source('Tanitjobs', max_pages=3, archive=archive)
+    archive.close()
+
+    FakeBackend.pages = {}  # The network is gone
+    replayed = scrapers.crawl_source('Tanitjobs', max_pages=3, archive=HttpArchive.replay(path))
+
+    assert replayed == recorded
+
+
+@pytest.mark.parametrize('suffix', ['.jsonl', '.jsonl.gz', '.jsonl.zst'])
+def test_concurrent_sources_record_into_one_archive(tmp_path, suffix):
+    if suffix.endswith('.zst'):
+        pytest.importorskip('zstandard')
+    path = str(tmp_path / f'crawl{suffix}')
+    sources = ['Tanitjobs', 'Keejob']
+    urls = [f'https://example.com/offers/{n}' for n in range(300)]
+
+    archive = HttpArchive.record(path)
+    FakeBackend.pages = {url: url.encode('utf-8') * 50 for url in urls}
+    start = threading.Barrier(len(sources), timeout=5)
+
+    def crawl(source_name):
+        backend = archive.backend_for(source_name, FakeBackend)
+        start.wait()
+        for url in urls:
+            backend.fetch(url)
+
+    threads = [threading.Thread(target=crawl, args=(source_name,)) for source_name in sources]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    archive.close()
+
+    replay = HttpArchive.replay(path)
+    for source_name in sources:
+        for url in urls:
+            assert replay.lookup(source_name, url).content == FakeBackend.pages[url]
+
+
+def test_replayed_crawl_does_not_touch_source_health(fake_tanitjobs, company_user, tmp_path):
+    path = str(tmp_path / 'crawl.jsonl.gz')
+    archive = HttpArchive.record(path)
+    scrapers.crawl_source('Tanitjobs', max_pages=1, archive=archive)
+    archive.close()
+
+    seed_frontier('replay', sources=['Tanitjobs'], max_pages=1)
+    created, _ = run_crawl('replay', company_user, max_pages=1, archive=HttpArchive.replay(path))
+
+    assert created == fake_tanitjobs
+    assert not ScrapeRun.objects.exists()
@@ -0,0 +1,42 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from internship.models import InternshipApplication, InternshipOffer, Notification
+from report.models import ReportVersion
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+
+
+def test_seed_data_builds_every_role_and_relation():
+    call_command(
+        "seed_data", "--scale", "0.02", "--administrators", "1", "--rooms", "2", "--password", "Secret123!"
+    )
+
+    for role in ("Student", "Teacher", "Company", "Administrator"):
+        assert User.objects.filter(role__name=role, username__startswith="seed_").exists()
+    assert InternshipOffer.objects.count() == 30
+    assert InternshipApplication.objects.exists()
+    assert not InternshipApplication.objects.filter(offer__status__in=[0, 2]).exists()
+    assert ReportVersion.objects.exists()
+    assert Notification.objects.count() == 1200
+    # Timestamps are spread out, not all "now"
+    assert InternshipOffer.objects.dates("created_at", "month").count() > 1
+
+    response = APIClient().post(reverse("login"), {"username": "seed_student_0", "password": "Secret123!"})
+    assert response.status_code == 200
+
+
+def test_seed_data_refuses_to_seed_twice_and_flushes():
+    call_command("seed_data", "--scale", "0.01")
+    with pytest.raises(CommandError):
+        call_command("seed_data", "--scale", "0.01")
+
+    call_command("seed_data", "--flush")
+    assert not User.objects.filter(username__startswith="seed_").exists()
+    assert not InternshipOffer.objects.exists()
@@ -244,3 +244,47 @@ def test_teacher_list_serializer(teacher_user):
     assert data["email"] == "teacher@example.com"
     assert data["role_name"] == "Teacher"
     assert data["full_name"] == "Tea Cher"
+
+
+# ---------- VALUES PROJECTIONS ----------
+
+def test_offer_projection_matches_serializer(student_user, teacher_user, settings, tmp_path):
+    from rest_framework.test import APIRequestFactory
+    from rest_framework.request import Request
+    from internship.company_serializers import InternshipOfferSerializer
+    from internship.models import InternshipApplication, InternshipOffer
+    from internship.projections import InternshipOfferProjection
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    teacher_user.profile_picture = SimpleUploadedFile("logo.png", b"\x89PNG\r\n\x1a\n")
+    teacher_user.first_name = ""
+    teacher_user.save()
+    for i, offer_type in enumerate(["PFE", "Stage", "Unknown"]):
+        offer = InternshipOffer.objects.create(
+            company=teacher_user, title=f"Offer {i}", description="Work", type=offer_type,
+            start_date="2025-02-01", end_date="2025-06-30", status=i % 2
+        )
+        if i:
+            InternshipApplication.objects.create(offer=offer, student=student_user, status=i)
+
+    request = Request(APIRequestFactory().get("/internship/browse/"))
+    request.user = student_user
+    offers = InternshipOffer.objects.with_stats(student_user).order_by("id")
+
+    serialized = InternshipOfferSerializer(offers, many=True, context={"request": request}).data
+    projection = InternshipOfferProjection({"request": request})
+    assert projection.render(projection.project(offers)) == [dict(o) for o in serialized]
+
+
+def test_notification_projection_matches_serializer(student_user):
+    from internship.models import Notification
+    from internship.projections import NotificationProjection
+    from internship.serializers import NotificationSerializer
+
+    Notification.objects.create(recipient=student_user, message="Hello", kind=Notification.KIND_OFFER)
+    notifications = Notification.objects.filter(recipient=student_user)
+
+    projection = NotificationProjection()
+    assert projection.render(projection.project(notifications)) == [
+        dict(n) for n in NotificationSerializer(notifications, many=True).data
+    ]
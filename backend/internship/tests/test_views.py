@@ -387,7 +387,7 @@ def test_get_pending_internships_admin_only(
     url = reverse("pending-internships")
     response = api_client.get(url)
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) >= 1
+    assert len(response.data["results"]) >= 1
 
 
 def test_get_pending_internships_non_admin_forbidden(
@@ -437,3 +437,129 @@ def test_get_teacher_invitations_non_teacher_forbidden(
     url = reverse("teacher-invitations")
     response = api_client.get(url)
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# --------- OFFERS ---------
+
+def test_browse_offers_query_count_is_constant(api_client, student_user, teacher_user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from internship.models import InternshipOffer, InternshipApplication
+
+    def create_offers(count):
+        for i in range(count):
+            offer = InternshipOffer.objects.create(
+                company=teacher_user, title=f"Offer {i}", description="Backend work",
+                start_date="2025-02-01", end_date="2025-06-30", status=1
+            )
+            InternshipApplication.objects.create(offer=offer, student=student_user, status=1)
+
+    api_client.force_authenticate(user=student_user)
+    url = reverse("browse-offers")
+
+    create_offers(2)
+    with CaptureQueriesContext(connection) as few:
+        response = api_client.get(url)
+    create_offers(8)
+    with CaptureQueriesContext(connection) as many:
+        response = api_client.get(url)
+
+    offers = response.data["results"]
+    assert len(offers) == 10
+    assert len(many) == len(few)
+    assert all(o["has_applied"] and o["applications_count"] == 1 for o in offers)
+    assert all(o["approved_applications_count"] == 1 and o["pending_applications_count"] == 0 for o in offers)
+    assert all(o["application_status"] == 1 for o in offers)
+
+
+# --------- APPLICATIONS ---------
+
+@pytest.fixture
+def company_user(db):
+    User = get_user_model()
+    role, _ = Role.objects.get_or_create(name="Company")
+    return User.objects.create_user(
+        username="internship_company", email="company@example.com",
+        password="CompanyPass123!", role=role
+    )
+
+
+def create_applications(company, student, count):
+    from internship.models import InternshipOffer, InternshipApplication, InterviewSlot
+
+    for i in range(count):
+        offer = InternshipOffer.objects.create(
+            company=company, title=f"Offer {i}", description="Backend work",
+            start_date="2025-02-01", end_date="2025-06-30", status=1
+        )
+        for hour in (9, 10):
+            InterviewSlot.objects.create(
+                offer=offer, date="2025-01-15", start_time=f"{hour}:00", end_time=f"{hour}:30"
+            )
+        InterviewSlot.objects.create(
+            offer=offer, date="2025-01-16", start_time="9:00", end_time="9:30", is_booked=True
+        )
+        InternshipApplication.objects.create(offer=offer, student=student, status=1)
+
+
+@pytest.mark.parametrize("url_name,viewer", [
+    ("my-applications", "student"),
+    ("all-applications", "company"),
+])
+def test_application_lists_query_count_is_constant(api_client, student_user, company_user, url_name, viewer):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    api_client.force_authenticate(user=student_user if viewer == "student" else company_user)
+    url = reverse(url_name)
+
+    create_applications(company_user, student_user, 2)
+    with CaptureQueriesContext(connection) as few:
+        response = api_client.get(url)
+    create_applications(company_user, student_user, 8)
+    with CaptureQueriesContext(connection) as many:
+        response = api_client.get(url)
+
+    applications = response.data["results"]
+    assert len(applications) == 10
+    assert len(many) == len(few)
+    assert all(len(a["available_slots"]) == 2 for a in applications)
+    assert all(a["offer_info"]["applications_count"] == 1 for a in applications)
+
+
+def test_browse_offers_pagination_filters_and_sorting(api_client, student_user, teacher_user):
+    from internship.models import InternshipOffer
+
+    for i in range(25):
+        InternshipOffer.objects.create(
+            company=teacher_user, title=f"Offer {i:02d}", description="Backend work",
+            type="PFE" if i % 5 == 0 else "Stage",
+            start_date="2025-02-01", end_date="2025-06-30", status=1
+        )
+    api_client.force_authenticate(user=student_user)
+    url = reverse("browse-offers")
+
+    first = api_client.get(url)
+    assert len(first.data["results"]) == 20
+    second = api_client.get(first.data["next"])
+    assert len(second.data["results"]) == 5
+    assert second.data["next"] is None
+    seen = [o["id"] for o in first.data["results"] + second.data["results"]]
+    assert len(set(seen)) == 25
+
+    page = api_client.get(url, {"limit": 10, "offset": 20})
+    assert page.data["count"] == 25
+    assert len(page.data["results"]) == 5
+
+    filtered = api_client.get(url, {"type": "PFE", "ordering": "start_date"})
+    assert len(filtered.data["results"]) == 5
+
+    searched = api_client.get(url, {"search": "Offer 07"})
+    assert [o["title"] for o in searched.data["results"]] == ["Offer 07"]
+
+
+def test_list_filters_reject_invalid_values(api_client, student_user):
+    api_client.force_authenticate(user=student_user)
+    response = api_client.get(reverse("my-applications"), {"status": "accepted"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "status" in response.data
@@ -12,7 +12,10 @@ from .views import (
     RejectInternshipView,
     GetTeacherInvitationsView,
     NotificationListView, 
+    NotificationDetailView,
+    UnreadNotificationCountView,
     MarkNotificationReadView, 
+    BulkMarkNotificationsReadView,
     MarkAllNotificationsReadView
 )
 from .views.soutenance_views import SoutenanceListCreateView, SoutenanceDetailView, GetSoutenanceCandidatesView
@@ -52,7 +55,10 @@ urlpatterns = [
     
     # Notifications
     path('notifications/', NotificationListView.as_view(), name='notification-list'),
+    path('notifications/<int:pk>/', NotificationDetailView.as_view(), name='notification-detail'),
+    path('notifications/unread-count/', UnreadNotificationCountView.as_view(), name='notification-unread-count'),
     path('notifications/<int:pk>/read/', MarkNotificationReadView.as_view(), name='notification-read'),
+    path('notifications/read/', BulkMarkNotificationsReadView.as_view(), name='notification-bulk-read'),
     path('notifications/read-all/', MarkAllNotificationsReadView.as_view(), name='notification-read-all'),
     
     # Company Internship Offers
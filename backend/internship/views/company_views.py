@@ -1,10 +1,12 @@
 from rest_framework.views import APIView
+from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import Count, Max
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -16,7 +18,12 @@ from ..company_serializers import (
     InterviewSlotSerializer, InterviewSlotCreateSerializer,
     InterviewDecisionSerializer, SelectInterviewSlotSerializer
 )
+from ..notifications import notify, notify_digest, offer_group, subscribe
 from ..application_matcher import calculate_match_score, batch_calculate_matches
+from ..file_metadata import copy_file_metadata
+from ..projections import InternshipOfferProjection
+from PfeManagement.conditional import conditional_response, queryset_version
+from PfeManagement.pagination import FilteredListMixin
 
 
 # ==================== COMPANY VIEWS ====================
@@ -31,7 +38,7 @@ class CompanyOfferListCreateView(APIView):
         if not request.user.role or request.user.role.name != 'Company':
             return Response({'error': 'Only companies can access this'}, status=status.HTTP_403_FORBIDDEN)
         
-        offers = InternshipOffer.objects.filter(company=request.user)
+        offers = InternshipOffer.objects.filter(company=request.user).with_stats(request.user)
         serializer = InternshipOfferSerializer(offers, many=True, context={'request': request})
         return Response(serializer.data)
     
@@ -88,9 +95,11 @@ class CompanyOfferDetailView(APIView):
         return Response({'message': 'Offer deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
 
 
-class CompanyApplicationsView(APIView):
+class CompanyApplicationsView(FilteredListMixin, GenericAPIView):
     """View applications for company's offers"""
     permission_classes = [IsAuthenticated]
+    filter_params = {'status': 'status'}
+    ordering_fields = ['created_at', 'updated_at']
     
     def get(self, request, offer_id=None):
         """Get applications for a specific offer or all offers"""
@@ -104,8 +113,8 @@ class CompanyApplicationsView(APIView):
             # All applications for all company's offers
             applications = InternshipApplication.objects.filter(offer__company=request.user)
         
-        serializer = InternshipApplicationSerializer(applications, many=True, context={'request': request})
-        return Response(serializer.data)
+        applications = applications.with_related(request.user)
+        return self.list_response(applications, InternshipApplicationSerializer, context={'request': request})
 
 
 class CompanyReviewApplicationView(APIView):
@@ -141,14 +150,16 @@ class CompanyReviewApplicationView(APIView):
             
             if new_status == 1:  # Interview
                 # Notify student about interview invitation
-                Notification.objects.create(
-                    recipient=application.student,
-                    message=f"🎉 Great news! You've been selected for an interview for '{application.offer.title}'. Please select your preferred time slot."
+                notify(
+                    [application.student],
+                    f"🎉 Great news! You've been selected for an interview for '{application.offer.title}'. Please select your preferred time slot.",
+                    Notification.KIND_APPLICATION
                 )
             else:  # Rejected
-                Notification.objects.create(
-                    recipient=application.student,
-                    message=f"Your application for '{application.offer.title}' was not selected. {feedback}"
+                notify(
+                    [application.student],
+                    f"Your application for '{application.offer.title}' was not selected. {feedback}",
+                    Notification.KIND_APPLICATION
                 )
         
         status_text = 'passed to interview' if new_status == 1 else 'rejected'
@@ -194,7 +205,7 @@ class CompanyInterviewDecisionView(APIView):
             
             if new_status == 2:  # Accepted
                 offer = application.offer
-                internship = Internship.objects.create(
+                internship = Internship(
                     student_id=application.student,
                     type=offer.type,
                     company_name=offer.company.first_name or offer.company.username,
@@ -205,17 +216,23 @@ class CompanyInterviewDecisionView(APIView):
                     status=1,  # Approved
                     cahier_de_charges=application.cv_file if application.cv_file else None
                 )
+                if application.cv_file:
+                    # The CV is already stored: reuse its metadata instead of reading it again
+                    copy_file_metadata(application, 'cv_file', internship, 'cahier_de_charges')
+                internship.save()
                 application.created_internship = internship
                 application.save()
                 
-                Notification.objects.create(
-                    recipient=application.student,
-                    message=f"🎉 Congratulations! You've been accepted for '{offer.title}'! Your internship has been created."
+                notify(
+                    [application.student],
+                    f"🎉 Congratulations! You've been accepted for '{offer.title}'! Your internship has been created.",
+                    Notification.KIND_APPLICATION
                 )
             else:  # Rejected
-                Notification.objects.create(
-                    recipient=application.student,
-                    message=f"Thank you for interviewing for '{application.offer.title}'. Unfortunately, we've decided not to proceed. {feedback}"
+                notify(
+                    [application.student],
+                    f"Thank you for interviewing for '{application.offer.title}'. Unfortunately, we've decided not to proceed. {feedback}",
+                    Notification.KIND_APPLICATION
                 )
         
         status_text = 'accepted' if new_status == 2 else 'rejected'
@@ -277,26 +294,27 @@ class InterviewSlotDeleteView(APIView):
 
 # ==================== STUDENT VIEWS ====================
 
-class BrowseOffersView(APIView):
+class BrowseOffersView(FilteredListMixin, GenericAPIView):
     """Students browse available internship offers"""
     permission_classes = [IsAuthenticated]
+    filter_params = {'type': 'type'}
+    search_fields = ['title', 'description']
+    ordering_fields = ['created_at', 'start_date']
     
     def get(self, request):
         """Get all approved offers"""
         # Only show approved offers
         offers = InternshipOffer.objects.filter(status=1)
-        
-        # Optional filtering
-        offer_type = request.query_params.get('type')
-        if offer_type:
-            offers = offers.filter(type=offer_type)
-        
-        search = request.query_params.get('search')
-        if search:
-            offers = offers.filter(title__icontains=search) | offers.filter(description__icontains=search)
-        
-        serializer = InternshipOfferSerializer(offers, many=True, context={'request': request})
-        return Response(serializer.data)
+        # Students poll this list: answer with 304 until an offer, its company or its applications change
+        version = queryset_version(
+            self.filter_queryset(offers),
+            company_updated_at=Max('company__updated_at'),
+            applications_updated_at=Max('applications__updated_at'),
+            num_applications=Count('applications', distinct=True),
+        )
+        return conditional_response(request, version, lambda: self.projected_list_response(
+            offers.with_stats(request.user), InternshipOfferProjection({'request': request})
+        ))
 
 
 class StudentApplyView(APIView):
@@ -314,11 +332,18 @@ class StudentApplyView(APIView):
         if serializer.is_valid():
             application = serializer.save()
             
-            # Notify company
-            Notification.objects.create(
-                recipient=application.offer.company,
-                message=f"New application from {request.user.first_name} {request.user.last_name} for '{application.offer.title}'"
+            # Notify company, bursts of applications to an offer are merged into one digest
+            student_name = f"{request.user.first_name} {request.user.last_name}"
+            notify_digest(
+                application.offer.company,
+                f"offer_applications:{application.offer_id}",
+                f"New application from {student_name} for '{application.offer.title}'",
+                lambda count: f"{count} new applications for '{application.offer.title}'",
+                Notification.KIND_APPLICATION,
+                detail={'application_id': application.id, 'student': student_name}
             )
+            # Offer-wide announcements reach the student from now on
+            subscribe([request.user.id], offer_group(application.offer_id))
             
             return Response({
                 'message': 'Application submitted successfully',
@@ -327,18 +352,19 @@ class StudentApplyView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class StudentApplicationsView(APIView):
+class StudentApplicationsView(FilteredListMixin, GenericAPIView):
     """Student views their applications"""
     permission_classes = [IsAuthenticated]
+    filter_params = {'status': 'status'}
+    ordering_fields = ['created_at', 'updated_at']
     
     def get(self, request):
         """Get all applications by current student"""
         if not request.user.role or request.user.role.name != 'Student':
             return Response({'error': 'Only students can access this'}, status=status.HTTP_403_FORBIDDEN)
         
-        applications = InternshipApplication.objects.filter(student=request.user)
-        serializer = InternshipApplicationSerializer(applications, many=True, context={'request': request})
-        return Response(serializer.data)
+        applications = InternshipApplication.objects.filter(student=request.user).with_related(request.user)
+        return self.list_response(applications, InternshipApplicationSerializer, context={'request': request})
 
 
 class StudentSelectInterviewSlotView(APIView):
@@ -382,9 +408,10 @@ class StudentSelectInterviewSlotView(APIView):
             application.save()
             
             # Notify company
-            Notification.objects.create(
-                recipient=application.offer.company,
-                message=f"{request.user.first_name} {request.user.last_name} has selected interview slot: {slot.date} {slot.start_time}-{slot.end_time} for '{application.offer.title}'"
+            notify(
+                [application.offer.company],
+                f"{request.user.first_name} {request.user.last_name} has selected interview slot: {slot.date} {slot.start_time}-{slot.end_time} for '{application.offer.title}'",
+                Notification.KIND_APPLICATION
             )
         
         return Response({
@@ -395,9 +422,12 @@ class StudentSelectInterviewSlotView(APIView):
 
 # ==================== ADMIN VIEWS ====================
 
-class AdminPendingOffersView(APIView):
+class AdminPendingOffersView(FilteredListMixin, GenericAPIView):
     """Admin views pending offers"""
     permission_classes = [IsAuthenticated]
+    filter_params = {'type': 'type'}
+    search_fields = ['title', 'description']
+    ordering_fields = ['created_at', 'start_date']
     
     def get(self, request):
         """Get all pending offers"""
@@ -405,10 +435,9 @@ class AdminPendingOffersView(APIView):
             return Response({'error': 'Only administrators can access this'}, status=status.HTTP_403_FORBIDDEN)
         
         status_filter = request.query_params.get('status', '0')  # Default to pending
-        offers = InternshipOffer.objects.filter(status=int(status_filter))
+        offers = InternshipOffer.objects.filter(status=int(status_filter)).with_stats(request.user)
         
-        serializer = InternshipOfferSerializer(offers, many=True, context={'request': request})
-        return Response(serializer.data)
+        return self.projected_list_response(offers, InternshipOfferProjection({'request': request}))
 
 
 class AdminReviewOfferView(APIView):
@@ -439,9 +468,10 @@ class AdminReviewOfferView(APIView):
         
         # Notify company
         status_text = 'approved' if new_status == 1 else 'rejected'
-        Notification.objects.create(
-            recipient=offer.company,
-            message=f"Your internship offer '{offer.title}' has been {status_text}. {feedback}"
+        notify(
+            [offer.company],
+            f"Your internship offer '{offer.title}' has been {status_text}. {feedback}",
+            Notification.KIND_OFFER
         )
         
         return Response({
@@ -1,5 +1,6 @@
 from rest_framework import status
 from rest_framework.views import APIView
+from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
@@ -14,6 +15,8 @@ from ..serializers import (
     TeacherListSerializer
 )
 from authentication.models import User, Role
+from PfeManagement.conditional import conditional_response, queryset_version
+from PfeManagement.pagination import FilteredListMixin
 
 
 class CreateInternshipView(APIView):
@@ -103,9 +106,12 @@ class ListTeachersView(APIView):
             }, status=status.HTTP_404_NOT_FOUND)
         
         # Get all users with Teacher role
-        teachers = User.objects.filter(role=teacher_role)
-        serializer = TeacherListSerializer(teachers, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        teachers = User.objects.filter(role=teacher_role).select_related('role')
+        return conditional_response(
+            request, queryset_version(teachers),
+            lambda: Response(TeacherListSerializer(teachers, many=True).data, status=status.HTTP_200_OK),
+            private=False
+        )
 
 
 class SendTeacherInvitationView(APIView):
@@ -227,9 +233,14 @@ class RespondToInvitationView(APIView):
         serializer = TeacherInvitationSerializer(invitation)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
-class GetPendingInternshipsView(APIView):
+class GetPendingInternshipsView(FilteredListMixin, GenericAPIView):
     """Get all pending internships for admin review"""
     permission_classes = [IsAuthenticated]
+    filter_params = {'type': 'type'}
+    search_fields = ['title', 'company_name']
+    ordering_fields = ['start_date']
+    # created_at is nullable on old rows, the id follows creation order
+    ordering = ('-id',)
 
     @swagger_auto_schema(
         responses={
@@ -245,9 +256,8 @@ class GetPendingInternshipsView(APIView):
             }, status=status.HTTP_403_FORBIDDEN)
 
         # Get all pending internships
-        internships = Internship.objects.filter(status=0).order_by('-created_at')
-        serializer = InternshipSerializer(internships, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        internships = Internship.objects.filter(status=0).select_related('student_id', 'teacher_id', 'report')
+        return self.list_response(internships, InternshipSerializer)
 
 
 class ApproveInternshipView(APIView):
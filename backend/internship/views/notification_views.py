@@ -1,31 +1,87 @@
 from rest_framework import generics, permissions, status
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from drf_yasg.utils import swagger_auto_schema
 from ..models import Notification
-from ..serializers import NotificationSerializer
+from ..notifications import adjust_unread_counts, get_unread_count, reset_unread_count
+from ..projections import NotificationProjection
+from ..serializers import NotificationSerializer, NotificationDetailSerializer, BulkMarkReadSerializer
+
+class NotificationCursorPagination(CursorPagination):
+    """Keyset pagination on (created_at, id): pages stay cheap however long the history is"""
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
 
 class NotificationListView(generics.ListAPIView):
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
+
+    def get_queryset(self):
+        return Notification.objects.filter(recipient=self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        # Polled by every open tab: rows go straight from .values() to JSON
+        projection = NotificationProjection()
+        page = self.paginate_queryset(projection.project(self.get_queryset()))
+        return self.get_paginated_response(projection.render(page))
+
+class NotificationDetailView(generics.RetrieveAPIView):
+    """A single notification, with the merged events of a digest"""
+    serializer_class = NotificationDetailSerializer
+    permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         return Notification.objects.filter(recipient=self.request.user)
 
+class UnreadNotificationCountView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response({'unread_count': get_unread_count(request.user)}, status=status.HTTP_200_OK)
+
 class MarkNotificationReadView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def patch(self, request, pk):
-        try:
-            notification = Notification.objects.get(pk=pk, recipient=request.user)
-            notification.is_read = True
-            notification.save()
-            return Response({'status': 'marked as read'}, status=status.HTTP_200_OK)
-        except Notification.DoesNotExist:
+        updated = Notification.objects.filter(pk=pk, recipient=request.user, is_read=False).update(is_read=True)
+        if updated:
+            adjust_unread_counts([request.user.pk], -1)
+        elif not Notification.objects.filter(pk=pk, recipient=request.user).exists():
             return Response({'error': 'Notification not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response({'status': 'marked as read'}, status=status.HTTP_200_OK)
+
+class BulkMarkNotificationsReadView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(request_body=BulkMarkReadSerializer)
+    def post(self, request):
+        serializer = BulkMarkReadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # One scoped UPDATE, only rows that are still unread count towards the counter
+        notifications = Notification.objects.filter(recipient=request.user, is_read=False)
+        if 'ids' in serializer.validated_data:
+            notifications = notifications.filter(id__in=serializer.validated_data['ids'])
+        else:
+            notifications = notifications.filter(id__lte=serializer.validated_data['up_to'])
+        updated = notifications.update(is_read=True)
+
+        if updated:
+            adjust_unread_counts([request.user.pk], -updated)
+        return Response({
+            'updated': updated,
+            'unread_count': get_unread_count(request.user)
+        }, status=status.HTTP_200_OK)
 
 class MarkAllNotificationsReadView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def post(self, request):
         Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True)
+        reset_unread_count(request.user)
         return Response({'status': 'all marked as read'}, status=status.HTTP_200_OK)
@@ -1,13 +1,13 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
+from django.db import transaction
 from django.db.models import Q
-from ..models import Soutenance, Internship
 from ..models import Soutenance, Internship, Notification
+from ..notifications import notify, soutenance_group, subscribe
 from ..soutenance_serializers import SoutenanceSerializer
 from authentication.models import User
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
+from PfeManagement.pagination import FieldFilterBackend, ListPagination, StableOrderingFilter
 
 class IsAdminUser(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -15,6 +15,11 @@ class IsAdminUser(permissions.BasePermission):
 
 class SoutenanceListCreateView(generics.ListCreateAPIView):
     serializer_class = SoutenanceSerializer
+    pagination_class = ListPagination
+    filter_backends = [FieldFilterBackend, StableOrderingFilter]
+    filter_params = {'status': 'status', 'date': 'date'}
+    ordering_fields = ['date']
+    ordering = ('date', 'time', 'id')
     
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -22,35 +27,24 @@ class SoutenanceListCreateView(generics.ListCreateAPIView):
         return [permissions.IsAuthenticated()]
 
     def perform_create(self, serializer):
-        soutenance = serializer.save()
-        
-        channel_layer = get_channel_layer()
-        
-        # Notify Student
-        student = soutenance.internship.student_id
-        msg_student = f"Your soutenance has been scheduled for {soutenance.date} at {soutenance.time} in room {soutenance.room}."
-        Notification.objects.create(recipient=student, message=msg_student)
-        
-        async_to_sync(channel_layer.group_send)(
-            f"user_{student.id}",
-            {
-                "type": "send_notification",
-                "message": msg_student
-            }
-        )
-        
-        # Notify Jury Members
-        for jury in soutenance.juries.all():
-            msg_jury = f"You have been assigned as a jury member for {student.first_name} {student.last_name}'s soutenance on {soutenance.date} at {soutenance.time}."
-            Notification.objects.create(recipient=jury.member, message=msg_jury)
+        with transaction.atomic():
+            soutenance = serializer.save()
             
-            async_to_sync(channel_layer.group_send)(
-                f"user_{jury.member.id}",
-                {
-                    "type": "send_notification",
-                    "message": msg_jury
-                }
+            # Notify Student
+            student = soutenance.internship.student_id
+            notify(
+                [student],
+                f"Your soutenance has been scheduled for {soutenance.date} at {soutenance.time} in room {soutenance.room}.",
+                Notification.KIND_SOUTENANCE
             )
+            
+            # Notify Jury Members
+            notify(
+                [jury.member for jury in soutenance.juries.select_related('member')],
+                f"You have been assigned as a jury member for {student.first_name} {student.last_name}'s soutenance on {soutenance.date} at {soutenance.time}.",
+                Notification.KIND_SOUTENANCE
+            )
+            subscribe([jury.member_id for jury in soutenance.juries.all()], soutenance_group(soutenance.id))
 
     def get_queryset(self):
         user = self.request.user
@@ -79,37 +73,45 @@ class SoutenanceDetailView(generics.RetrieveUpdateDestroyAPIView):
         return [permissions.IsAuthenticated()]
 
     def perform_update(self, serializer):
-        soutenance = serializer.save()
-        channel_layer = get_channel_layer()
-        
-        # Notify Student
-        student = soutenance.internship.student_id
-        msg = f"Your soutenance schedule has been updated to {soutenance.date} at {soutenance.time} in room {soutenance.room}."
-        Notification.objects.create(recipient=student, message=msg)
-        async_to_sync(channel_layer.group_send)(f"user_{student.id}", {"type": "send_notification", "message": msg})
-        
-        # Notify Jury
-        for jury in soutenance.juries.all():
-            msg_jury = f"The soutenance for {student.first_name} has been rescheduled to {soutenance.date} at {soutenance.time}."
-            Notification.objects.create(recipient=jury.member, message=msg_jury)
-            async_to_sync(channel_layer.group_send)(f"user_{jury.member.id}", {"type": "send_notification", "message": msg_jury})
+        with transaction.atomic():
+            soutenance = serializer.save()
+            
+            # Notify Student
+            student = soutenance.internship.student_id
+            notify(
+                [student],
+                f"Your soutenance schedule has been updated to {soutenance.date} at {soutenance.time} in room {soutenance.room}.",
+                Notification.KIND_SOUTENANCE
+            )
+            
+            # Notify Jury
+            notify(
+                [jury.member for jury in soutenance.juries.select_related('member')],
+                f"The soutenance for {student.first_name} has been rescheduled to {soutenance.date} at {soutenance.time}.",
+                Notification.KIND_SOUTENANCE
+            )
+            # Jury members may have been added
+            subscribe([jury.member_id for jury in soutenance.juries.all()], soutenance_group(soutenance.id))
 
     def perform_destroy(self, instance):
-        channel_layer = get_channel_layer()
         student = instance.internship.student_id
         
-        # Notify Student
-        msg = f"Your soutenance scheduled for {instance.date} has been CANCELLED."
-        Notification.objects.create(recipient=student, message=msg)
-        async_to_sync(channel_layer.group_send)(f"user_{student.id}", {"type": "send_notification", "message": msg})
-        
-        # Notify Jury
-        for jury in instance.juries.all():
-            msg_jury = f"The soutenance for {student.first_name} scheduled for {instance.date} has been CANCELLED."
-            Notification.objects.create(recipient=jury.member, message=msg_jury)
-            async_to_sync(channel_layer.group_send)(f"user_{jury.member.id}", {"type": "send_notification", "message": msg_jury})
+        with transaction.atomic():
+            # Notify Student
+            notify(
+                [student],
+                f"Your soutenance scheduled for {instance.date} has been CANCELLED.",
+                Notification.KIND_SOUTENANCE
+            )
             
-        instance.delete()
+            # Notify Jury
+            notify(
+                [jury.member for jury in instance.juries.select_related('member')],
+                f"The soutenance for {student.first_name} scheduled for {instance.date} has been CANCELLED.",
+                Notification.KIND_SOUTENANCE
+            )
+                
+            instance.delete()
 
 
 class GetSoutenanceCandidatesView(generics.ListAPIView):
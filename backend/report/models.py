@@ -3,6 +3,23 @@ from django.conf import settings
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from internship.file_metadata import capture_file_metadata
+
+class ReportQuerySet(models.QuerySet):
+    def with_versions(self):
+        """
+        Annotate the version count and prefetch the versions (newest first,
+        with their comment counts), so list serializers resolve the current
+        and approved versions without extra queries
+        """
+        return self.select_related('student', 'internship').annotate(
+            num_versions=models.Count('versions')
+        ).prefetch_related(models.Prefetch(
+            'versions',
+            queryset=ReportVersion.objects.with_comment_counts().select_related('reviewed_by').order_by('-version_number')
+        ))
+
+
 class Report(models.Model):
     """Main report model - represents the report container"""
     internship = models.OneToOneField(
@@ -28,6 +45,8 @@ class Report(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(20)]
     )
 
+    objects = ReportQuerySet.as_manager()
+
     class Meta:
         db_table = 'report_report'
         ordering = ['-created_at']
@@ -43,6 +62,14 @@ class Report(models.Model):
         """Get the latest approved version"""
         return self.versions.filter(status='approved').order_by('-version_number').first()
 
+class ReportVersionQuerySet(models.QuerySet):
+    def with_comment_counts(self):
+        return self.annotate(
+            num_comments=models.Count('comments'),
+            num_unresolved_comments=models.Count('comments', filter=models.Q(comments__is_resolved=False)),
+        )
+
+
 class ReportVersion(models.Model):
     """Report version model - tracks each submission iteration"""
     STATUS_CHOICES = [
@@ -59,6 +86,11 @@ class ReportVersion(models.Model):
     )
     version_number = models.PositiveIntegerField()
     file = models.FileField(upload_to='reports/versions/%Y/%m/%d/')
+    # Captured at upload so responses don't have to stat the file, see internship.file_metadata
+    file_size = models.PositiveBigIntegerField(null=True, blank=True)
+    file_sha256 = models.CharField(max_length=64, null=True, blank=True)
+    file_mime_type = models.CharField(max_length=100, null=True, blank=True)
+    file_page_count = models.PositiveIntegerField(null=True, blank=True)
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -77,14 +109,24 @@ class ReportVersion(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ReportVersionQuerySet.as_manager()
+
     class Meta:
         db_table = 'student_report_version'
         ordering = ['-version_number']
         unique_together = ['report', 'version_number']
+        indexes = [
+            # Teachers' review queue, pending versions are a small share of the table
+            models.Index(fields=['report'], condition=models.Q(status='pending'), name='report_version_pending_idx'),
+        ]
 
     def __str__(self):
         return f"{self.report.title} - v{self.version_number} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = capture_file_metadata(self, 'file', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
+
     def submit_for_review(self):
         """Submit version for teacher review"""
         if self.status == 'draft':
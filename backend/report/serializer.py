@@ -48,27 +48,35 @@ class ReportVersionSerializer(serializers.ModelSerializer):
         model = ReportVersion
         fields = [
             'id', 'report', 'version_number', 'file', 'file_size',
+            'file_sha256', 'file_mime_type', 'file_page_count',
             'status', 'submitted_at', 'reviewed_at', 'reviewed_by',
             'reviewed_by_name', 'is_final', 'comments', 'comments_count',
             'unresolved_comments_count', 'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'version_number', 'submitted_at', 'reviewed_at',
-            'reviewed_by', 'created_at', 'updated_at'
+            'version_number', 'file_sha256', 'file_mime_type', 'file_page_count',
+            'submitted_at', 'reviewed_at', 'reviewed_by', 'created_at', 'updated_at'
         ]
         ref_name = 'StudentReportVersion'
 
     def get_comments_count(self, obj):
+        # Annotated by ReportVersion.objects.with_comment_counts()
+        if hasattr(obj, 'num_comments'):
+            return obj.num_comments
         return obj.comments.count()
 
     def get_unresolved_comments_count(self, obj):
+        if hasattr(obj, 'num_unresolved_comments'):
+            return obj.num_unresolved_comments
         return obj.comments.filter(is_resolved=False).count()
 
     def get_file_size(self, obj):
         """Get file size in MB"""
-        if obj.file:
-            return round(obj.file.size / (1024 * 1024), 2)
-        return 0
+        if not obj.file:
+            return 0
+        # Versions uploaded before file_size was stored fall back to the storage
+        size = obj.file_size if obj.file_size is not None else obj.file.size
+        return round(size / (1024 * 1024), 2)
 
     def validate_file(self, value):
         """Validate uploaded file"""
@@ -106,6 +114,21 @@ class ReportVersionSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class ReportVersionListSerializer(ReportVersionSerializer):
+    """Compact version for lists: comment counts only, no nested comments"""
+    comments = None
+
+    class Meta(ReportVersionSerializer.Meta):
+        fields = [
+            'id', 'report', 'version_number', 'file', 'file_size',
+            'file_sha256', 'file_mime_type', 'file_page_count',
+            'status', 'submitted_at', 'reviewed_at', 'reviewed_by',
+            'reviewed_by_name', 'is_final', 'comments_count',
+            'unresolved_comments_count', 'created_at', 'updated_at'
+        ]
+        ref_name = 'StudentReportVersionList'
+
+
 class ReportSerializer(serializers.ModelSerializer):
     """Serializer for main report"""
     versions = ReportVersionSerializer(many=True, read_only=True)
@@ -126,19 +149,37 @@ class ReportSerializer(serializers.ModelSerializer):
         read_only_fields = ['student', 'created_at', 'updated_at']
         ref_name = 'StudentReport'
 
+    version_serializer_class = ReportVersionSerializer
+
+    def _prefetched_versions(self, obj):
+        """Versions newest first when prefetched (see Report.objects.with_versions()), else None"""
+        if 'versions' in getattr(obj, '_prefetched_objects_cache', {}):
+            return sorted(obj.versions.all(), key=lambda version: version.version_number, reverse=True)
+        return None
+
     def get_current_version(self, obj):
-        version = obj.get_current_version()
+        versions = self._prefetched_versions(obj)
+        if versions is None:
+            version = obj.get_current_version()
+        else:
+            version = versions[0] if versions else None
         if version:
-            return ReportVersionSerializer(version).data
+            return self.version_serializer_class(version).data
         return None
 
     def get_approved_version(self, obj):
-        version = obj.get_approved_version()
+        versions = self._prefetched_versions(obj)
+        if versions is None:
+            version = obj.get_approved_version()
+        else:
+            version = next((v for v in versions if v.status == 'approved'), None)
         if version:
-            return ReportVersionSerializer(version).data
+            return self.version_serializer_class(version).data
         return None
 
     def get_total_versions(self, obj):
+        if hasattr(obj, 'num_versions'):
+            return obj.num_versions
         return obj.versions.count()
 
     def validate_title(self, value):
@@ -177,6 +218,25 @@ class ReportSerializer(serializers.ModelSerializer):
         return value
 
 
+class ReportListSerializer(ReportSerializer):
+    """
+    Compact report for lists: version count and the current/approved versions
+    without comments, instead of every version with every comment.
+    Use with Report.objects.with_versions()
+    """
+    versions = None
+    version_serializer_class = ReportVersionListSerializer
+
+    class Meta(ReportSerializer.Meta):
+        fields = [
+            'id', 'internship', 'internship_title', 'student', 'student_name',
+            'title', 'description', 'is_final', 'final_grade',
+            'current_version', 'approved_version',
+            'total_versions', 'created_at', 'updated_at'
+        ]
+        ref_name = 'StudentReportList'
+
+
 class SubmitVersionSerializer(serializers.Serializer):
     """Serializer for submitting version for review"""
     version_id = serializers.IntegerField()
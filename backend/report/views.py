@@ -7,16 +7,19 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Count, Max, Q
 
 from .models import Report, ReportVersion, ReviewComment
 from report.serializer import (
     ReportSerializer,
+    ReportListSerializer,
     ReportVersionSerializer,
+    ReportVersionListSerializer,
     ReviewCommentSerializer,
     SubmitVersionSerializer,
     ReviewVersionSerializer
 )
+from PfeManagement.conditional import conditional_response, queryset_version
 
 
 class CreateReportView(APIView):
@@ -55,7 +58,7 @@ class ListMyReportsView(APIView):
 
     @swagger_auto_schema(
         responses={
-            200: ReportSerializer(many=True),
+            200: ReportListSerializer(many=True),
             403: 'Forbidden'
         }
     )
@@ -66,8 +69,8 @@ class ListMyReportsView(APIView):
                 'error': 'Only students can view their reports.'
             }, status=status.HTTP_403_FORBIDDEN)
 
-        reports = Report.objects.filter(student=request.user).prefetch_related('versions')
-        serializer = ReportSerializer(reports, many=True)
+        reports = Report.objects.filter(student=request.user).with_versions()
+        serializer = ReportListSerializer(reports, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -109,8 +112,19 @@ class GetReportDetailView(APIView):
                 'error': 'Invalid user role.'
             }, status=status.HTTP_403_FORBIDDEN)
 
-        serializer = ReportSerializer(report)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Covers everything the detail shows: the report, its student and internship, versions and comments
+        version = queryset_version(
+            Report.objects.filter(pk=report.pk),
+            student_updated_at=Max('student__updated_at'),
+            internship_updated_at=Max('internship__updated_at'),
+            num_versions=Count('versions', distinct=True),
+            versions_updated_at=Max('versions__updated_at'),
+            num_comments=Count('versions__comments', distinct=True),
+            comments_updated_at=Max('versions__comments__updated_at'),
+        )
+        return conditional_response(
+            request, version, lambda: Response(ReportSerializer(report).data, status=status.HTTP_200_OK)
+        )
 
 
 class DeleteReportView(APIView):
@@ -270,7 +284,7 @@ class ListPendingVersionsView(APIView):
 
     @swagger_auto_schema(
         responses={
-            200: ReportVersionSerializer(many=True),
+            200: ReportVersionListSerializer(many=True),
             403: 'Forbidden'
         }
     )
@@ -285,9 +299,9 @@ class ListPendingVersionsView(APIView):
         versions = ReportVersion.objects.filter(
             report__internship__teacher_id=request.user,
             status='pending'
-        ).select_related('report', 'report__student', 'report__internship').prefetch_related('comments')
+        ).select_related('reviewed_by').with_comment_counts()
         
-        serializer = ReportVersionSerializer(versions, many=True)
+        serializer = ReportVersionListSerializer(versions, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
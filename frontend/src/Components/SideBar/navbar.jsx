@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import * as FaIcons from "react-icons/fa";
 import * as AiIcons from "react-icons/ai";
 import { Link, useNavigate } from "react-router-dom";
@@ -11,13 +11,15 @@ import { IconContext } from "react-icons";
 import "./navbar.css";
 import { jwtDecode } from "jwt-decode";
 import { Dropdown, Badge } from "react-bootstrap";
-import { getNotifications, markNotificationRead, markAllNotificationsRead } from "../../api";
+import { getNotifications, getUnreadNotificationCount, markNotificationRead, markAllNotificationsRead } from "../../api";
 
 function Navbar() {
   const [sidebar, setSidebar] = useState(false);
   const [showUserDropdown, setShowUserDropdown] = useState(false);
   const [notifications, setNotifications] = useState([]);
   const [unreadCount, setUnreadCount] = useState(0);
+  // Newest notification id we know of, sent on reconnect to replay only what was missed
+  const lastSeenId = useRef(null);
 
   const navigate = useNavigate();
 
@@ -53,7 +55,10 @@ function Navbar() {
 
         // Use wss if https, ws if http
         const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        const wsUrl = `${protocol}//${window.location.hostname}:8000/ws/notifications/?token=${token}`;
+        let wsUrl = `${protocol}//${window.location.hostname}:8000/ws/notifications/?token=${token}`;
+        if (lastSeenId.current !== null) {
+            wsUrl += `&last_seen_id=${lastSeenId.current}`;
+        }
         
         socket = new WebSocket(wsUrl);
 
@@ -63,12 +68,14 @@ function Navbar() {
 
         socket.onmessage = (event) => {
             const data = JSON.parse(event.data);
-            if (data.message) {
-                // Fetch latest notifications to stay in sync
-                getNotifications().then(data => {
-                    setNotifications(data);
-                    setUnreadCount(data.filter(n => !n.is_read).length);
-                });
+            if (data.resync) {
+                // Too much was missed while disconnected: reload the feed
+                loadNotifications();
+            } else if (data.id) {
+                if (lastSeenId.current !== null && data.id <= lastSeenId.current) return;
+                lastSeenId.current = data.id;
+                setNotifications(prev => [{ ...data, is_read: false }, ...prev]);
+                setUnreadCount(prev => prev + 1);
             }
         };
 
@@ -83,11 +90,18 @@ function Navbar() {
         };
     };
 
+    const loadNotifications = () => {
+        getNotifications().then(data => {
+            setNotifications(data);
+            if (data.length > 0) {
+                lastSeenId.current = Math.max(lastSeenId.current ?? 0, ...data.map(n => n.id));
+            }
+        });
+        getUnreadNotificationCount().then(setUnreadCount);
+    };
+
     // Initial fetch
-    getNotifications().then(data => {
-        setNotifications(data);
-        setUnreadCount(data.filter(n => !n.is_read).length);
-    });
+    loadNotifications();
 
     connectWebSocket();
 
@@ -4,6 +4,13 @@ const API = axios.create({
   baseURL: "http://127.0.0.1:8000/",
 });
 const token = localStorage.getItem("accessToken");
+
+// One page of a paginated list endpoint: { results, next }; pass next back to load the following page
+const getPage = async (url, config) => {
+  const response = await API.get(url, config);
+  return { results: response.data.results, next: response.data.next };
+};
+
 export const login = async (credentials) => {
   const response = await API.post("auth/login/", credentials);
   return response.data;
@@ -154,13 +161,12 @@ export const respondToInvitation = async (invitationId, status) => {
   return response.data;
 };
 
-export const getPendingInternships = async () => {
-  const response = await API.get("/internship/admin/pending/", {
+export const getPendingInternships = async (next = null) => {
+  return getPage(next || "/internship/admin/pending/", {
     headers: {
       Authorization: `Bearer ${token}`,
     },
   });
-  return response.data;
 };
 
 export const approveInternship = async (internshipId) => {
@@ -488,11 +494,10 @@ export const activationAccount = async (token) => {
   return response.data;
 };
 
-export const getSoutenances = async () => {
-  const response = await API.get("/internship/soutenances/", {
+export const getSoutenances = async (next = null) => {
+  return getPage(next || "/internship/soutenances/", {
     headers: { Authorization: `Bearer ${token}` },
   });
-  return response.data;
 };
 
 export const getSoutenanceCandidates = async () => {
@@ -503,11 +508,19 @@ export const getSoutenanceCandidates = async () => {
 };
 
 // Notification APIs
+// Latest notifications (cursor-paginated feed, first page only)
 export const getNotifications = async () => {
   const response = await API.get("/internship/notifications/", {
     headers: { Authorization: `Bearer ${token}` },
   });
-  return response.data;
+  return response.data.results;
+};
+
+export const getUnreadNotificationCount = async () => {
+  const response = await API.get("/internship/notifications/unread-count/", {
+    headers: { Authorization: `Bearer ${token}` },
+  });
+  return response.data.unread_count;
 };
 
 export const markNotificationRead = async (id) => {
@@ -554,11 +567,11 @@ export const getAvailableRooms = async () => {
   return response.data;
 };
 
-export const getRooms = async () => {
-  const response = await API.get("/administrator/rooms/", {
+export const getRooms = async (next = null) => {
+  const token = localStorage.getItem("accessToken");
+  return getPage(next || "/administrator/rooms/", {
     headers: { Authorization: `Bearer ${token}` },
   });
-  return response.data;
 };
 
 export const createRoom = async (data) => {
@@ -641,16 +654,15 @@ export const deleteInternshipOffer = async (offerId) => {
   return response.data;
 };
 
-// Company: Get applications for an offer
-export const getOfferApplications = async (offerId) => {
+// Company: One page of applications (of an offer or all offers); pass the previous page's next to load more
+export const getOfferApplications = async (offerId, next = null) => {
   const token = localStorage.getItem("accessToken");
   const url = offerId 
     ? `/internship/offers/${offerId}/applications/` 
     : "/internship/offers/all-applications/";
-  const response = await API.get(url, {
+  return getPage(next || url, {
     headers: { Authorization: `Bearer ${token}` },
   });
-  return response.data;
 };
 
 // Company: Review application (approve/reject)
@@ -773,15 +785,14 @@ export const batchCalculateMatches = async (offerId) => {
 
 // ==================== STUDENT BROWSE & APPLY ====================
 
-// Student: Browse available offers
-export const browseInternshipOffers = async (filters = {}) => {
+// Student: Browse available offers, one page at a time; pass the previous page's next to load more
+export const browseInternshipOffers = async (filters = {}, next = null) => {
   const token = localStorage.getItem("accessToken");
   const params = new URLSearchParams(filters).toString();
   const url = params ? `/internship/browse/?${params}` : "/internship/browse/";
-  const response = await API.get(url, {
+  return getPage(next || url, {
     headers: { Authorization: `Bearer ${token}` },
   });
-  return response.data;
 };
 
 // Student: Apply to an offer
@@ -802,24 +813,22 @@ export const applyToOffer = async (applicationData) => {
   return response.data;
 };
 
-// Student: Get my applications
-export const getMyApplications = async () => {
+// Student: One page of my applications; pass the previous page's next to load more
+export const getMyApplications = async (next = null) => {
   const token = localStorage.getItem("accessToken");
-  const response = await API.get("/internship/my-applications/", {
+  return getPage(next || "/internship/my-applications/", {
     headers: { Authorization: `Bearer ${token}` },
   });
-  return response.data;
 };
 
 // ==================== ADMIN OFFER MANAGEMENT ====================
 
-// Admin: Get pending offers
-export const getAdminPendingOffers = async (status = 0) => {
+// Admin: One page of offers with a status; pass the previous page's next to load more
+export const getAdminPendingOffers = async (status = 0, next = null) => {
   const token = localStorage.getItem("accessToken");
-  const response = await API.get(`/internship/admin/offers/?status=${status}`, {
+  return getPage(next || `/internship/admin/offers/?status=${status}`, {
     headers: { Authorization: `Bearer ${token}` },
   });
-  return response.data;
 };
 
 // Admin: Review offer (approve/reject)
@@ -1,14 +1,27 @@
 import React, { useState, useEffect } from 'react';
-import { Card, Table } from 'react-bootstrap';
+import { Button, Card, Table } from 'react-bootstrap';
 import { getSoutenances } from '../api';
 
 const MySoutenance = () => {
     const [soutenances, setSoutenances] = useState([]);
+    const [nextPage, setNextPage] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     useEffect(() => {
-        getSoutenances().then(setSoutenances).catch(console.error);
+        getSoutenances().then(data => {
+            setSoutenances(data.results);
+            setNextPage(data.next);
+        }).catch(console.error);
     }, []);
 
+    const handleLoadMore = () => {
+        setLoadingMore(true);
+        getSoutenances(nextPage).then(data => {
+            setSoutenances(prev => [...prev, ...data.results]);
+            setNextPage(data.next);
+        }).catch(console.error).finally(() => setLoadingMore(false));
+    };
+
     if (soutenances.length === 0) {
         return <div className="container mt-4"><h3>No Scheduled Soutenances</h3></div>;
     }
@@ -41,6 +54,13 @@ const MySoutenance = () => {
                     </div>
                 ))}
             </div>
+            {nextPage && (
+                <div className="text-center mb-4">
+                    <Button variant="outline-secondary" onClick={handleLoadMore} disabled={loadingMore}>
+                        {loadingMore ? 'Loading...' : 'Load more'}
+                    </Button>
+                </div>
+            )}
         </div>
     );
 };
@@ -4,6 +4,8 @@ import './PendingInternships.css';
 
 const PendingInternships = () => {
     const [internships, setInternships] = useState([]);
+    const [nextPage, setNextPage] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState('');
     const [successMessage, setSuccessMessage] = useState('');
@@ -23,7 +25,8 @@ const PendingInternships = () => {
         setError('');
         try {
             const data = await getPendingInternships();
-            setInternships(data);
+            setInternships(data.results);
+            setNextPage(data.next);
         } catch (err) {
             setError(err.response?.data?.error || 'Failed to load pending internships');
             console.error(err);
@@ -32,6 +35,20 @@ const PendingInternships = () => {
         }
     };
 
+    const handleLoadMore = async () => {
+        setLoadingMore(true);
+        try {
+            const data = await getPendingInternships(nextPage);
+            setInternships(prev => [...prev, ...data.results]);
+            setNextPage(data.next);
+        } catch (err) {
+            setError(err.response?.data?.error || 'Failed to load pending internships');
+            console.error(err);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const openConfirmModal = (internship, action) => {
         setSelectedInternship(internship);
         setActionType(action);
@@ -121,7 +138,7 @@ const PendingInternships = () => {
                     <p>Review and manage internship requests</p>
                 </div>
                 <div className="stats-badge">
-                    <span className="count">{internships.length}</span>
+                    <span className="count">{internships.length}{nextPage ? '+' : ''}</span>
                     <span className="label">Pending</span>
                 </div>
             </div>
@@ -236,6 +253,14 @@ const PendingInternships = () => {
                 </div>
             )}
 
+            {nextPage && (
+                <div className="load-more">
+                    <button className="btn btn-load-more" onClick={handleLoadMore} disabled={loadingMore}>
+                        {loadingMore ? 'Loading...' : 'Load more internships'}
+                    </button>
+                </div>
+            )}
+
             {/* Confirmation Modal */}
             {showConfirmModal && selectedInternship && (
                 <div className="modal-overlay" onClick={closeConfirmModal}>
@@ -5,6 +5,8 @@ import './PendingOffers.css';
 
 const PendingOffers = () => {
   const [offers, setOffers] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [statusFilter, setStatusFilter] = useState(0);
   const [expandedId, setExpandedId] = useState(null);
@@ -20,7 +22,8 @@ const PendingOffers = () => {
     setLoading(true);
     try {
       const data = await getAdminPendingOffers(statusFilter);
-      setOffers(data);
+      setOffers(data.results);
+      setNextPage(data.next);
     } catch (error) {
       console.error('Error fetching offers:', error);
     } finally {
@@ -28,6 +31,20 @@ const PendingOffers = () => {
     }
   };
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      // The next link keeps the status filter
+      const data = await getAdminPendingOffers(statusFilter, nextPage);
+      setOffers(prev => [...prev, ...data.results]);
+      setNextPage(data.next);
+    } catch (error) {
+      console.error('Error loading more offers:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleReview = async (offerId, status) => {
     try {
       await adminReviewOffer(offerId, status, feedback);
@@ -62,7 +79,7 @@ const PendingOffers = () => {
       <div className="page-header">
         <h1>📋 Company Internship Offers</h1>
         <div className="stats-badge">
-          <span className="count">{pendingCount}</span>
+          <span className="count">{pendingCount}{statusFilter === 0 && nextPage ? '+' : ''}</span>
           <span className="label">Pending Review</span>
         </div>
       </div>
@@ -235,6 +252,13 @@ const PendingOffers = () => {
           </table>
         </div>
       )}
+      {nextPage && (
+        <div className="load-more">
+          <button className="btn-load-more" onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more offers'}
+          </button>
+        </div>
+      )}
       <CustomModal
         isOpen={modal.isOpen}
         title={modal.title}
@@ -1,10 +1,13 @@
 import React, { useState, useEffect } from 'react';
+import { getRooms } from '../../api';
 import './RoomManagement.css';
 
 const API_BASE_URL = process.env.REACT_APP_API_BASE_URL || 'http://127.0.0.1:8000';
 
 const RoomManagement = () => {
   const [rooms, setRooms] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
   const [successMessage, setSuccessMessage] = useState('');
@@ -30,19 +33,9 @@ const RoomManagement = () => {
   const fetchRooms = async () => {
     setLoading(true);
     try {
-      const token = localStorage.getItem('accessToken');
-      const response = await fetch(`${API_BASE_URL}/administrator/rooms/`, {
-        headers: {
-          'Authorization': `Bearer ${token}`
-        }
-      });
-      
-      if (response.ok) {
-        const data = await response.json();
-        setRooms(data);
-      } else {
-        setError('Failed to load rooms');
-      }
+      const data = await getRooms();
+      setRooms(data.results);
+      setNextPage(data.next);
     } catch (err) {
       setError('Error loading rooms');
       console.error(err);
@@ -51,6 +44,20 @@ const RoomManagement = () => {
     }
   };
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const data = await getRooms(nextPage);
+      setRooms(prev => [...prev, ...data.results]);
+      setNextPage(data.next);
+    } catch (err) {
+      setError('Error loading rooms');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleInputChange = (e) => {
     const { name, value, type, checked } = e.target;
     setFormData(prev => ({
@@ -244,6 +251,14 @@ const RoomManagement = () => {
         )}
       </div>
 
+      {nextPage && (
+        <div className="load-more">
+          <button className="btn btn-load-more" onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more rooms'}
+          </button>
+        </div>
+      )}
+
       {/* Create/Edit Modal */}
       {showModal && (
         <div className="modal-overlay" onClick={() => setShowModal(false)}>
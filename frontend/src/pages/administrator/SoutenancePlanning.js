@@ -6,6 +6,8 @@ import { FaCalendarAlt, FaClock, FaDoorOpen, FaChalkboardTeacher, FaUserGraduate
 
 const SoutenancePlanning = () => {
     const [soutenances, setSoutenances] = useState([]);
+    const [nextPage, setNextPage] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [candidates, setCandidates] = useState([]);
     const [teachers, setTeachers] = useState([]);
     const [rooms, setRooms] = useState([]);
@@ -44,7 +46,8 @@ const SoutenancePlanning = () => {
                 getSoutenanceCandidates(),
                 getAvailableRooms()
             ]);
-            setSoutenances(sData);
+            setSoutenances(sData.results);
+            setNextPage(sData.next);
             setTeachers(tData);
             setCandidates(cData);
             setRooms(rData);
@@ -53,6 +56,19 @@ const SoutenancePlanning = () => {
         }
     };
 
+    const handleLoadMore = async () => {
+        setLoadingMore(true);
+        try {
+            const data = await getSoutenances(nextPage);
+            setSoutenances(prev => [...prev, ...data.results]);
+            setNextPage(data.next);
+        } catch (err) {
+            console.error(err);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleEdit = (soutenance) => {
         setEditMode(true);
         setSelectedId(soutenance.id);
@@ -168,21 +184,21 @@ const SoutenancePlanning = () => {
                 <div className="stat-card stat-total">
                     <div className="stat-icon"><FaCalendarAlt /></div>
                     <div className="stat-content">
-                        <h3>{stats.total}</h3>
+                        <h3>{stats.total}{nextPage ? '+' : ''}</h3>
                         <p>Total Defenses</p>
                     </div>
                 </div>
                 <div className="stat-card stat-planned">
                     <div className="stat-icon"><FaHourglassHalf /></div>
                     <div className="stat-content">
-                        <h3>{stats.planned}</h3>
+                        <h3>{stats.planned}{nextPage ? '+' : ''}</h3>
                         <p>Planned</p>
                     </div>
                 </div>
                 <div className="stat-card stat-done">
                     <div className="stat-icon"><FaCheckCircle /></div>
                     <div className="stat-content">
-                        <h3>{stats.done}</h3>
+                        <h3>{stats.done}{nextPage ? '+' : ''}</h3>
                         <p>Completed</p>
                     </div>
                 </div>
@@ -268,6 +284,14 @@ const SoutenancePlanning = () => {
                 </table>
             </div>
 
+            {nextPage && (
+                <div className="load-more">
+                    <Button variant="outline-secondary" onClick={handleLoadMore} disabled={loadingMore}>
+                        {loadingMore ? 'Loading...' : 'Load more soutenances'}
+                    </Button>
+                </div>
+            )}
+
             {/* Modal */}
             <Modal show={showModal} onHide={() => setShowModal(false)} size="lg" centered>
                 <Modal.Header closeButton>
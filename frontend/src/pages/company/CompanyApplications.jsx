@@ -15,6 +15,8 @@ import './CompanyApplications.css';
 
 const CompanyApplications = () => {
   const [applications, setApplications] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [offers, setOffers] = useState([]);
   const [loading, setLoading] = useState(true);
   const [selectedOffer, setSelectedOffer] = useState(null);
@@ -41,16 +43,18 @@ const CompanyApplications = () => {
 
   useEffect(() => {
     fetchData();
-  }, []);
+  }, [selectedOffer]);
 
+  // First page of the applications (of the selected position), more are loaded on demand
   const fetchData = async () => {
     try {
-      const [offersData, appsData] = await Promise.all([
+      const [offersData, appsPage] = await Promise.all([
         getCompanyOffers(),
-        getOfferApplications()
+        getOfferApplications(selectedOffer)
       ]);
       setOffers(offersData);
-      setApplications(appsData);
+      setApplications(appsPage.results);
+      setNextPage(appsPage.next);
     } catch (error) {
       console.error('Error fetching data:', error);
     } finally {
@@ -58,6 +62,19 @@ const CompanyApplications = () => {
     }
   };
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const appsPage = await getOfferApplications(selectedOffer, nextPage);
+      setApplications(prev => [...prev, ...appsPage.results]);
+      setNextPage(appsPage.next);
+    } catch (error) {
+      console.error('Error loading more applications:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const fetchSlots = async (offerId) => {
     try {
       const slotsData = await getInterviewSlots(offerId);
@@ -215,12 +232,8 @@ const CompanyApplications = () => {
     return <span className={`status-badge ${statusInfo.class}`}>{statusInfo.label}</span>;
   };
 
-  const filteredApplications = selectedOffer
-    ? applications.filter(app => app.offer === selectedOffer)
-    : applications;
-
   // Group applications by offer
-  const groupedByOffer = filteredApplications.reduce((acc, app) => {
+  const groupedByOffer = applications.reduce((acc, app) => {
     const offerId = app.offer;
     if (!acc[offerId]) {
       acc[offerId] = { offer: app.offer_info, applications: [] };
@@ -243,7 +256,7 @@ const CompanyApplications = () => {
         <div className="stats-badges">
           <span className="stat-badge pending">{pendingCount} Pending</span>
           <span className="stat-badge interview">{interviewCount} In Interview</span>
-          <span className="stat-badge total">{applications.length} Total</span>
+          <span className="stat-badge total">{applications.length}{nextPage ? '+' : ''} Total</span>
         </div>
       </div>
 
@@ -486,6 +499,14 @@ const CompanyApplications = () => {
         ))
       )}
 
+      {nextPage && (
+        <div className="load-more">
+          <button className="btn-load-more" onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more applications'}
+          </button>
+        </div>
+      )}
+
       <CustomModal
         isOpen={modal.isOpen}
         onClose={() => setModal({ ...modal, isOpen: false })}
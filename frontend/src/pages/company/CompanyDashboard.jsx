@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { getcurrentuser, getCompanyOffers, getOfferApplications } from '../../api';
+import { getcurrentuser, getCompanyOffers } from '../../api';
 import './CompanyDashboard.css';
 
 const CompanyDashboard = () => {
@@ -17,18 +17,19 @@ const CompanyDashboard = () => {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [userData, offers, applications] = await Promise.all([
+        // Offers carry their application counts, no need to load every application
+        const [userData, offers] = await Promise.all([
           getcurrentuser(),
-          getCompanyOffers(),
-          getOfferApplications()
+          getCompanyOffers()
         ]);
+        const sum = (field) => offers.reduce((total, offer) => total + offer[field], 0);
         setUser(userData);
         setStats({
           totalOffers: offers.length,
           pendingOffers: offers.filter(o => o.status === 0).length,
           approvedOffers: offers.filter(o => o.status === 1).length,
-          totalApplications: applications.length,
-          pendingApplications: applications.filter(a => a.status === 0).length
+          totalApplications: sum('applications_count'),
+          pendingApplications: sum('pending_applications_count')
         });
       } catch (error) {
         console.error('Error fetching data:', error);
@@ -1,11 +1,12 @@
 import React, { useState, useEffect } from 'react';
-import { browseInternshipOffers, applyToOffer, getMyApplications } from '../../api';
+import { browseInternshipOffers, applyToOffer } from '../../api';
 import CustomModal from '../../Components/common/CustomModal';
 import './BrowseInternships.css';
 
 const BrowseInternships = () => {
   const [offers, setOffers] = useState([]);
-  const [myApplications, setMyApplications] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
   const [typeFilter, setTypeFilter] = useState('');
@@ -22,12 +23,10 @@ const BrowseInternships = () => {
 
   const fetchData = async () => {
     try {
-      const [offersData, appsData] = await Promise.all([
-        browseInternshipOffers(),
-        getMyApplications()
-      ]);
-      setOffers(offersData);
-      setMyApplications(appsData);
+      // Each offer says whether the student applied and the status of the application
+      const offersPage = await browseInternshipOffers();
+      setOffers(offersPage.results);
+      setNextPage(offersPage.next);
     } catch (error) {
       console.error('Error fetching data:', error);
     } finally {
@@ -42,7 +41,8 @@ const BrowseInternships = () => {
       if (searchTerm) filters.search = searchTerm;
       if (typeFilter) filters.type = typeFilter;
       const data = await browseInternshipOffers(filters);
-      setOffers(data);
+      setOffers(data.results);
+      setNextPage(data.next);
     } catch (error) {
       console.error('Error searching:', error);
     } finally {
@@ -50,6 +50,20 @@ const BrowseInternships = () => {
     }
   };
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      // The next link keeps the current filters
+      const data = await browseInternshipOffers({}, nextPage);
+      setOffers(prev => [...prev, ...data.results]);
+      setNextPage(data.next);
+    } catch (error) {
+      console.error('Error loading more offers:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleApply = async (offerId) => {
     // Validate CV is selected
     if (!applicationData.cv_file) {
@@ -76,15 +90,6 @@ const BrowseInternships = () => {
     }
   };
 
-  const hasApplied = (offerId) => {
-    return myApplications.some(app => app.offer === offerId);
-  };
-
-  const getApplicationStatus = (offerId) => {
-    const app = myApplications.find(app => app.offer === offerId);
-    return app ? app.status : null;
-  };
-
   const getStatusLabel = (status) => {
     const labels = {
       0: 'Pending',
@@ -172,9 +177,9 @@ const BrowseInternships = () => {
               </div>
 
               <div className="offer-footer">
-                {hasApplied(offer.id) ? (
-                  <div className={`application-status status-${getApplicationStatus(offer.id)}`}>
-                    {getStatusLabel(getApplicationStatus(offer.id))}
+                {offer.has_applied ? (
+                  <div className={`application-status status-${offer.application_status}`}>
+                    {getStatusLabel(offer.application_status)}
                   </div>
                 ) : offer.external_url ? (
                   <a 
@@ -271,6 +276,13 @@ const BrowseInternships = () => {
           ))
         )}
       </div>
+      {nextPage && (
+        <div className="load-more">
+          <button className="btn-secondary" onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        </div>
+      )}
       <CustomModal
         isOpen={modal.isOpen}
         title={modal.title}
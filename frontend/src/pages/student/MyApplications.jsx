@@ -5,6 +5,8 @@ import './MyApplications.css';
 
 const MyApplications = () => {
   const [applications, setApplications] = useState([]);
+  const [nextPage, setNextPage] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [loading, setLoading] = useState(true);
   const [selectingSlot, setSelectingSlot] = useState(null);
   const [modal, setModal] = useState({ isOpen: false, title: '', message: '', type: 'info', onConfirm: null });
@@ -16,7 +18,8 @@ const MyApplications = () => {
   const fetchApplications = async () => {
     try {
       const data = await getMyApplications();
-      setApplications(data);
+      setApplications(data.results);
+      setNextPage(data.next);
     } catch (error) {
       console.error('Error fetching applications:', error);
     } finally {
@@ -24,6 +27,19 @@ const MyApplications = () => {
     }
   };
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const data = await getMyApplications(nextPage);
+      setApplications(prev => [...prev, ...data.results]);
+      setNextPage(data.next);
+    } catch (error) {
+      console.error('Error loading more applications:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSelectSlot = async (applicationId, slotId) => {
     try {
       await selectInterviewSlot(applicationId, slotId);
@@ -216,6 +232,13 @@ const MyApplications = () => {
           ))}
         </div>
       )}
+      {nextPage && (
+        <div className="load-more">
+          <button className="btn-load-more" onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more applications'}
+          </button>
+        </div>
+      )}
       <CustomModal
         isOpen={modal.isOpen}
         title={modal.title}